@@ -0,0 +1,86 @@
+"""
+Kitap Listesi - Komut Satırı
+Ekran (Tk) gerektirmeden toplu bilgi doldurma (sunucu / zamanlanmış görev)
+
+Kullanım:
+    python kitap_listesi_cli.py enrich girdi.xlsx -o cikti.xlsx --workers 8
+
+İlerleme stdout'a satır başına bir JSON olay olarak yazılır; modüllerin logları stderr'e gider.
+Yarıda kesilen iş (Ctrl+C) aynı komutla yeniden çalıştırılınca kaldığı yerden devam eder
+(--fresh ile yarım iş ve checkpoint günlüğü atılıp baştan başlanır).
+Çıkış kodları: 0 tamam, 1 hata, 130 kesildi
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'modules'))
+
+from api_key_manager import APIKeyManager
+from batch_runner import VARSAYILAN_IS_SAYISI, toplu_zenginlestir
+from change_journal import CHECKPOINT_INTERVAL
+from kitap_bilgisi_cekici import KitapBilgisiCekici
+
+
+def varsayilan_cikti(girdi: str) -> str:
+    """Çıktı verilmezse: xlsx girdinin üzerine yazılır, diğer biçimler yanına .xlsx olarak"""
+    base, uzanti = os.path.splitext(girdi)
+    return girdi if uzanti.lower() == ".xlsx" else f"{base}.xlsx"
+
+
+def api_key_bul(args) -> str:
+    """--api-key > GROQ_API_KEY ortam değişkeni > GUI'nin kaydettiği anahtar"""
+    if args.api_key:
+        return args.api_key
+    if os.getenv("GROQ_API_KEY"):
+        return os.getenv("GROQ_API_KEY")
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return APIKeyManager(os.path.join(base_dir, "data", "groq_api_key.txt")).yukle() or ""
+
+
+def enrich(args, json_cikti) -> int:
+    bilgi_cekici = KitapBilgisiCekici()
+    api_key = api_key_bul(args)
+    if api_key:
+        bilgi_cekici.groq_api_key = api_key
+
+    def bildir(olay):
+        json_cikti.write(json.dumps(olay, ensure_ascii=False, default=str) + "\n")
+        json_cikti.flush()
+
+    sonuc = toplu_zenginlestir(args.input, args.output or varsayilan_cikti(args.input),
+                               bilgi_cekici, is_sayisi=args.workers, bildir=bildir, yeni=args.fresh,
+                               checkpoint_araligi=args.checkpoint_interval)
+    return {"done": 0, "interrupted": 130}.get(sonuc["event"], 1)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="kitap_listesi_cli", description="Kitap Listesi komut satırı")
+    komutlar = parser.add_subparsers(dest="command", required=True)
+
+    p = komutlar.add_parser("enrich", help="Eksik kitap bilgilerini toplu doldurur")
+    p.add_argument("input", help="Girdi tablosu (.xlsx / .csv / .parquet)")
+    p.add_argument("-o", "--output", help="Çıktı dosyası (varsayılan: girdi .xlsx ise kendisi)")
+    p.add_argument("--workers", type=int, default=VARSAYILAN_IS_SAYISI, help="Eşzamanlı istek sayısı")
+    p.add_argument("--api-key", help="Groq API anahtarı (yoksa GROQ_API_KEY veya kayıtlı anahtar)")
+    p.add_argument("--checkpoint-interval", type=float, default=CHECKPOINT_INTERVAL,
+                   help="Checkpoint günlüğüne yazma aralığı (saniye)")
+    p.add_argument("--fresh", action="store_true",
+                   help="Yarıda kalmış işi ve günlüğünü atıp baştan başla (varsayılan: kaldığı yerden devam)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers en az 1 olmalı")
+
+    # stdout sadece JSON olaylar içindir - modüllerin print logları stderr'e
+    json_cikti = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        return enrich(args, json_cikti)
+    finally:
+        sys.stdout = json_cikti
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,16 +8,38 @@ from tkinter import messagebox, filedialog, simpledialog
 import threading
 import sys
 import os
+from typing import Optional
 
 # modules klasörünü path'e ekle
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'modules'))
 
 from kitap_bilgisi_cekici import KitapBilgisiCekici
-from excel_handler import ExcelHandler
+from excel_handler import ExcelHandler, PARQUET_AVAILABLE
 from api_key_manager import APIKeyManager
 from form_handler import FormHandler
 from list_manager import ListManager
 from gui_widgets import GUIWidgets
+from change_journal import ChangeJournal
+from sqlite_store import SQLiteStore
+from save_queue import SaveQueue
+from progress_channel import ProgressChannel
+from batch_job import BatchJob
+from enrichment import ZENGIN_ALANLAR, kitabi_zenginlestir, sonucu_uygula, yeniden_deneme_bekliyor
+
+# İçe/dışa aktarma ve şablon diyaloglarında kabul edilen biçimler
+DEGISIM_DOSYA_TURLERI = [
+    ("Excel dosyaları", "*.xlsx"),
+    ("CSV dosyaları", "*.csv"),
+    ("Parquet dosyaları", "*.parquet"),
+    ("Tüm dosyalar", "*.*"),
+]
+
+# Bu sayıdan fazla kitapta toplu doldurma hızlı modda çalışır (form animasyonu yok,
+# canlı sonuç tablosu)
+HIZLI_MOD_ESIGI = 20
+
+# Açılışta kütüphane Treeview'e bu büyüklükte parçalarla eklenir (her parça ayrı event loop turu)
+YUKLEME_PARCASI = 2000
 
 
 class KitapListesiGUI:
@@ -38,9 +60,21 @@ class KitapListesiGUI:
         self.list_manager = ListManager()
         self.bilgi_cekici = KitapBilgisiCekici()
         
-        # Excel'den yükle
-        kitap_listesi = self.excel_handler.yukle()
-        self.list_manager.kitap_listesi = kitap_listesi
+        # Checkpoint günlüğü (toplu doldurma sırasında sadece değişen satırlar yazılır)
+        self.degisiklik_gunlugu = ChangeJournal.for_excel(self.excel_handler.excel_dosyasi)
+        
+        # İsteğe bağlı SQLite deposu (KUTUPHANE_SQLITE=1 veya Kutuphanem.sqlite varsa)
+        # Açıksa birincil kayıt depodur, Excel sadece dışa aktarma görünümüdür
+        self.depo = SQLiteStore.for_excel(self.excel_handler.excel_dosyasi)
+        
+        # Toplu doldurma işleri diskte tutulur (Kutuphanem.jobs/) - yarıda kalan iş açılışta devam eder
+        self.is_klasoru = BatchJob.jobs_dir_for(self.excel_handler.excel_dosyasi)
+        self.toplu_is: Optional[BatchJob] = None
+        # Bu oturumda "şimdilik bekle" denilen (veya açık kalan) işler tekrar sorulmaz
+        self.bekletilen_isler: set = set()
+        
+        # Açılış yüklemesi başarısız olduysa hata (liste boş/eksik - Excel'in üzerine yazılmamalı)
+        self.yukleme_hatasi: Optional[Exception] = None
         
         # API key yükle
         api_key = self.api_key_manager.yukle()
@@ -56,11 +90,94 @@ class KitapListesiGUI:
         # GUI oluştur
         self.gui_olustur()
         
+        # Worker thread'lerinin ilerlemesi tek kanaldan, sabit aralıkla uygulanır
+        # (her güncelleme için root.after kuyruğu doldurulmaz - bkz. progress_channel.py)
+        self.ilerleme_kanali = ProgressChannel()
+        self.ilerleme_kanali.attach(self.root.after, self._ilerleme_uygula)
+        
+        # Tam Excel kayıtları tek arka plan yazıcısında (Tk thread'i Excel I/O'da beklemez)
+        # ⚠️ _kayit_kilidi: değişiklik alma / günlük işlemleri kısa kritik bölgeler (yazma kilitsiz)
+        # ⚠️ Sonuç callback'leri ilerleme kanalından gelir - worker thread'i Tk'yi hiç çağırmaz
+        # (kapanışta Tk thread'i beklerken worker'ın root.after'da takılması kilitlenmeye yol açar)
+        self._kayit_kilidi = threading.Lock()
+        self.kaydetme_kuyrugu = SaveQueue(self._excel_tam_kaydet, notify=self.ilerleme_kanali.post_event)
+        self._kapaniyor = False
+        self.root.protocol("WM_DELETE_WINDOW", self.kapat)
+        
         # Form handler'ı başlat
         self.form_handler = FormHandler(self.gui_widgets.get_widgets())
         
-        # Listeyi güncelle
+        # Kütüphane arka planda yüklenir - pencere hemen açılır, liste parça parça dolar
+        self._kutuphaneyi_yukle()
+    
+    def _kutuphaneyi_yukle(self):
+        """
+        Kütüphaneyi (depo veya Excel) arka plan thread'inde yükler
+        
+        ⚠️ DİKKAT: Yükleme bitene kadar listeyi değiştiren işlemler kapalıdır
+        (gui_widgets.islemleri_kilitle) - kısmi liste Excel'e yazılamaz
+        """
+        self.gui_widgets.islemleri_kilitle(True)
+        self.gui_widgets.progress_goster("Kütüphane yükleniyor...")
+        thread = threading.Thread(target=self._kutuphaneyi_arka_planda_yukle)
+        thread.daemon = True
+        thread.start()
+    
+    def _kutuphaneyi_arka_planda_yukle(self):
+        """Okuma, günlük uygulama ve BookRecord dönüşümü (arka plan thread'i)"""
+        try:
+            if self.depo is not None and self.depo.count():
+                self.list_manager.kitap_listesi = self.depo.load_all()
+            else:
+                # Excel'den yükle (row_id'si olmayan satırlara kimlik burada verilir)
+                self.list_manager.kitap_listesi = self.excel_handler.yukle()
+                # ⚠️ Yarıda kalan toplu işlemin checkpoint'leri varsa kimlikli satırların üzerine uygula
+                if self.degisiklik_gunlugu.pending():
+                    self.degisiklik_gunlugu.replay_into(self.list_manager)
+                # Depo yeni açıldıysa Excel'den bir kez içe aktar (row_id'ler atandıktan sonra)
+                if self.depo is not None:
+                    self.depo.replace_all(self.list_manager.anlik_goruntu())
+                    self.degisiklik_gunlugu.clear()
+        except Exception as e:
+            print(f"Kütüphane yükleme hatası: {e}")
+            self.yukleme_hatasi = e
+            self.ilerleme_kanali.post_event(lambda hata=e: self._kutuphane_yuklenemedi(hata))
+            return
+        
+        goruntu = self.list_manager.anlik_goruntu()
+        self.ilerleme_kanali.post_event(lambda: self._kutuphaneyi_parca_parca_ekle(goruntu, 0))
+    
+    def _kutuphaneyi_parca_parca_ekle(self, goruntu, baslangic: int):
+        """Yüklenen satırları Treeview'e YUKLEME_PARCASI'lık parçalarla ekler (Tk thread'inde)"""
+        parca = goruntu[baslangic:baslangic + YUKLEME_PARCASI]
+        self.gui_widgets.satirlari_ekle(parca)
+        son = baslangic + len(parca)
+        if son < len(goruntu):
+            self.gui_widgets.progress_mesaj_guncelle(f"Kütüphane yükleniyor... {son}/{len(goruntu)}")
+            # Parçalar arasında olay döngüsü döner (pencere çizilir, kaydırma çalışır)
+            self.root.after(1, lambda: self._kutuphaneyi_parca_parca_ekle(goruntu, son))
+            return
+        
+        # Yükleme sırasında listeye başka yoldan gelen değişiklik varsa eşitle (kimlik farkı, ucuz)
         self.listeyi_guncelle()
+        self.gui_widgets.progress_gizle()
+        self.gui_widgets.islemleri_kilitle(False)
+        self._yarim_kalan_isi_sor()
+    
+    def _kutuphane_yuklenemedi(self, hata: Exception):
+        """
+        Yükleme hatasını gösterir (Tk thread'inde)
+        
+        ⚠️ DİKKAT: Kaydetme / içe-dışa aktarma butonları kilitli kalır - boş veya eksik
+        liste Kutuphanem.xlsx'in üzerine yazılamaz (bkz. _excel_tam_kaydet)
+        """
+        self.gui_widgets.progress_gizle()
+        messagebox.showerror(
+            "❌ Kütüphane Yüklenemedi",
+            f"Kütüphane dosyası okunamadı:\n\n{hata}\n\n"
+            f"Dosyanıza dokunulmadı. Verinizi korumak için kaydetme ve içe/dışa aktarma "
+            f"kapatıldı.\n\nDosyayı kontrol edip (başka programda açık mı, bozuk mu?) "
+            f"programı yeniden başlatın.\n\n📁 {self.excel_handler.excel_dosyasi}")
     
     def gui_olustur(self):
         """GUI arayuzunu olustur"""
@@ -73,6 +190,8 @@ class KitapListesiGUI:
             'excel_olustur': self.excel_olustur,
             'excel_sablonu_olustur': self.excel_sablonu_olustur,
             'excel_yukle': self.excel_yukle,
+            'toplu_ice_aktar': self.toplu_ice_aktar,
+            'disari_aktar': self.disari_aktar,
             'groq_api_key_ayarla': self.groq_api_key_ayarla,
             'kitap_sec': self.kitap_sec
         }
@@ -262,6 +381,7 @@ class KitapListesiGUI:
                 return False
         
         # Listeyi güncelle
+        self._depoya_yaz()
         self.listeyi_guncelle()
         self.formu_temizle()
         
@@ -277,9 +397,99 @@ class KitapListesiGUI:
                               f"💡 Excel dosyasina kaydetmek icin 'Excel Dosyasi Olustur' butonuna tiklayin.")
         return True
     
+    def _checkpoint(self) -> int:
+        """
+        Son checkpoint'ten bu yana değişen satırları günlüğe ekler (O(değişen satır))
+        
+        Returns:
+            Günlüğe yazılan kayıt sayısı
+        """
+        with self._kayit_kilidi:
+            degisenler, silinenler = self.list_manager.degisiklikleri_al()
+            try:
+                if self.depo is not None:
+                    # Checkpoint aralığı depoya yazımda da günlükten sayılır (bkz. due)
+                    self.degisiklik_gunlugu.checkpointed()
+                    return self.depo.apply(degisenler, silinenler)
+                return self.degisiklik_gunlugu.append(degisenler, silinenler)
+            except Exception:
+                # Yazılamayan değişiklikler kaybolmasın (sonraki checkpoint / tam kayıt yazar)
+                self.list_manager.kirli_isaretle([k["row_id"] for k in degisenler], silinenler)
+                raise
+    
+    def _depoya_yaz(self):
+        """SQLite deposu açıksa liste değişikliklerini hemen depoya yazar (artımlı kayıt)"""
+        if self.depo is None:
+            return
+        try:
+            self._checkpoint()
+        except Exception as e:
+            print(f"Depo kaydetme hatası: {e}")
+    
+    def _excel_tam_kaydet(self):
+        """
+        Tüm listeyi Excel'e yazar; başarılıysa checkpoint günlüğü temizlenir,
+        başarısızsa bekleyen değişiklikler günlüğe yazılır (kaybolmaz)
+        
+        ⚠️ DİKKAT: Sadece kaydetme_kuyrugu worker'ında çalışır - doğrudan çağırma,
+        self.kaydetme_kuyrugu.request(...) kullan
+        
+        Returns:
+            (Başarılı mı, Kaydedilen görüntü)
+        """
+        # Açılışta yüklenemeyen kütüphanenin üzerine boş/eksik liste yazılmaz
+        if self.yukleme_hatasi is not None:
+            print(f"Excel kaydı atlandı (kütüphane yüklenemedi): {self.yukleme_hatasi}")
+            return False, self.list_manager.anlik_goruntu()
+        
+        # ⚠️ Önce değişiklikler alınır, sonra görüntü - arada gelen değişiklik
+        # görüntüde olmasa bile tekrar kirli işaretlenir, kaybolmaz
+        with self._kayit_kilidi:
+            degisenler, silinenler = self.list_manager.degisiklikleri_al()
+            if self.depo is not None:
+                self.depo.apply(degisenler, silinenler)
+            kitap_listesi = self.list_manager.anlik_goruntu()
+            # Yazma sürerken toplu doldurma checkpoint'leri günlüğe eklemeye devam eder
+            gunluk_sonu = self.degisiklik_gunlugu.mark()
+        
+        basarili = self.excel_handler.kaydet(kitap_listesi)
+        
+        with self._kayit_kilidi:
+            if basarili:
+                self.degisiklik_gunlugu.clear(upto=gunluk_sonu)
+            elif self.depo is None:
+                # Satırların güncel hali yazılsın (arada yeniden değişmiş olabilir)
+                self.list_manager.kirli_isaretle([k["row_id"] for k in degisenler], silinenler)
+                degisenler, silinenler = self.list_manager.degisiklikleri_al()
+                self.degisiklik_gunlugu.append(degisenler, silinenler)
+        return basarili, kitap_listesi
+    
+    def kapat(self):
+        """
+        Pencere kapanırken bekleyen kaydı bitirir
+        
+        ⚠️ DİKKAT: Tk thread'i kaydetme worker'ını join ile beklemez - olay döngüsü
+        çalışmaya devam eder, worker bitince pencere _kapanisi_bekle'den kapanır
+        """
+        if self._kapaniyor:
+            return
+        self._kapaniyor = True
+        if self.kaydetme_kuyrugu.pending():
+            self.gui_widgets.islemleri_kilitle(True)
+            self.gui_widgets.progress_goster("Excel kaydı tamamlanıyor...")
+        self._kapanisi_bekle()
+    
+    def _kapanisi_bekle(self):
+        """Kaydetme worker'ı bitene kadar olay döngüsünden yoklar, sonra pencereyi kapatır"""
+        if not self.kaydetme_kuyrugu.close(timeout=0):
+            self.root.after(50, self._kapanisi_bekle)
+            return
+        self.ilerleme_kanali.detach()
+        self.root.destroy()
+    
     def listeyi_guncelle(self):
         """Treeview'i güncelle"""
-        kitap_listesi = self.list_manager.tumunu_getir()
+        kitap_listesi = self.list_manager.anlik_goruntu()
         self.gui_widgets.listeyi_guncelle(kitap_listesi)
     
     def kitap_sec(self):
@@ -291,12 +501,12 @@ class KitapListesiGUI:
         if not selected:
             return
         
-        # Seçili satırın indeksini bul
+        # Seçili satırın row_id'sini bul (item id'si row_id'dir)
         item = selected[0]
-        index = self.gui_widgets.tree.index(item)
+        kimlik = self.gui_widgets.satir_kimligi(item)
         
         # Kitabı listeden al
-        kitap = self.list_manager.getir(index)
+        kitap = self.list_manager.getir_kimlik(kimlik)
         if kitap:
             # Forma yükle
             self.form_handler.kitap_yukle(kitap)
@@ -307,9 +517,9 @@ class KitapListesiGUI:
             return
         
         # Önce checkbox seçimlerini kontrol et
-        secili_indeksler = self.gui_widgets.secili_kitaplari_getir()
+        secili_kimlikler = self.gui_widgets.secili_kitaplari_getir()
         
-        if secili_indeksler:
+        if secili_kimlikler:
             # Checkbox ile seçili kitaplar var, toplu silme yap
             self.toplu_sil()
             return
@@ -322,14 +532,15 @@ class KitapListesiGUI:
                                   "💡 'Sec' sutunundaki ☐ isaretine tiklayarak kitap secebilirsiniz.")
             return
         
-        # Seçili satırın indeksini bul
+        # Seçili satırın row_id'sini bul
         item = selected[0]
-        index = self.gui_widgets.tree.index(item)
+        kimlik = self.gui_widgets.satir_kimligi(item)
         
         # Kitabı listeden sil
-        basarili, silinen_kitap = self.list_manager.sil(index)
+        basarili, silinen_kitap = self.list_manager.sil_kimlik(kimlik)
         if basarili:
-            self.listeyi_guncelle()
+            self._depoya_yaz()
+            self.gui_widgets.satirlari_sil([kimlik])
             silinen_kitap_adi = silinen_kitap.get('Kitap Adı', '')
             if len(silinen_kitap_adi) > 50:
                 silinen_kitap_adi = silinen_kitap_adi[:47] + "..."
@@ -340,15 +551,15 @@ class KitapListesiGUI:
         if not self.gui_widgets.tree:
             return
         
-        # Seçili kitapların indekslerini al
-        secili_indeksler = self.gui_widgets.secili_kitaplari_getir()
+        # Seçili kitapların row_id'lerini al
+        secili_kimlikler = self.gui_widgets.secili_kitaplari_getir()
         
-        if not secili_indeksler:
+        if not secili_kimlikler:
             messagebox.showwarning("Uyari", "Lutfen silmek icin en az bir kitap secin!\n\n💡 'Sec' sutunundaki ☐ isaretine tiklayarak kitap secebilirsiniz.")
             return
         
         # Onay mesajı
-        secim_sayisi = len(secili_indeksler)
+        secim_sayisi = len(secili_kimlikler)
         cevap = messagebox.askyesno(
             "⚠️ Toplu Silme Onayı",
             f"Seçili {secim_sayisi} kitabı silmek istediğinize emin misiniz?\n\n"
@@ -358,21 +569,13 @@ class KitapListesiGUI:
         if not cevap:
             return
         
-        # Kitapları tersten sil (indeks kaymasını önlemek için)
-        silinen_kitaplar = []
-        kitap_listesi = self.list_manager.tumunu_getir()
-        
-        # Tersten sırala (büyükten küçüğe)
-        secili_indeksler.sort(reverse=True)
+        # Kitapları row_id ile tek geçişte sil (indeks kayması yok)
+        silinenler = self.list_manager.toplu_sil_kimlik(secili_kimlikler)
+        silinen_kitaplar = [kitap.get('Kitap Adı', '') for kitap in silinenler]
         
-        for index in secili_indeksler:
-            if 0 <= index < len(kitap_listesi):
-                basarili, silinen_kitap = self.list_manager.sil(index)
-                if basarili:
-                    silinen_kitaplar.append(silinen_kitap.get('Kitap Adı', ''))
-        
-        # Listeyi güncelle
-        self.listeyi_guncelle()
+        # Listeyi güncelle (sadece silinen satırlar görünümden çıkarılır)
+        self._depoya_yaz()
+        self.gui_widgets.satirlari_sil([kitap['row_id'] for kitap in silinenler])
         
         # Başarı mesajı
         if silinen_kitaplar:
@@ -438,59 +641,86 @@ class KitapListesiGUI:
             if not cevap:
                 return
         
-        try:
-            kitap_listesi = self.list_manager.tumunu_getir()
-            basarili = self.excel_handler.kaydet(kitap_listesi)
+        # Kayıt arka planda; sonuç _excel_kaydedildi ile (root.after üzerinden) gösterilir
+        self.gui_widgets.progress_goster("Excel dosyası kaydediliyor...")
+        self.kaydetme_kuyrugu.request(self._excel_kaydedildi, immediate=True)
+    
+    def _excel_kaydedildi(self, sonuc):
+        """
+        Arka plan Excel kaydı bitince Tk thread'inde çağrılır
+        
+        Args:
+            sonuc: _excel_tam_kaydet sonucu (Başarılı mı, Kaydedilen görüntü) veya None (hata)
+        """
+        self.gui_widgets.progress_gizle()
+        basarili, kitap_listesi = sonuc if sonuc else (False, None)
+        
+        if basarili:
+            dosya_yolu = os.path.abspath(self.excel_handler.excel_dosyasi)
+            toplam_kitap = len(kitap_listesi)
             
-            if basarili:
-                import os
-                dosya_yolu = os.path.abspath(self.excel_handler.excel_dosyasi)
-                toplam_kitap = len(kitap_listesi)
-                
-                # Sadece özet bilgi göster, kitap listesi gösterme
-                mesaj = f"✅ Excel dosyası başarıyla oluşturuldu!\n\n"
-                mesaj += f"📊 Toplam {toplam_kitap} kitap kaydedildi\n"
-                mesaj += f"📁 Dosya konumu:\n{dosya_yolu}\n\n"
-                
-                # İlk 3 kitabı örnek olarak göster (sadece isim)
-                if toplam_kitap > 0:
-                    ilk_kitaplar = [kitap.get("Kitap Adı", "") for kitap in kitap_listesi[:3]]
-                    mesaj += f"📚 Örnek kitaplar:\n"
-                    for kitap_adi in ilk_kitaplar:
-                        if len(kitap_adi) > 40:
-                            kitap_adi = kitap_adi[:37] + "..."
-                        mesaj += f"  • {kitap_adi}\n"
-                    
-                    if toplam_kitap > 3:
-                        mesaj += f"  ... ve {toplam_kitap - 3} kitap daha"
+            # Sadece özet bilgi göster, kitap listesi gösterme
+            mesaj = f"✅ Excel dosyası başarıyla oluşturuldu!\n\n"
+            mesaj += f"📊 Toplam {toplam_kitap} kitap kaydedildi\n"
+            mesaj += f"📁 Dosya konumu:\n{dosya_yolu}\n\n"
+            
+            # İlk 3 kitabı örnek olarak göster (sadece isim)
+            if toplam_kitap > 0:
+                ilk_kitaplar = [kitap.get("Kitap Adı", "") for kitap in kitap_listesi[:3]]
+                mesaj += f"📚 Örnek kitaplar:\n"
+                for kitap_adi in ilk_kitaplar:
+                    if len(kitap_adi) > 40:
+                        kitap_adi = kitap_adi[:37] + "..."
+                    mesaj += f"  • {kitap_adi}\n"
                 
-                messagebox.showinfo("✅ Başarılı", mesaj)
-            else:
-                messagebox.showerror("Hata", "Excel dosyası kaydedilemedi!")
-        except PermissionError:
+                if toplam_kitap > 3:
+                    mesaj += f"  ... ve {toplam_kitap - 3} kitap daha"
+            
+            messagebox.showinfo("✅ Başarılı", mesaj)
+        else:
+            # kaydet() hataları yakalar: en sık neden dosyanın Excel'de açık olması
             messagebox.showerror("Hata", 
                                 f"Excel dosyası kaydedilemedi!\n\n"
                                 f"'{self.excel_handler.excel_dosyasi}' dosyası başka bir programda açık olabilir.\n\n"
                 f"Lutfen:\n"
                 f"1. Excel dosyasini kapatin\n"
                 f"2. Dosyanin baska bir programda acik olmadigindan emin olun\n"
-                f"3. Tekrar deneyin")
-        except Exception as e:
-            # Hata mesajını kısalt - traceback gösterme
-            hata_mesaji = str(e)
-            if len(hata_mesaji) > 200:
-                hata_mesaji = hata_mesaji[:197] + "..."
-            messagebox.showerror("❌ Hata", 
-                                f"Excel dosyası oluşturulurken hata oluştu:\n\n"
-                                f"{hata_mesaji}\n\n"
-                                f"💡 Lutfen dosyanin acik olmadigindan ve yazma izniniz oldugundan emin olun.")
+                f"3. Tekrar deneyin\n\n"
+                f"💡 Değişiklikler kaybolmadı, tekrar kaydedebilirsiniz.")
+    
+    def disari_aktar(self):
+        """Kitap listesini seçilen biçimde (xlsx / csv / parquet) dışa aktar"""
+        if self.list_manager.sayi() == 0:
+            messagebox.showwarning("Uyari", "Listede kitap yok! Lutfen once kitap ekleyin.")
+            return
+        
+        dosya_yolu = filedialog.asksaveasfilename(
+            title="Listeyi Dışa Aktar",
+            defaultextension=".csv",
+            filetypes=[DEGISIM_DOSYA_TURLERI[1], DEGISIM_DOSYA_TURLERI[2], DEGISIM_DOSYA_TURLERI[0]],
+            initialfile="kutuphanem.csv"
+        )
+        
+        if not dosya_yolu:
+            return
+        
+        kitap_listesi = self.list_manager.anlik_goruntu()
+        if self.excel_handler.disari_aktar(kitap_listesi, dosya_yolu):
+            if len(dosya_yolu) > 80:
+                dosya_yolu = "..." + dosya_yolu[-77:]
+            messagebox.showinfo("✅ Basarili",
+                              f"📤 {len(kitap_listesi)} kitap dışa aktarıldı!\n\n📁 {dosya_yolu}")
+        elif dosya_yolu.lower().endswith((".parquet", ".pq")) and not PARQUET_AVAILABLE:
+            messagebox.showerror("Hata", "Parquet için pyarrow paketi gerekli:\n\npip install pyarrow")
+        else:
+            messagebox.showerror("Hata", "Dışa aktarma sırasında hata oluştu!")
     
     def excel_sablonu_olustur(self):
         """Boş Excel şablonu oluştur"""
         dosya_yolu = filedialog.asksaveasfilename(
             title="Excel Şablonu Kaydet",
             defaultextension=".xlsx",
-            filetypes=[("Excel dosyaları", "*.xlsx"), ("Tüm dosyalar", "*.*")],
+            filetypes=DEGISIM_DOSYA_TURLERI,
             initialfile="kitap_yukleme_sablonu.xlsx"
         )
         
@@ -515,75 +745,76 @@ class KitapListesiGUI:
     def excel_yukle(self):
         """Excel dosyasından kitap listesini yükle"""
         dosya_yolu = filedialog.askopenfilename(
-            title="Excel Dosyası Seç",
-            filetypes=[("Excel dosyaları", "*.xlsx"), ("Tüm dosyalar", "*.*")]
+            title="Excel / CSV / Parquet Dosyası Seç",
+            filetypes=DEGISIM_DOSYA_TURLERI
         )
         
         if not dosya_yolu:
             return
         
+        # Dosya parça parça arka planda okunur; GUI donmaz ve İptal ile durdurulabilir
+        iptal_olayi = threading.Event()
+        self.gui_widgets.progress_goster("Dosya okunuyor...", iptal=iptal_olayi.set)
+        
+        thread = threading.Thread(target=self._disaridan_arka_planda_yukle,
+                                  args=(dosya_yolu, iptal_olayi))
+        thread.daemon = True
+        thread.start()
+    
+    def _disaridan_arka_planda_yukle(self, dosya_yolu: str, iptal_olayi: threading.Event):
+        """
+        Dış dosyayı parça parça okuyup her parçayı listeye ekler (arka plan thread'i)
+        
+        ⚠️ DİKKAT: Bellekte tüm dosya değil sadece bir parça tutulur; her parça
+        eklenir eklenmez depoya yazılır ve ilerleme kanalıyla Treeview'e gönderilir
+        (otomatik doldurma için sadece row_id'ler saklanır)
+        """
+        eklenen = []  # row_id'ler
+        atlanan = []
+        hata = None
+        
+        def ilerleme(okunan, toplam):
+            mesaj = f"{okunan}/{toplam} satır okundu" if toplam else f"{okunan} satır okundu"
+            mesaj += f" (➕ {len(eklenen)})"
+            self.ilerleme_kanali.post_state("mesaj", mesaj)
+        
         try:
-            kitaplar = self.excel_handler.disaridan_yukle(dosya_yolu)
-            
-            if kitaplar is None:
+            for parca in self.excel_handler.disaridan_parcali_yukle(
+                    dosya_yolu, ilerleme=ilerleme, iptal=iptal_olayi.is_set):
+                sonuc = self.list_manager.toplu_ekle(parca, tekrar_kontrol=True)
+                kimlikler = [kitap['row_id'] for kitap in sonuc['eklenen']]
+                eklenen.extend(kimlikler)
+                atlanan.extend(sonuc['atlanan'])
+                if kimlikler:
+                    self._depoya_yaz()
+                    self.ilerleme_kanali.post_ids("eklenen", kimlikler)
+        except Exception as e:
+            print(f"Dışarıdan yükleme hatası: {e}")
+            hata = e
+        
+        iptal_edildi = iptal_olayi.is_set()
+        self.ilerleme_kanali.post_event(
+            lambda: self._disaridan_yukleme_bitti(eklenen, atlanan, hata, iptal_edildi))
+    
+    def _disaridan_yukleme_bitti(self, eklenen: list, atlanan: list, hata, iptal_edildi: bool):
+        """
+        Parça parça yükleme bitince (Tk thread'inde) sonucu gösterir
+        
+        Args:
+            eklenen: Eklenen satırların row_id'leri (satırlar parça parça zaten
+                depoya yazıldı ve Treeview'e eklendi)
+        """
+        self.gui_widgets.progress_gizle()
+        
+        if hata is not None and not eklenen:
+            if isinstance(hata, ValueError):
                 messagebox.showerror("Hata", 
                                     f"Excel dosyası yüklenemedi!\n\n"
                                     f"Lutfen Excel sablonu kullanin veya dosyanin dogru formatta oldugundan emin olun.\n"
                                     f"Excel sablonu olusturmak icin 'Excel Sablonu Olustur' butonunu kullanabilirsiniz.")
                 return
-            
-            if not kitaplar:
-                messagebox.showwarning("Uyarı", "Excel dosyasında kitap bulunamadı!")
-                return
-            
-            # Toplu ekle
-            sonuc = self.list_manager.toplu_ekle(kitaplar, tekrar_kontrol=True)
-            
-            # Listeyi güncelle
-            self.listeyi_guncelle()
-            
-            # Sonuç mesajı - kısa ve öz
-            eklenen_sayi = len(sonuc['eklenen'])
-            atlanan_sayi = len(sonuc['atlanan'])
-            toplam = self.list_manager.sayi()
-            
-            mesaj = f"✅ Excel dosyası yüklendi!\n\n"
-            mesaj += f"➕ Eklenen: {eklenen_sayi} kitap\n"
-            
-            if atlanan_sayi > 0:
-                mesaj += f"⏭️ Atlanan (zaten listede var): {atlanan_sayi} kitap\n"
-                # Sadece ilk 2 atlanan kitabı göster (varsa)
-                if atlanan_sayi <= 2:
-                    mesaj += f"\nAtlanan kitaplar:\n"
-                    for kitap in sonuc['atlanan']:
-                        if len(kitap) > 40:
-                            kitap = kitap[:37] + "..."
-                        mesaj += f"  • {kitap}\n"
-                elif atlanan_sayi > 2:
-                    mesaj += f"\n(İlk 2 örnek: "
-                    for i, kitap in enumerate(sonuc['atlanan'][:2]):
-                        if len(kitap) > 30:
-                            kitap = kitap[:27] + "..."
-                        if i > 0:
-                            mesaj += ", "
-                        mesaj += f"{kitap}"
-                    mesaj += f" ...)"
-            
-            mesaj += f"\n\n📚 Toplam kitap sayısı: {toplam}"
-            messagebox.showinfo("✅ Başarılı", mesaj)
-            
-            # Otomatik bilgi doldurma seçeneği sun
-            if eklenen_sayi > 0:
-                secim = self._otomatik_doldurma_dialog_goster(eklenen_sayi)
-                if secim == "toplu":
-                    self._excel_kitaplari_otomatik_doldur(sonuc['eklenen'])
-                elif secim == "iptal":
-                    pass  # Hiçbir şey yapma
-                # secim == "manuel" ise zaten kullanıcı çift tıklayarak yapabilir
-            
-        except Exception as e:
             # Hata mesajını kısalt
-            hata_mesaji = str(e)
+            hata_mesaji = str(hata)
             if len(hata_mesaji) > 150:
                 hata_mesaji = hata_mesaji[:147] + "..."
             messagebox.showerror("❌ Hata", 
@@ -591,6 +822,171 @@ class KitapListesiGUI:
                                 f"{hata_mesaji}\n\n"
                 f"💡 Lutfen Excel dosyasinin dogru formatta oldugundan emin olun.\n"
                 f"Excel sablonu olusturmak icin 'Excel Sablonu Olustur' butonunu kullanabilirsiniz.")
+            return
+        
+        if not eklenen and not atlanan:
+            if not iptal_edildi:
+                messagebox.showwarning("Uyarı", "Excel dosyasında kitap bulunamadı!")
+            return
+        
+        # Sonuç mesajı - kısa ve öz
+        eklenen_sayi = len(eklenen)
+        atlanan_sayi = len(atlanan)
+        toplam = self.list_manager.sayi()
+        
+        if hata is not None:
+            mesaj = f"⚠️ Dosyanın bir kısmı yüklendi (hata: {str(hata)[:80]})\n\n"
+        elif iptal_edildi:
+            mesaj = f"⏹️ Yükleme iptal edildi - o ana kadar okunanlar eklendi\n\n"
+        else:
+            mesaj = f"✅ Excel dosyası yüklendi!\n\n"
+        mesaj += f"➕ Eklenen: {eklenen_sayi} kitap\n"
+        
+        if atlanan_sayi > 0:
+            mesaj += f"⏭️ Atlanan (zaten listede var): {atlanan_sayi} kitap\n"
+            # Sadece ilk 2 atlanan kitabı göster (varsa)
+            if atlanan_sayi <= 2:
+                mesaj += f"\nAtlanan kitaplar:\n"
+                for kitap in atlanan:
+                    if len(kitap) > 40:
+                        kitap = kitap[:37] + "..."
+                    mesaj += f"  • {kitap}\n"
+            elif atlanan_sayi > 2:
+                mesaj += f"\n(İlk 2 örnek: "
+                for i, kitap in enumerate(atlanan[:2]):
+                    if len(kitap) > 30:
+                        kitap = kitap[:27] + "..."
+                    if i > 0:
+                        mesaj += ", "
+                    mesaj += f"{kitap}"
+                mesaj += f" ...)"
+        
+        mesaj += f"\n\n📚 Toplam kitap sayısı: {toplam}"
+        messagebox.showinfo("✅ Başarılı", mesaj)
+        
+        # Otomatik bilgi doldurma seçeneği sun
+        if eklenen_sayi > 0:
+            secim = self._otomatik_doldurma_dialog_goster(eklenen_sayi)
+            if secim == "toplu":
+                kitaplar = (self.list_manager.getir_kimlik(kimlik) for kimlik in eklenen)
+                kitaplar = self._yakin_tekrarlari_ele([kitap for kitap in kitaplar if kitap is not None])
+                self._excel_kitaplari_otomatik_doldur(kitaplar)
+            elif secim == "iptal":
+                pass  # Hiçbir şey yapma
+            # secim == "manuel" ise zaten kullanıcı çift tıklayarak yapabilir
+    
+    def toplu_ice_aktar(self):
+        """Birden çok dosyayı veya bir klasörü (tüm sayfalarıyla) paralel içe aktar"""
+        secim = messagebox.askyesnocancel("📚 Toplu İçe Aktar",
+                                          "Bir klasördeki tüm dosyalar mı aktarılsın?\n\n"
+                                          "Evet: Klasör seç (alt klasörler dahil)\n"
+                                          "Hayır: Dosyaları tek tek seç")
+        if secim is None:
+            return
+        if secim:
+            klasor = filedialog.askdirectory(title="İçe Aktarılacak Klasörü Seç")
+            yollar = [klasor] if klasor else []
+        else:
+            yollar = list(filedialog.askopenfilenames(
+                title="Excel / CSV / Parquet Dosyalarını Seç",
+                filetypes=DEGISIM_DOSYA_TURLERI
+            ))
+        
+        if not yollar:
+            return
+        
+        self.gui_widgets.progress_goster("Dosyalar okunuyor...")
+        
+        thread = threading.Thread(target=self._toplu_arka_planda_aktar, args=(yollar,))
+        thread.daemon = True
+        thread.start()
+    
+    def _toplu_arka_planda_aktar(self, yollar: list):
+        """Dosyaları süreç havuzunda okuyup listeye ekler (arka plan thread'i)"""
+        from bulk_import import toplu_ice_aktar
+        
+        def ilerleme(biten, toplam, gorev):
+            dosya, sayfa = gorev
+            ad = os.path.basename(dosya) + (f" / {sayfa}" if sayfa else "")
+            self.ilerleme_kanali.post_state("mesaj", f"{biten}/{toplam} sayfa okundu ({ad})")
+        
+        try:
+            sonuc = toplu_ice_aktar(yollar, self.list_manager, ilerleme=ilerleme)
+            self.ilerleme_kanali.post_event(lambda: self._toplu_aktarim_bitti(sonuc))
+        except Exception as e:
+            print(f"Toplu içe aktarma hatası: {e}")
+            self.ilerleme_kanali.post_event(self.gui_widgets.progress_gizle)
+            self.ilerleme_kanali.post_event(lambda: messagebox.showerror("❌ Hata", f"Toplu içe aktarma başarısız:\n\n{str(e)[:150]}"))
+    
+    def _toplu_aktarim_bitti(self, sonuc: dict):
+        """Toplu içe aktarma raporunu gösterir (Tk thread'inde)"""
+        self.gui_widgets.progress_gizle()
+        
+        eklenen = sonuc['eklenen']
+        if eklenen:
+            self._depoya_yaz()
+            self.gui_widgets.satirlari_ekle(eklenen)
+        
+        # Kaynak başına tek satır (uzun listelerde ilk 10)
+        satirlar = []
+        for kaynak in sonuc['kaynaklar']:
+            ad = os.path.basename(kaynak['dosya']) + (f" / {kaynak['sayfa']}" if kaynak['sayfa'] else "")
+            if len(ad) > 40:
+                ad = ad[:37] + "..."
+            if kaynak['hata']:
+                satirlar.append(f"  ⚠️ {ad}: {kaynak['hata'][:60]}")
+            else:
+                satirlar.append(f"  • {ad}: ➕ {kaynak['eklenen']}  ⏭️ {kaynak['tekrar']}")
+        
+        mesaj = f"📚 {len(sonuc['kaynaklar'])} kaynak işlendi\n\n"
+        mesaj += f"➕ Eklenen: {len(eklenen)} kitap\n"
+        mesaj += f"⏭️ Atlanan (tekrar): {len(sonuc['atlanan'])} kitap\n\n"
+        mesaj += "\n".join(satirlar[:10])
+        if len(satirlar) > 10:
+            mesaj += f"\n  ... (+{len(satirlar) - 10} kaynak)"
+        mesaj += f"\n\n📚 Toplam kitap sayısı: {self.list_manager.sayi()}"
+        messagebox.showinfo("✅ Toplu İçe Aktarma", mesaj)
+        
+        # Otomatik bilgi doldurma seçeneği sun (tek dosya yüklemeyle aynı)
+        if eklenen:
+            secim = self._otomatik_doldurma_dialog_goster(len(eklenen))
+            if secim == "toplu":
+                kitaplar = self._yakin_tekrarlari_ele(eklenen)
+                self._excel_kitaplari_otomatik_doldur(kitaplar)
+    
+    def _yakin_tekrarlari_ele(self, kitaplar: list) -> list:
+        """
+        Zenginleştirme başlamadan yakın tekrarları raporlar
+        
+        "Suç ve Ceza" / "Suç ve Ceza (Ciltli)" gibi kayıtlar için aynı kitabı
+        birden fazla kez API'ye sormamak adına kullanıcıya eleme seçeneği sunar.
+        
+        Returns:
+            Zenginleştirilecek kitaplar
+        """
+        from near_duplicates import redundant_incoming
+        
+        rapor = self.list_manager.yakin_tekrarlari_bul(
+            kitaplar, haric={kitap.get('row_id') for kitap in kitaplar})
+        if not rapor:
+            return kitaplar
+        
+        gereksiz = set(redundant_incoming(rapor))
+        if not gereksiz:
+            return kitaplar
+        
+        mesaj = f"🔍 {len(rapor)} yakın tekrar kümesi bulundu.\n\n"
+        for kume in rapor[:3]:
+            etiketler = [e if len(e) <= 40 else e[:37] + "..." for e in kume['labels'][:3]]
+            mesaj += "  • " + " ≈ ".join(etiketler) + "\n"
+        if len(rapor) > 3:
+            mesaj += f"  ... ve {len(rapor) - 3} küme daha\n"
+        mesaj += f"\n{len(gereksiz)} kitap otomatik doldurmadan çıkarılsın mı?\n"
+        mesaj += "(Kitaplar listede kalır, sadece API çağrısı yapılmaz)"
+        
+        if not messagebox.askyesno("🔍 Yakın Tekrarlar", mesaj):
+            return kitaplar
+        return [k for i, k in enumerate(kitaplar) if i not in gereksiz]
     
     def _otomatik_doldurma_dialog_goster(self, kitap_sayisi: int) -> str:
         """
@@ -743,11 +1139,34 @@ class KitapListesiGUI:
         sonuc["secim"] = secim
         dialog.destroy()
     
-    def _excel_kitaplari_otomatik_doldur(self, kitaplar: list):
-        """Excel'den yüklenen kitaplar için otomatik bilgi doldurma yapar"""
+    def _excel_kitaplari_otomatik_doldur(self, kitaplar: list, hizli: Optional[bool] = None):
+        """
+        Excel'den yüklenen kitaplar için otomatik bilgi doldurma yapar
+        
+        Args:
+            kitaplar: Doldurulacak kitaplar
+            hizli: Form animasyonu olmadan, canlı sonuç tablosuyla çalış
+                   (None: HIZLI_MOD_ESIGI'nden fazla kitapta açık)
+        
+        ⚠️ DİKKAT: Her çalıştırma diskte bir BatchJob'dur (batch_job.py) - duraklatılabilir,
+        iptal edilebilir; program kapanırsa sonraki açılışta kaldığı yerden devam eder
+        """
         if not kitaplar:
             return
+        if self.toplu_is is not None:
+            messagebox.showinfo("Toplu Doldurma",
+                                "Bir toplu doldurma işi zaten çalışıyor.\n\n"
+                                "Bitmesini bekleyin veya İptal ile durdurun.")
+            return
+        if not self._groq_key_hazir():
+            return
         
+        toplu_is = BatchJob.create(self.is_klasoru, [kitap.get('row_id') for kitap in kitaplar],
+                                   source=self.excel_handler.excel_dosyasi)
+        self._toplu_isi_baslat(toplu_is, hizli)
+    
+    def _groq_key_hazir(self) -> bool:
+        """Groq API key'i bilgi_cekici'ye aktarır; yoksa kullanıcıyı uyarır"""
         # API key kontrolü
         groq_key = self.api_key_manager.get()
         if not groq_key:
@@ -760,178 +1179,312 @@ class KitapListesiGUI:
                 "Lutfen 'Groq API Key' butonuna tiklayip API key'inizi girin.\n"
                 "Alternatif: Listeden bir kitaba çift tıklayarak forma yükleyip 'Bilgileri Otomatik Doldur' butonuna tıklayabilirsiniz."
             )
-            return
+            return False
         
         # API key'i bilgi_cekici'ye aktar
         self.bilgi_cekici.groq_api_key = groq_key
-        
-        # Progress bar göster
-        self.gui_widgets.progress_goster(f"0/{len(kitaplar)} kitap işleniyor...")
+        return True
+    
+    def _toplu_isi_baslat(self, toplu_is: BatchJob, hizli: Optional[bool] = None):
+        """Yeni veya devam eden işi arka plan thread'inde çalıştırır"""
+        if hizli is None:
+            hizli = toplu_is.total - toplu_is.done > HIZLI_MOD_ESIGI
+        self.toplu_is = toplu_is
+        
+        # Progress bar göster (Duraklat / İptal ile)
+        self.gui_widgets.progress_goster(f"{toplu_is.done}/{toplu_is.total} kitap işleniyor...",
+                                         iptal=self._toplu_isi_iptal_et,
+                                         duraklat=self._toplu_isi_duraklat)
+        if hizli:
+            self.gui_widgets.sonuc_tablosu_ac(toplu_is.total)
         self.root.update()
         
         # Arka planda çalıştır
-        thread = threading.Thread(target=self._excel_kitaplari_arka_planda_doldur, args=(kitaplar,))
+        thread = threading.Thread(target=self._excel_kitaplari_arka_planda_doldur, args=(toplu_is, hizli))
         thread.daemon = True
         thread.start()
     
-    def _excel_kitaplari_arka_planda_doldur(self, kitaplar: list):
-        """Arka planda Excel'den yüklenen kitaplar için otomatik bilgi doldurma yapar"""
+    def _toplu_isi_duraklat(self):
+        """Duraklat / Devam butonu - worker sıradaki kitaptan önce bekler"""
+        toplu_is = self.toplu_is
+        if toplu_is is None or toplu_is.cancelled:
+            return
+        if toplu_is.paused:
+            toplu_is.resume()
+            self.gui_widgets.progress_mesaj_guncelle(f"{toplu_is.done}/{toplu_is.total} kitap işleniyor...")
+        else:
+            toplu_is.pause()
+            self.gui_widgets.progress_mesaj_guncelle(
+                f"⏸ Duraklatıldı ({toplu_is.done}/{toplu_is.total}) - program kapansa da kaldığı yerden devam eder")
+        self.gui_widgets.progress_duraklat_guncelle(toplu_is.paused)
+    
+    def _toplu_isi_iptal_et(self):
+        """İptal butonu - o anki kitap bitince iş durur, işlenenler korunur"""
+        toplu_is = self.toplu_is
+        if toplu_is is None or toplu_is.cancelled:
+            return
+        if messagebox.askyesno("Toplu Doldurmayı İptal Et",
+                               "Toplu doldurma iptal edilsin mi?\n\n"
+                               "İşlenen kitaplar korunur, kalanlar doldurulmaz."):
+            toplu_is.cancel()
+            self.gui_widgets.progress_mesaj_guncelle("İptal ediliyor (o anki kitap bitiyor)...")
+    
+    def _yarim_kalan_isi_sor(self):
+        """
+        Yarıda kalmış (çalışan / duraklatılmış) toplu doldurma işlerini en yenisinden
+        başlayarak tek tek sorar (açılışta ve her toplu iş bitince)
+        
+        ⚠️ DİKKAT: Aynı anda tek iş çalışır - devam ettirilen iş bitince sıradaki iş
+        sorulur (_toplu_is_bitti); iptal edilenler silinir, bekletilenler sonraki açılışa kalır
+        """
+        if self.toplu_is is not None:
+            return
+        isler = [j for j in BatchJob.unfinished(self.is_klasoru) if j.job_id not in self.bekletilen_isler]
+        for sira, toplu_is in enumerate(isler, 1):
+            kalan = len(toplu_is.pending_ids(self.list_manager.getir_kimlik))
+            if kalan == 0:
+                toplu_is.finish()
+                continue
+            
+            baslik = "Yarım Kalan Toplu Doldurma"
+            if len(isler) > 1:
+                baslik += f" ({sira}/{len(isler)})"
+            cevap = messagebox.askyesnocancel(
+                baslik,
+                f"Önceki toplu doldurma işi yarıda kaldı.\n\n"
+                f"✅ İşlenen: {toplu_is.done}/{toplu_is.total} kitap\n"
+                f"⏳ Kalan: {kalan} kitap (bilgisi dolu kitaplar atlanır)\n\n"
+                f"Evet: Kaldığı yerden devam et\n"
+                f"Hayır: İşi iptal et\n"
+                f"İptal: Şimdilik bekle (sonraki açılışta tekrar sorulur)")
+            if cevap is None:
+                self.bekletilen_isler.add(toplu_is.job_id)
+                continue
+            if not cevap:
+                toplu_is.cancel()
+                toplu_is.remove()
+                continue
+            if not self._groq_key_hazir():
+                return
+            toplu_is.resume()
+            self._toplu_isi_baslat(toplu_is)
+            return
+    
+    def _excel_kitaplari_arka_planda_doldur(self, toplu_is: BatchJob, hizli: bool = False):
+        """
+        Arka planda toplu işin kalan kitapları için otomatik bilgi doldurma yapar
+        
+        ⚠️ DİKKAT: Hızlı modda bekleme (sleep) ve form animasyonu yoktur. GUI'ye her şey
+        ilerleme_kanali üzerinden gider (root.after yok) - Tk tarafı kanalı her tick'te
+        bir kez boşaltır, durum son değere indirgenir, sonuç satırları toplu eklenir
+        
+        ⚠️ DİKKAT: Checkpoint aralıkla yazılır (degisiklik_gunlugu.due, CHECKPOINT_INTERVAL):
+        önce değişen satırlar günlüğe / depoya (_checkpoint), sonra biten kitaplar tek yazmayla
+        iş kaydına - çökmede en fazla son aralığın kitapları tekrar çekilir. Duraklatma,
+        iptal ve iş sonunda bekleyenler hemen yazılır
+        """
         import time
+        kanal = self.ilerleme_kanali
+        toplam = toplu_is.total
+        islenen = toplu_is.done
+        basarili = 0
+        basarisiz = 0
+        # Verisi henüz checkpoint'e yazılmamış (row_id, status) - iş kaydına checkpoint'ten sonra
+        kayit_bekleyen = []
+        checkpoint_hatasi = False
+        
+        def sonuc_bildir(*satir):
+            kanal.post_rows([satir])
+            kanal.post_state("sayac", (islenen, toplam, basarili, basarisiz))
+        
+        def checkpoint_yaz() -> bool:
+            # ⚠️ Yazılamazsa satırlar iş kaydına işlenmez (devamda tekrar çekilir), iş duraklatılır
+            nonlocal checkpoint_hatasi
+            try:
+                self._checkpoint()
+            except Exception as e:
+                print(f"Checkpoint kaydetme hatası: {e}")
+                checkpoint_hatasi = True
+                toplu_is.pause()
+                kanal.post_event(lambda hata=e: self._checkpoint_hatasi(hata))
+                return False
+            checkpoint_hatasi = False
+            toplu_is.record_many(kayit_bekleyen)
+            kayit_bekleyen.clear()
+            return True
         
         try:
-            toplam = len(kitaplar)
-            basarili = 0
-            basarisiz = 0
-            
-            for i, kitap in enumerate(kitaplar):
+            # Devamda: işlenmiş ve zaten status=OK olan kitaplar atlanır
+            for kimlik in toplu_is.pending_ids(self.list_manager.getir_kimlik):
+                if toplu_is.paused and kayit_bekleyen and not checkpoint_hatasi:
+                    checkpoint_yaz()  # Duraklatılmış iş kapanışta bir şey kaybetmesin
+                if not toplu_is.wait_if_paused():
+                    break
+                kitap = self.list_manager.getir_kimlik(kimlik)
+                if kitap is None:
+                    continue  # Bu arada listeden silinmiş
                 kitap_adi = kitap.get('Kitap Adı', '').strip()
                 yazar = kitap.get('Yazar', '').strip()
                 
                 if not kitap_adi or not yazar:
                     basarisiz += 1
+                    islenen += 1
+                    kayit_bekleyen.append((kimlik, "FAIL"))
+                    if hizli:
+                        sonuc_bildir(kitap_adi, yazar, "FAIL", "eksik alan")
                     continue
                 
-                # Retry logic: next_retry_at kontrolü
-                next_retry_at = kitap.get('next_retry_at', '')
-                if next_retry_at:
-                    try:
-                        from datetime import datetime
-                        retry_time = datetime.fromisoformat(next_retry_at.replace('Z', '+00:00'))
-                        now = datetime.utcnow()
-                        if now < retry_time:
-                            # Henüz retry zamanı gelmedi, atla
-                            print(f"Retry bekleniyor ({kitap_adi}): {next_retry_at}")
-                            continue
-                    except Exception:
-                        # Parse hatası, devam et
-                        pass
-                
-                # Progress güncelle
-                self.root.after(0, lambda idx=i+1, total=toplam, adi=kitap_adi: 
-                    self.gui_widgets.progress_mesaj_guncelle(f"{idx}/{total} kitap işleniyor... ({adi[:30]}...)")
-                )
-                
-                # ⚠️ ANİMASYON: Formu temizle ve kitap adı/yazarı yükle
-                self.root.after(0, lambda adi=kitap_adi, yaz=yazar: self._animasyon_form_yukle(adi, yaz))
-                time.sleep(0.1)  # GUI güncellemesi için kısa bekleme
-                
-                # Policy modu ile bilgi çek (mevcut kitap bilgilerini kullan)
-                mevcut_kitap = {
-                    "Kitap Adı": kitap_adi,
-                    "Yazar": yazar,
-                    "Orijinal Adı": kitap.get("Orijinal Adı", ""),
-                    "Tür": kitap.get("Tür", ""),
-                    "Ülke/Edebi Gelenek": kitap.get("Ülke/Edebi Gelenek", ""),
-                    "İlk Yayınlanma Tarihi": kitap.get("İlk Yayınlanma Tarihi", ""),
-                    "Anlatı Yılı": kitap.get("Anlatı Yılı", ""),
-                    "Konusu": kitap.get("Konusu", ""),
-                }
+                # Retry logic: next_retry_at zamanı gelmediyse atla
+                if yeniden_deneme_bekliyor(kitap):
+                    next_retry_at = kitap.get('next_retry_at', '')
+                    print(f"Retry bekleniyor ({kitap_adi}): {next_retry_at}")
+                    islenen += 1
+                    kayit_bekleyen.append((kimlik, "BEKLIYOR"))
+                    if hizli:
+                        sonuc_bildir(kitap_adi, yazar, "BEKLIYOR", next_retry_at)
+                    continue
                 
-                try:
-                    # Policy modu ile bilgi çek (status ve provenance dahil)
-                    guncellenen_kitap = self.bilgi_cekici.kitap_bilgisi_cek_policy(kitap_adi, yazar, mevcut_kitap)
-                    
-                    # Sadece form alanlarını çıkar (meta kolonları zaten güncellenmiş)
-                    bilgiler = {
-                        "Orijinal Adı": guncellenen_kitap.get("Orijinal Adı", ""),
-                        "Tür": guncellenen_kitap.get("Tür", ""),
-                        "Ülke/Edebi Gelenek": guncellenen_kitap.get("Ülke/Edebi Gelenek", ""),
-                        "İlk Yayınlanma Tarihi": guncellenen_kitap.get("İlk Yayınlanma Tarihi", ""),
-                        "Anlatı Yılı": guncellenen_kitap.get("Anlatı Yılı", ""),
-                        "Konusu": guncellenen_kitap.get("Konusu", ""),
-                    }
+                if not hizli:
+                    # Progress güncelle
+                    kanal.post_state("mesaj", f"{islenen + 1}/{toplam} kitap işleniyor... ({kitap_adi[:30]}...)")
                     
-                    print(f"Policy modu sonuçları ({kitap_adi}): status={guncellenen_kitap.get('status', 'UNKNOWN')}")
-                except Exception as e:
-                    print(f"Policy modu hatası ({kitap_adi}): {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Hata durumunda mevcut kitabı koru ve status yaz
-                    from field_registry import ensure_row_schema
-                    from provenance import set_row_status
-                    guncellenen_kitap = ensure_row_schema(kitap.copy())
-                    # Hata durumunda FAIL status yaz
-                    set_row_status(
-                        guncellenen_kitap,
-                        status="FAIL",
-                        missing_fields=["Orijinal Adı", "Tür", "Ülke/Edebi Gelenek", "İlk Yayınlanma Tarihi", "Anlatı Yılı", "Konusu"],
-                        best_source="error",
-                        retry_count=1,
-                        next_retry_hours=6
-                    )
-                    bilgiler = {
-                        "Orijinal Adı": kitap.get("Orijinal Adı", ""),
-                        "Tür": kitap.get("Tür", ""),
-                        "Ülke/Edebi Gelenek": kitap.get("Ülke/Edebi Gelenek", ""),
-                        "İlk Yayınlanma Tarihi": kitap.get("İlk Yayınlanma Tarihi", ""),
-                        "Anlatı Yılı": kitap.get("Anlatı Yılı", ""),
-                        "Konusu": kitap.get("Konusu", ""),
-                    }
+                    # ⚠️ ANİMASYON: Formu temizle ve kitap adı/yazarı yükle
+                    # (aynı tick'te birden fazla form adımı gelirse sadece sonuncusu çizilir)
+                    kanal.post_state("form", (self._animasyon_form_yukle, kitap_adi, yazar))
+                    time.sleep(0.1)  # GUI güncellemesi için kısa bekleme
                 
-                # ⚠️ ANİMASYON: Formu doldur (hızlı animasyon)
-                self.root.after(0, lambda bilg=bilgiler: self._animasyon_form_doldur(bilg))
-                time.sleep(0.3)  # Animasyon için kısa bekleme (kullanıcı görebilsin)
+                # Policy modu ile bilgi çek (status ve provenance dahil; hata -> FAIL satırı)
+                guncellenen_kitap = kitabi_zenginlestir(self.bilgi_cekici, kitap)
                 
-                # Listede bul ve güncelle (status ve provenance dahil)
-                # ensure_row_schema ile tüm kolonların olduğundan emin ol
-                from field_registry import ensure_row_schema
-                guncellenen_kitap = ensure_row_schema(guncellenen_kitap)
+                if not hizli:
+                    # ⚠️ ANİMASYON: Formu doldur (sadece form alanları)
+                    bilgiler = {alan: guncellenen_kitap.get(alan, "") for alan in ZENGIN_ALANLAR}
+                    kanal.post_state("form", (self._animasyon_form_doldur, bilgiler))
+                    time.sleep(0.3)  # Animasyon için kısa bekleme (kullanıcı görebilsin)
                 
-                kitap_listesi = self.list_manager.tumunu_getir()
-                for idx, listedeki_kitap in enumerate(kitap_listesi):
-                    if (listedeki_kitap.get('Kitap Adı', '').strip() == kitap_adi and 
-                        listedeki_kitap.get('Yazar', '').strip() == yazar):
-                        # Kitabı güncelle (status ve provenance dahil)
-                        # Mevcut kitabın diğer kolonlarını koru (Not, vb.)
-                        mevcut_kitap = ensure_row_schema(listedeki_kitap.copy())
-                        mevcut_kitap.update(guncellenen_kitap)
-                        self.list_manager.kitap_listesi[idx] = mevcut_kitap
-                        basarili += 1
-                        break
+                # ⚠️ row_id ile O(1) bul ve güncelle - aynı isimli kitaplar karışmaz,
+                # mevcut kitabın diğer kolonları korunur
+                durum = guncellenen_kitap.get('status', '') or ""
+                if sonucu_uygula(self.list_manager, kimlik, guncellenen_kitap) and durum in ("OK", "PARTIAL"):
+                    basarili += 1
                 else:
                     basarisiz += 1
+                kanal.post_ids("guncellenen", [kimlik])
+                islenen += 1
+                kayit_bekleyen.append((kimlik, durum))
                 
-                # Checkpoint: Her 50 kitapta bir Excel'e kaydet
-                if (i + 1) % 50 == 0:
-                    try:
-                        self.excel_handler.kaydet(self.list_manager.tumunu_getir())
-                        print(f"Checkpoint: {i + 1}/{toplam} kitap Excel'e kaydedildi")
-                    except Exception as e:
-                        print(f"Checkpoint kaydetme hatası: {e}")
+                # Checkpoint: Belirli aralıklarla sadece değişen satırlar günlüğe / depoya,
+                # sonra iş kaydı (Excel'in tamamı sadece sonda yazılır)
+                if self.degisiklik_gunlugu.due():
+                    checkpoint_yaz()
                 
-                # ⚠️ ANİMASYON: Formu temizle (sonraki kitap için hazırla)
-                self.root.after(0, self._animasyon_form_temizle)
-                time.sleep(0.1)  # Kısa bekleme
+                if hizli:
+                    sonuc_bildir(kitap_adi, yazar, durum, guncellenen_kitap.get('best_source', '') or "")
+                else:
+                    kanal.post_state("sayac", (islenen, toplam, basarili, basarisiz))
+                    # ⚠️ ANİMASYON: Formu temizle (sonraki kitap için hazırla)
+                    kanal.post_state("form", (self._animasyon_form_temizle,))
+                    time.sleep(0.1)  # Kısa bekleme
             
-            # Son form temizleme
-            self.root.after(0, self._animasyon_form_temizle)
+            if not hizli:
+                # Son form temizleme
+                kanal.post_state("form", (self._animasyon_form_temizle,))
+            
+            # Son checkpoint (iptalde de: işlenenler korunur)
+            if kayit_bekleyen:
+                checkpoint_yaz()
+            
+            iptal_edildi = toplu_is.cancelled
+            if iptal_edildi:
+                toplu_is.remove()
+            elif kayit_bekleyen:
+                # Kaydı yazılamayan satırlar bekliyor - iş sonraki açılışta devam ettirilebilir
+                print(f"Toplu iş açık bırakıldı: {len(kayit_bekleyen)} kitabın checkpoint'i yazılamadı")
+            else:
+                toplu_is.finish()
             
             # Final checkpoint: Tüm kitapları Excel'e kaydet (status ve provenance dahil)
-            try:
-                self.excel_handler.kaydet(self.list_manager.tumunu_getir())
-                print(f"Final checkpoint: Tüm kitaplar Excel'e kaydedildi")
-            except Exception as e:
-                print(f"Final checkpoint kaydetme hatası: {e}")
+            # Arka plan yazıcısına bırakılır (aynı anda istenen kayıtlarla birleşir)
+            self.kaydetme_kuyrugu.request(lambda sonuc: print(
+                "Final checkpoint: Tüm kitaplar Excel'e kaydedildi" if sonuc and sonuc[0]
+                else "Final checkpoint: Excel yazılamadı, değişiklikler günlükte bekliyor"))
             
             # Listeyi güncelle
-            self.root.after(0, self.listeyi_guncelle)
+            kanal.post_event(self.listeyi_guncelle)
             
-            # Sonuç mesajı
-            self.root.after(0, lambda: messagebox.showinfo(
-                "✅ Tamamlandı",
-                f"📚 Otomatik bilgi doldurma tamamlandı!\n\n"
+            # Sonuç mesajı (olaylar bekleyen ilerleme/satırlardan sonra çalışır)
+            baslik = "⏹ İptal Edildi" if iptal_edildi else "✅ Tamamlandı"
+            ozet = (f"📚 Otomatik bilgi doldurma iptal edildi ({islenen}/{toplam} kitap işlendi).\n\n"
+                    if iptal_edildi else "📚 Otomatik bilgi doldurma tamamlandı!\n\n")
+            kanal.post_event(lambda: messagebox.showinfo(
+                baslik,
+                f"{ozet}"
                 f"✅ Başarılı: {basarili} kitap\n"
                 f"❌ Başarısız: {basarisiz} kitap\n\n"
                 f"💡 Listeden bir kitaba çift tıklayarak detayları görebilirsiniz."
             ))
             
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror(
+            # İş diskte kalır - sonraki açılışta kaldığı yerden devam edilebilir
+            kanal.post_event(lambda hata=e: messagebox.showerror(
                 "❌ Hata",
-                f"Otomatik bilgi doldurma sirasinda hata olustu:\n\n{str(e)}"
+                f"Otomatik bilgi doldurma sirasinda hata olustu:\n\n{str(hata)}\n\n"
+                f"İşlenen kitaplar kaydedildi; program yeniden açılınca kaldığı yerden devam edilebilir."
             ))
         finally:
-            self.root.after(0, self.gui_widgets.progress_gizle)
+            kanal.post_event(self._toplu_is_bitti)
+    
+    def _checkpoint_hatasi(self, hata: Exception):
+        """Checkpoint yazılamadı - iş duraklatıldı, kullanıcı sorunu giderip Devam'a basar (Tk thread'inde)"""
+        toplu_is = self.toplu_is
+        if toplu_is is not None:
+            self.gui_widgets.progress_duraklat_guncelle(toplu_is.paused)
+            self.gui_widgets.progress_mesaj_guncelle(
+                f"⏸ Duraklatıldı ({toplu_is.done}/{toplu_is.total}) - kayıt yazılamadı")
+        messagebox.showwarning(
+            "⚠️ Kayıt Yazılamadı",
+            f"Son kitabın sonucu diske yazılamadı:\n\n{hata}\n\n"
+            f"Toplu doldurma duraklatıldı. Disk / dosya sorununu giderip '▶ Devam' ile sürdürebilirsiniz; "
+            f"yazılamayan kitap sonraki devamda tekrar işlenir.")
+    
+    def _toplu_is_bitti(self):
+        """Worker bitince (Tk thread'inde) kontrolleri kaldırır, sıradaki yarım işi sorar"""
+        if self.toplu_is is not None:
+            # Açık kalan iş (checkpoint yazılamadı vb.) bu oturumda hemen tekrar sorulmaz
+            self.bekletilen_isler.add(self.toplu_is.job_id)
+        self.toplu_is = None
+        self.gui_widgets.progress_gizle()
+        self._yarim_kalan_isi_sor()
+    
+    def _ilerleme_uygula(self, durum: dict, satirlar: list):
+        """
+        İlerleme kanalından tick başına bir kez çağrılır (Tk thread'inde)
+        
+        Args:
+            durum: Anahtar başına son değer ("mesaj", "form", "sayac";
+                "eklenen" / "guncellenen": row_id kümesi)
+            satirlar: Bu tick'te biriken sonuç satırları (hızlı mod tablosu)
+        """
+        if "mesaj" in durum:
+            self.gui_widgets.progress_mesaj_guncelle(durum["mesaj"])
+        if "form" in durum:
+            adim, *argumanlar = durum["form"]
+            adim(*argumanlar)
+        if "eklenen" in durum:
+            # İçe aktarılan parçalar - kimlikler dosya sırasıyla verildiği için sıralı eklenir
+            kitaplar = (self.list_manager.getir_kimlik(kimlik) for kimlik in sorted(durum["eklenen"]))
+            self.gui_widgets.satirlari_ekle([kitap for kitap in kitaplar if kitap is not None])
+        if satirlar:
+            self.gui_widgets.sonuc_tablosu_ekle(satirlar)
+        if "sayac" in durum:
+            islenen, toplam, basarili, basarisiz = durum["sayac"]
+            self.gui_widgets.progress_mesaj_guncelle(f"{islenen}/{toplam} kitap işlendi")
+            self.gui_widgets.sonuc_ozeti_guncelle(islenen, toplam, basarili, basarisiz)
+        if "guncellenen" in durum:
+            # ⚠️ Sadece bu tick'te değişen satırlar (tam listeyi_guncelle 100k satırda ~37 ms -
+            # toplu iş sonunda bir kez yapılır)
+            kitaplar = (self.list_manager.getir_kimlik(kimlik) for kimlik in durum["guncellenen"])
+            self.gui_widgets.satirlari_guncelle([kitap for kitap in kitaplar if kitap is not None])
     
     def _animasyon_form_yukle(self, kitap_adi: str, yazar: str):
         """Animasyon için formu kitap adı ve yazar ile yükler"""
@@ -0,0 +1,212 @@
+"""
+Persistent batch enrichment jobs. A job is an append-only JSONL file next to
+the library (Kutuphanem.jobs/<job_id>.jsonl): a header with the ordered row
+ids, then one line per finished row and one per state change. Finished rows
+are recorded in one write right after the checkpoint that persisted their
+data, so a crash or restart repeats at most the lookups of one checkpoint
+interval and never loses a row that is already recorded. The same object
+carries the runtime pause / resume / cancel controls for the worker thread.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from field_registry import parse_row_id
+
+# İş durumları
+RUNNING = "running"
+PAUSED = "paused"
+CANCELLED = "cancelled"
+DONE = "done"
+
+
+class BatchJob:
+    """
+    Toplu doldurma işi: kimlik, sıralı row_id'ler, imleç ve satır başına sonuç
+
+    Dosya satırları:
+        {"job_id": ..., "created": ..., "source": ..., "row_ids": [...]}  (başlık)
+        {"row_id": n, "status": "OK"}                                     (satır bitti)
+        {"state": "paused"}                                               (durum değişti)
+
+    ⚠️ DİKKAT: record() / record_many() satırın verisi günlüğe / depoya yazıldıktan SONRA çağrılmalı -
+    kayıtlı satır devamda atlanır, verisi yazılmamışsa sonuç kaybolur
+    """
+
+    def __init__(self, path: str, job_id: str, row_ids: Sequence[int], created: float,
+                 source: str = ""):
+        self.path = path
+        self.job_id = job_id
+        self.row_ids: List[int] = list(row_ids)
+        self.created = created
+        self.source = source
+        self.state = RUNNING
+        self.results: Dict[int, str] = {}
+        # İmleç: bu sıradan önceki tüm satırlar bitti (sıralı çalışmada işlenen sayısı)
+        self.cursor = 0
+        self._lock = threading.Lock()
+        self._resume = threading.Event()
+        self._resume.set()
+
+    @staticmethod
+    def jobs_dir_for(excel_path: str) -> str:
+        """Excel dosyasının yanındaki iş klasörü (Kutuphanem.xlsx -> Kutuphanem.jobs)"""
+        base, _ = os.path.splitext(excel_path)
+        return f"{base}.jobs"
+
+    @classmethod
+    def create(cls, jobs_dir: str, row_ids: Sequence[int], source: str = "") -> "BatchJob":
+        """Yeni iş oluşturur ve başlığını diske yazar"""
+        os.makedirs(jobs_dir, exist_ok=True)
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        job = cls(os.path.join(jobs_dir, f"{job_id}.jsonl"), job_id, row_ids, time.time(), source)
+        job._write({"job_id": job_id, "created": job.created, "source": source, "row_ids": job.row_ids})
+        return job
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BatchJob"]:
+        """İşi dosyasından kurar (yarım yazılmış son satır atlanır); okunamazsa None"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                lines = f.readlines()
+            header = json.loads(lines[0])
+            job = cls(path, header["job_id"], header["row_ids"], header.get("created", 0.0),
+                      header.get("source", ""))
+        except (OSError, IndexError, KeyError, ValueError) as e:
+            print(f"Toplu iş okunamadı ({path}): {e}")
+            return None
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if "state" in entry:
+                job.state = entry["state"]
+            else:
+                row_id = parse_row_id(entry.get("row_id"))
+                if row_id is not None:
+                    job.results[row_id] = entry.get("status", "")
+        job._advance()
+        if job.state == PAUSED:
+            job._resume.clear()
+        return job
+
+    @classmethod
+    def unfinished(cls, jobs_dir: str) -> List["BatchJob"]:
+        """Bitmemiş (çalışan veya duraklatılmış) işler, en yenisi başta"""
+        if not os.path.isdir(jobs_dir):
+            return []
+        jobs = [cls.load(os.path.join(jobs_dir, ad)) for ad in os.listdir(jobs_dir) if ad.endswith(".jsonl")]
+        jobs = [job for job in jobs if job is not None and job.state in (RUNNING, PAUSED)]
+        return sorted(jobs, key=lambda job: job.created, reverse=True)
+
+    @property
+    def total(self) -> int:
+        return len(self.row_ids)
+
+    @property
+    def done(self) -> int:
+        """Sonucu kaydedilmiş satır sayısı"""
+        return len(self.results)
+
+    @property
+    def paused(self) -> bool:
+        return self.state == PAUSED
+
+    @property
+    def cancelled(self) -> bool:
+        return self.state == CANCELLED
+
+    def pending_ids(self, lookup: Optional[Callable[[int], Optional[Mapping]]] = None) -> List[int]:
+        """
+        İmleçten itibaren sonucu kaydedilmemiş row_id'ler
+
+        Args:
+            lookup: row_id -> güncel satır (ListManager.getir_kimlik); verilirse listeden
+                    silinmiş ve zaten status=OK olan satırlar da atlanır
+        """
+        pending = [k for k in self.row_ids[self.cursor:] if k not in self.results]
+        if lookup is None:
+            return pending
+        result = []
+        for row_id in pending:
+            row = lookup(row_id)
+            if row is not None and row.get("status") != "OK":
+                result.append(row_id)
+        return result
+
+    def record(self, row_id: int, status: str) -> None:
+        """Satırın sonucunu kaydeder (diske hemen yazılır) ve imleci ilerletir"""
+        self.record_many([(row_id, status)])
+
+    def record_many(self, rows: Sequence[Tuple[int, str]]) -> None:
+        """Birden fazla satırın sonucunu tek yazma (tek fsync) ile kaydeder"""
+        if not rows:
+            return
+        with self._lock:
+            for row_id, status in rows:
+                self.results[row_id] = status
+            self._advance()
+            self._write(*({"row_id": row_id, "status": status} for row_id, status in rows))
+
+    def pause(self) -> None:
+        """Worker sıradaki satırdan önce bekler (durum diske yazılır - yeniden açılışta da duraklatılmış)"""
+        if self._set_state(PAUSED):
+            self._resume.clear()
+
+    def resume(self) -> None:
+        self._set_state(RUNNING)
+        self._resume.set()
+
+    def cancel(self) -> None:
+        """Worker o anki satırı bitirip durur; iş devam listesine bir daha gelmez"""
+        self._set_state(CANCELLED)
+        self._resume.set()
+
+    def finish(self) -> None:
+        """Tüm satırlar bitti - iş dosyası silinir"""
+        self._set_state(DONE)
+        self.remove()
+
+    def wait_if_paused(self) -> bool:
+        """
+        Duraklatılmışsa devam veya iptal edilene kadar bekler (worker thread'i)
+
+        Returns:
+            İş sürecekse True, iptal edildiyse False
+        """
+        self._resume.wait()
+        return not self.cancelled
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _set_state(self, state: str) -> bool:
+        """Durumu değiştirir ve yazar (iptal edilmiş / bitmiş iş değişmez)"""
+        with self._lock:
+            if self.state in (CANCELLED, DONE) or self.state == state:
+                return False
+            self.state = state
+            self._write({"state": state})
+            return True
+
+    def _advance(self) -> None:
+        while self.cursor < len(self.row_ids) and self.row_ids[self.cursor] in self.results:
+            self.cursor += 1
+
+    def _write(self, *entries: Dict) -> None:
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries))
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            # Diske yazılamazsa iş bellekte sürer; sadece devam bilgisi eksik kalır
+            print(f"Toplu iş kaydetme hatası: {e}")
@@ -0,0 +1,177 @@
+"""
+Headless batch enrichment: load a table, run every row that still needs work
+through the policy fetch on a thread pool, checkpoint finished rows into the
+change journal on an interval (then into the job file, batch_job.py) and write
+the result. Progress is reported as plain dicts through a callback
+(the command-line entry point prints them as JSON lines). No Tk anywhere, so it
+runs on a server or from a scheduler.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from batch_job import BatchJob
+from change_journal import CHECKPOINT_INTERVAL, ChangeJournal
+from enrichment import kitabi_zenginlestir, sonucu_uygula, yeniden_deneme_bekliyor
+from excel_handler import ExcelHandler
+from field_registry import ROW_ID_COLUMN
+from list_manager import ListManager
+
+# Varsayılan eşzamanlı istek sayısı (iş ağ bekleme ağırlıklı, CPU değil)
+VARSAYILAN_IS_SAYISI = 4
+
+
+def _yarim_kalan_is(jobs_dir: str, girdi: str) -> Optional[BatchJob]:
+    """Aynı girdi için yarıda kalmış (çalışan / duraklatılmış) en yeni iş"""
+    for job in BatchJob.unfinished(jobs_dir):
+        if job.source == girdi:
+            return job
+    return None
+
+
+def toplu_zenginlestir(girdi: str, cikti: str, bilgi_cekici,
+                       is_sayisi: int = VARSAYILAN_IS_SAYISI,
+                       bildir: Optional[Callable[[Dict], None]] = None,
+                       yeni: bool = False,
+                       checkpoint_araligi: float = CHECKPOINT_INTERVAL) -> Dict:
+    """
+    Girdi dosyasındaki kitapları zenginleştirip çıktıya yazar
+
+    Args:
+        girdi: Kaynak tablo (.xlsx / .csv / .parquet)
+        cikti: Hedef dosya; yanındaki .journal.jsonl checkpoint günlüğü, .jobs/ iş kayıtlarıdır
+        bilgi_cekici: KitapBilgisiCekici (tüm worker'lar aynı nesneyi paylaşır)
+        is_sayisi: Eşzamanlı istek sayısı
+        bildir: Her olayda dict ile çağrılır ("start", "row", "checkpoint", "done", ...)
+        yeni: Yarıda kalmış işi ve checkpoint günlüğünü atıp baştan başla
+        checkpoint_araligi: Günlüğe yazma aralığı (saniye) - çökmede en fazla bu kadarlık
+            sonuç tekrar çekilir (Ctrl+C'de bekleyenler yazılır)
+
+    Returns:
+        Son olay (event: "done", "interrupted" veya "error")
+
+    ⚠️ DİKKAT: İş ve günlük çıktı dosyasına bağlıdır - yarıda kalan iş aynı girdi ve
+    çıktı ile yeniden çalıştırılınca kaldığı yerden devam eder (kaydı olan ve zaten
+    status=OK olan satırlar tekrar çekilmez)
+    """
+    bildir = bildir or (lambda olay: None)
+    baslangic = time.monotonic()
+
+    def olay(ad: str, **alanlar) -> Dict:
+        kayit = {"event": ad, **alanlar, "elapsed": round(time.monotonic() - baslangic, 2)}
+        bildir(kayit)
+        return kayit
+
+    try:
+        kitaplar = ExcelHandler().disaridan_yukle(girdi)
+    except Exception as e:
+        return olay("error", message=str(e))
+    if kitaplar is None:
+        return olay("error", message=f"Dosya okunamadı: {girdi}")
+
+    list_manager = ListManager(kitaplar)
+    gunluk = ChangeJournal.for_excel(cikti, checkpoint_araligi)
+    jobs_dir = BatchJob.jobs_dir_for(cikti)
+    kaynak = os.path.abspath(girdi)
+    toplu_is = _yarim_kalan_is(jobs_dir, kaynak)
+    if yeni:
+        # ⚠️ Baştan başlarken eski işin günlüğü de atılır - oynatılırsa eski sonuçlar
+        # girdinin üzerine gelir ve yeni iş onları tekrar çeker
+        if toplu_is is not None:
+            toplu_is.cancel()
+            toplu_is.remove()
+            toplu_is = None
+        gunluk.clear()
+    elif gunluk.pending():
+        gunluk.replay_into(list_manager)
+
+    if toplu_is is not None:
+        toplu_is.resume()
+        yapilacak: List[Dict] = [list_manager.getir_kimlik(kimlik)
+                                 for kimlik in toplu_is.pending_ids(list_manager.getir_kimlik)]
+    else:
+        yapilacak = list(list_manager.anlik_goruntu())
+    yapilacak = [kitap for kitap in yapilacak if not yeniden_deneme_bekliyor(kitap)]
+    devam = toplu_is.done if toplu_is is not None else 0
+    if toplu_is is None:
+        toplu_is = BatchJob.create(jobs_dir, [kitap[ROW_ID_COLUMN] for kitap in yapilacak], source=kaynak)
+    toplam = len(yapilacak)
+    olay("start", input=girdi, output=cikti, job_id=toplu_is.job_id, rows=list_manager.sayi(),
+         total=toplam, resumed=devam, workers=is_sayisi)
+
+    # Verisi henüz günlüğe yazılmamış (row_id, status) - iş kaydına checkpoint'ten sonra
+    kayit_bekleyen: List = []
+
+    def checkpoint() -> int:
+        # Önce satırların verisi günlüğe, sonra tek yazmayla iş kaydına
+        degisenler, silinenler = list_manager.degisiklikleri_al()
+        yazilan = gunluk.append(degisenler, silinenler)
+        toplu_is.record_many(kayit_bekleyen)
+        kayit_bekleyen.clear()
+        return yazilan
+
+    biten = basarili = basarisiz = 0
+    kuyruk = iter(yapilacak)
+    havuz = ThreadPoolExecutor(max_workers=is_sayisi)
+    bekleyen = {}
+
+    def gonder():
+        # Bellekte en fazla 2 x is_sayisi iş bekler (100k satır bir anda kuyruğa girmez)
+        while len(bekleyen) < is_sayisi * 2:
+            kitap = next(kuyruk, None)
+            if kitap is None:
+                return
+            bekleyen[havuz.submit(kitabi_zenginlestir, bilgi_cekici, kitap)] = kitap[ROW_ID_COLUMN]
+
+    try:
+        gonder()
+        while bekleyen:
+            bitenler, _ = wait(bekleyen, return_when=FIRST_COMPLETED)
+            kesinti = None
+            for is_ in bitenler:
+                kimlik = bekleyen.pop(is_)
+                try:
+                    guncellenen_kitap = is_.result()
+                except KeyboardInterrupt as e:
+                    # Aynı anda biten diğer satırlar önce işlenir (sonuçları kaybolmaz)
+                    kesinti = e
+                    continue
+                sonucu_uygula(list_manager, kimlik, guncellenen_kitap)
+                durum = guncellenen_kitap.get('status', '')
+                kayit_bekleyen.append((kimlik, durum))
+                biten += 1
+                if durum in ("OK", "PARTIAL"):
+                    basarili += 1
+                else:
+                    basarisiz += 1
+                olay("row", done=biten, total=toplam, ok=basarili, fail=basarisiz,
+                     row_id=kimlik, status=durum)
+            if kesinti is not None:
+                raise kesinti
+            if gunluk.due():
+                olay("checkpoint", written=checkpoint(), done=biten)
+            gonder()
+    except KeyboardInterrupt:
+        # Çalışan istekler bitmeden çıkılır; sonuçları gelmeyen satırlar devamda yeniden denenir
+        havuz.shutdown(wait=False, cancel_futures=True)
+        olay("checkpoint", written=checkpoint(), done=biten)
+        return olay("interrupted", job_id=toplu_is.job_id, done=biten, total=toplam,
+                    ok=basarili, fail=basarisiz)
+    havuz.shutdown()
+
+    # Önce günlük, sonra tam kayıt: kayıt başarısız olursa iş kaybolmaz
+    # (iş de açık kalır - sonraki çalıştırma sadece kaydı yeniden dener)
+    checkpoint()
+    satirlar = list_manager.anlik_goruntu()
+    handler = ExcelHandler(cikti)
+    if os.path.splitext(cikti)[1].lower() == ".xlsx":
+        kaydedildi = handler.kaydet(satirlar)
+    else:
+        kaydedildi = handler.disari_aktar(satirlar, cikti)
+    if not kaydedildi:
+        return olay("error", message=f"Kaydedilemedi: {cikti}", done=biten, total=toplam)
+    toplu_is.finish()
+    gunluk.clear()
+    return olay("done", job_id=toplu_is.job_id, output=cikti, done=biten, total=toplam, ok=basarili, fail=basarisiz)
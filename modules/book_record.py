@@ -0,0 +1,253 @@
+"""
+Compact row representation for the book list.
+BookRecord keeps the standard columns in __slots__ and encodes row status,
+best source and provenance (src_*/conf_*) as small integers, while behaving
+as a MutableMapping so dict-based callers keep working.
+"""
+
+from array import array
+from collections.abc import MutableMapping
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional
+
+from field_registry import ROW_ID_COLUMN, PROVENANCE_FIELDS
+
+# Excel kolonu -> slot adı (sıra standard_columns() ile aynı)
+COLUMN_SLOTS: Dict[str, str] = {
+    "Kitap Adı": "kitap_adi",
+    "Yazar": "yazar",
+    "Orijinal Adı": "orijinal_adi",
+    "Tür": "tur",
+    "Ülke/Edebi Gelenek": "ulke",
+    "İlk Yayınlanma Tarihi": "ilk_yayin",
+    "Anlatı Yılı": "anlati_yili",
+    "Konusu": "konusu",
+    ROW_ID_COLUMN: "row_id",
+}
+_SLOT_ITEMS = tuple(COLUMN_SLOTS.items())
+
+STATUS_KEY = "status"
+BEST_SOURCE_KEY = "best_source"
+
+# Kodlanan anahtarlar tek bir array('h') içinde tutulur:
+# [status, best_source, src_<alan>..., conf_<alan>...]  (0 = yok)
+CODED_KEYS: List[str] = (
+    [STATUS_KEY, BEST_SOURCE_KEY]
+    + [f"src_{k}" for k in PROVENANCE_FIELDS.values()]
+    + [f"conf_{k}" for k in PROVENANCE_FIELDS.values()]
+)
+_CODED_INDEX = {key: i for i, key in enumerate(CODED_KEYS)}
+_CONF_START = 2 + len(PROVENANCE_FIELDS)
+_YOK = object()
+_CONF_CODES: Dict[str, int] = {}
+
+
+class RowStatus(IntEnum):
+    """set_row_status() durum kodları (0 = yok)"""
+    OK = 1
+    PARTIAL = 2
+    FAIL = 3
+
+
+_STATUS_CODES = {s.name: s.value for s in RowStatus}
+_STATUS_NAMES = [None] + [s.name for s in RowStatus]
+
+
+class SourceTable:
+    """
+    Kaynak adlarını küçük tamsayılara çevirir (0 = yok).
+    Bilinmeyen adlar sınıra kadar tabloya eklenir; sınır aşılırsa kodlanmaz.
+    """
+
+    def __init__(self, names: List[str], limit: int = 1024):
+        self._names: List[Optional[str]] = [None]
+        self._codes: Dict[str, int] = {}
+        self.limit = limit
+        for name in names:
+            self.encode(name)
+
+    def encode(self, name) -> int:
+        code = self._codes.get(name) if isinstance(name, str) else 0
+        if code is None:
+            if len(self._names) >= self.limit:
+                return 0
+            code = len(self._names)
+            self._names.append(name)
+            self._codes[name] = code
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return self._names[code]
+
+
+SOURCES = SourceTable(["", "groq", "hf", "together", "openlibrary", "wikidata", "wikipedia", "manual"])
+
+
+def _encode(position: int, value) -> int:
+    """Değeri konumuna göre kodlar; kodlanamıyorsa 0 (değer _ekstra'ya gider)"""
+    if position == 0:
+        return _STATUS_CODES.get(value, 0) if isinstance(value, str) else 0
+    if position < _CONF_START:
+        return SOURCES.encode(value)
+    # conf: provenance.set_field biçimi "0.80" -> 81 (yüzdelik + 1)
+    if not isinstance(value, str):
+        return 0
+    code = _CONF_CODES.get(value)
+    if code is None:
+        try:
+            code = int(round(float(value) * 100))
+        except (ValueError, OverflowError):
+            # "abc" / "nan" ValueError, "inf" / "1e400" OverflowError - ham metin saklanır
+            code = -1
+        code = code + 1 if 0 <= code < 32767 and f"{code / 100:.2f}" == value else 0
+        if len(_CONF_CODES) < 4096:
+            _CONF_CODES[value] = code
+    return code
+
+
+def _decode(position: int, code: int) -> str:
+    if position == 0:
+        return _STATUS_NAMES[code]
+    if position < _CONF_START:
+        return SOURCES.decode(code)
+    return f"{(code - 1) / 100:.2f}"
+
+
+class BookRecord(MutableMapping):
+    """
+    Tek kitap satırı (dict yerine)
+
+    ⚠️ DİKKAT: Anahtar seti dict ile aynı davranır
+    - Standart kolonlar slot'larda, atanmamış slot = anahtar yok
+    - status / best_source / src_* / conf_* kodlanmış tutulur (bkz. CODED_KEYS)
+    - Kodlanamayan değerler ve diğer anahtarlar (Not, missing_fields vb.) _ekstra dict'inde
+    """
+
+    __slots__ = tuple(COLUMN_SLOTS.values()) + ("_kod", "_ekstra")
+
+    def __init__(self, data=None, **kwargs):
+        self._kod: Optional[array] = None
+        self._ekstra: Optional[Dict] = None
+        if data is not None:
+            # Hızlı yol: standart kolonlar doğrudan slot'a yazılır
+            items = data.items() if hasattr(data, "items") else data
+            for key, value in items:
+                slot = COLUMN_SLOTS.get(key)
+                if slot is not None:
+                    setattr(self, slot, value)
+                else:
+                    self[key] = value
+        if kwargs:
+            self.update(kwargs)
+
+    @classmethod
+    def from_row(cls, row) -> "BookRecord":
+        """Satır zaten BookRecord ise aynen döndürür, değilse dönüştürür"""
+        return row if isinstance(row, cls) else cls(row)
+
+    def __getitem__(self, key):
+        slot = COLUMN_SLOTS.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        ekstra = self._ekstra
+        if ekstra is not None and key in ekstra:
+            return ekstra[key]
+        position = _CODED_INDEX.get(key)
+        if position is not None and self._kod is not None:
+            code = self._kod[position]
+            if code:
+                return _decode(position, code)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        slot = COLUMN_SLOTS.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+            return
+        position = _CODED_INDEX.get(key)
+        if position is not None:
+            code = _encode(position, value)
+            if code:
+                if self._ekstra is not None:
+                    self._ekstra_sil(key)
+                if self._kod is None:
+                    self._kod = array("h", bytes(2 * len(CODED_KEYS)))
+                self._kod[position] = code
+                return
+            if self._kod is not None:
+                self._kod[position] = 0
+        if self._ekstra is None:
+            self._ekstra = {}
+        self._ekstra[key] = value
+
+    def __delitem__(self, key):
+        slot = COLUMN_SLOTS.get(key)
+        if slot is not None:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._ekstra is not None and key in self._ekstra:
+            self._ekstra_sil(key)
+            return
+        position = _CODED_INDEX.get(key)
+        if position is None or self._kod is None or not self._kod[position]:
+            raise KeyError(key)
+        self._kod[position] = 0
+
+    def _ekstra_sil(self, key):
+        self._ekstra.pop(key, None)
+        if not self._ekstra:
+            self._ekstra = None
+
+    def __iter__(self) -> Iterator[str]:
+        for column, slot in _SLOT_ITEMS:
+            if hasattr(self, slot):
+                yield column
+        if self._kod is not None:
+            for position, code in enumerate(self._kod):
+                if code:
+                    yield CODED_KEYS[position]
+        if self._ekstra is not None:
+            yield from self._ekstra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def to_dict(self) -> Dict:
+        """Düz dict kopyası (anahtar sırası __iter__ ile aynı)"""
+        out = {}
+        for column, slot in _SLOT_ITEMS:
+            value = getattr(self, slot, _YOK)
+            if value is not _YOK:
+                out[column] = value
+        if self._kod is not None:
+            for position, code in enumerate(self._kod):
+                if code:
+                    out[CODED_KEYS[position]] = _decode(position, code)
+        if self._ekstra is not None:
+            out.update(self._ekstra)
+        return out
+
+    def items(self):
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def copy(self) -> "BookRecord":
+        return BookRecord(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"BookRecord({self.to_dict()!r})"
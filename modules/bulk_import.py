@@ -0,0 +1,143 @@
+"""
+Bulk import of many external workbooks at once.
+Folders are expanded to supported files, every xlsx sheet becomes its own task,
+and tasks are parsed in a process pool (openpyxl parsing is CPU-bound, so threads
+would serialize on the GIL). Rows are merged in task order with a content-hash
+dedup before they reach ListManager, and a per-source report is returned.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from excel_handler import ExcelHandler, CSV_UZANTILARI, PARQUET_UZANTILARI
+from near_duplicates import normalize_author, normalize_title
+
+# Klasör taramasında alınan uzantılar
+DESTEKLENEN_UZANTILAR = (".xlsx", ".xlsm") + CSV_UZANTILARI + PARQUET_UZANTILARI
+
+# (dosya, sayfa) - sayfa None: CSV/Parquet veya tek sayfa
+Gorev = Tuple[str, Optional[str]]
+
+
+def dosyalari_topla(yollar: Iterable[str]) -> List[str]:
+    """
+    Dosya ve klasörleri desteklenen dosyalara açar (klasörler alt klasörleriyle, sıralı)
+
+    ⚠️ DİKKAT: Excel'in açık dosya kilitleri (~$Kitap.xlsx) atlanır
+    """
+    dosyalar = []
+    for yol in yollar:
+        if os.path.isdir(yol):
+            for kok, _, adlar in sorted(os.walk(yol)):
+                dosyalar.extend(os.path.join(kok, ad) for ad in sorted(adlar)
+                                if ad.lower().endswith(DESTEKLENEN_UZANTILAR) and not ad.startswith("~$"))
+        else:
+            dosyalar.append(yol)
+    # Aynı dosya iki kez verilirse bir kez okunur
+    return list(dict.fromkeys(os.path.abspath(d) for d in dosyalar))
+
+
+def kayit_ozeti(kitap: Dict) -> str:
+    """Başlık + yazar özeti (katlanmış, baskı gürültüsü atılmış) - tekrar anahtarı"""
+    anahtar = f"{normalize_title(str(kitap.get('Kitap Adı', '')))}\x1f" \
+              f"{normalize_author(str(kitap.get('Yazar', '')))}"
+    return hashlib.blake2b(anahtar.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _gorevleri_olustur(dosyalar: List[str]) -> Tuple[List[Gorev], List[Dict]]:
+    """Her xlsx sayfası ayrı görev; açılamayan dosyalar doğrudan rapora hata olarak düşer"""
+    handler = ExcelHandler()
+    gorevler, hatalar = [], []
+    for dosya in dosyalar:
+        try:
+            gorevler.extend((dosya, sayfa) for sayfa in handler.sayfa_adlari(dosya))
+        except Exception as e:
+            hatalar.append(_rapor_satiri((dosya, None), hata=str(e)))
+    return gorevler, hatalar
+
+
+def _gorevi_oku(gorev: Gorev) -> Tuple[Gorev, Optional[List[Dict]], Optional[str]]:
+    """İşçi süreçte bir sayfayı okur (modül seviyesinde - pickle edilebilmeli)"""
+    dosya, sayfa = gorev
+    try:
+        kitaplar = []
+        for parca in ExcelHandler().disaridan_parcali_yukle(dosya, sayfa=sayfa):
+            kitaplar.extend(parca)
+        return gorev, kitaplar, None
+    except Exception as e:
+        return gorev, None, str(e)
+
+
+def _rapor_satiri(gorev: Gorev, okunan: int = 0, hata: Optional[str] = None) -> Dict:
+    return {"dosya": gorev[0], "sayfa": gorev[1], "okunan": okunan,
+            "eklenen": 0, "tekrar": 0, "hata": hata}
+
+
+def toplu_ice_aktar(yollar: Iterable[str], list_manager,
+                    is_sayisi: Optional[int] = None,
+                    ilerleme: Optional[Callable[[int, int, Gorev], None]] = None) -> Dict:
+    """
+    Dosyaları/klasörleri paralel okuyup tekrarları eleyerek listeye ekler
+
+    Args:
+        yollar: Dosya ve/veya klasör yolları
+        list_manager: Satırların ekleneceği ListManager
+        is_sayisi: Süreç sayısı (None: çekirdek sayısı; 1: süreç havuzu kurulmaz)
+        ilerleme: Her görev bitince (biten, toplam görev, (dosya, sayfa)) ile çağrılır
+
+    Returns:
+        {
+            'eklenen': [eklenen kitaplar],
+            'atlanan': [atlanan kitap adları (listede veya önceki kaynakta var)],
+            'kaynaklar': [{'dosya', 'sayfa', 'okunan', 'eklenen', 'tekrar', 'hata'}]
+        }
+
+    ⚠️ DİKKAT: Birleştirme görev sırasıyla yapılır - hangi süreç önce biterse bitsin
+    aynı girdide aynı kitap aynı kaynaktan eklenir
+    """
+    gorevler, hatalar = _gorevleri_olustur(dosyalari_topla(yollar))
+    is_sayisi = max(1, min(is_sayisi or os.cpu_count() or 1, len(gorevler) or 1))
+
+    sonuclar: Dict[Gorev, Tuple[Optional[List[Dict]], Optional[str]]] = {}
+
+    def tamamlandi(gorev, kitaplar, hata):
+        sonuclar[gorev] = (kitaplar, hata)
+        if ilerleme is not None:
+            ilerleme(len(sonuclar), len(gorevler), gorev)
+
+    if is_sayisi == 1:
+        for gorev in gorevler:
+            tamamlandi(*_gorevi_oku(gorev))
+    else:
+        with ProcessPoolExecutor(max_workers=is_sayisi) as havuz:
+            for gelecek in as_completed([havuz.submit(_gorevi_oku, g) for g in gorevler]):
+                tamamlandi(*gelecek.result())
+
+    # Mevcut liste + önceki kaynaklar tek özet kümesinde
+    gorulen = {kayit_ozeti(k) for k in list_manager.anlik_goruntu()}
+    eklenen, atlanan, kaynaklar = [], [], list(hatalar)
+    for gorev in gorevler:
+        kitaplar, hata = sonuclar[gorev]
+        satir = _rapor_satiri(gorev, len(kitaplar or ()), hata)
+        kaynaklar.append(satir)
+        if not kitaplar:
+            continue
+
+        yeni = []
+        for kitap in kitaplar:
+            ozet = kayit_ozeti(kitap)
+            if ozet in gorulen:
+                atlanan.append(kitap.get("Kitap Adı", ""))
+            else:
+                gorulen.add(ozet)
+                yeni.append(kitap)
+
+        sonuc = list_manager.toplu_ekle(yeni, tekrar_kontrol=True)
+        eklenen.extend(sonuc['eklenen'])
+        atlanan.extend(sonuc['atlanan'])
+        satir["eklenen"] = len(sonuc['eklenen'])
+        satir["tekrar"] = satir["okunan"] - satir["eklenen"]
+
+    return {'eklenen': eklenen, 'atlanan': atlanan, 'kaynaklar': kaynaklar}
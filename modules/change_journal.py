@@ -0,0 +1,153 @@
+"""
+Append-only change journal (JSONL) for cheap, crash-safe checkpoints.
+Batch enrichment appends only the rows changed since the last checkpoint;
+the full Excel workbook is materialized at the end (or on demand), after
+which the journal is cleared. On startup the journal is replayed on top of
+the rows loaded from Excel.
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence
+
+from field_registry import ROW_ID_COLUMN, parse_row_id
+
+# Varsayılan checkpoint aralığı (saniye)
+CHECKPOINT_INTERVAL = 30.0
+
+
+class ChangeJournal:
+    """
+    Kirli satırların JSONL günlüğü
+
+    Her satır: {"op": "upsert", "row": {...}} veya {"op": "delete", "row_id": n}
+    """
+
+    def __init__(self, path: str, interval: float = CHECKPOINT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._last_checkpoint = time.monotonic()
+
+    @classmethod
+    def for_excel(cls, excel_path: str, interval: float = CHECKPOINT_INTERVAL) -> "ChangeJournal":
+        """Excel dosyasının yanındaki günlük (Kutuphanem.xlsx -> Kutuphanem.journal.jsonl)"""
+        base, _ = os.path.splitext(excel_path)
+        return cls(f"{base}.journal.jsonl", interval)
+
+    def due(self) -> bool:
+        """Son checkpoint'ten bu yana aralık doldu mu"""
+        return time.monotonic() - self._last_checkpoint >= self.interval
+
+    def checkpointed(self) -> None:
+        """Checkpoint başka yere yazıldı (SQLite deposu) - aralık buradan yeniden başlar"""
+        self._last_checkpoint = time.monotonic()
+
+    def append(self, changed: Sequence[Mapping], deleted: Sequence[int] = ()) -> int:
+        """
+        Değişen ve silinen satırları günlüğe ekler (O(değişen satır)).
+
+        Returns:
+            Yazılan kayıt sayısı
+        """
+        self.checkpointed()
+        if not changed and not deleted:
+            return 0
+        lines = [json.dumps({"op": "upsert", "row": dict(row)}, ensure_ascii=False, default=str)
+                 for row in changed]
+        lines += [json.dumps({"op": "delete", "row_id": row_id}) for row_id in deleted]
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return len(lines)
+
+    def entries(self) -> Iterator[Dict]:
+        """Günlük kayıtları (yarım yazılmış son satır atlanır)"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def pending(self) -> bool:
+        return os.path.exists(self.path) and os.path.getsize(self.path) > 0
+
+    def replay(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Günlüğü Excel'den yüklenen satırlara uygular (row_id ile upsert/delete)
+
+        Returns:
+            Güncel satır listesi (sıra korunur, yeni satırlar sona eklenir)
+        """
+        by_id: Dict[int, Dict] = {}
+        order: List[int] = []
+        others: List[Dict] = []
+        for row in rows:
+            row_id = parse_row_id(row.get(ROW_ID_COLUMN))
+            if row_id is None or row_id in by_id:
+                others.append(row)
+                continue
+            by_id[row_id] = row
+            order.append(row_id)
+        seen = set(order)
+        for entry in self.entries():
+            if entry.get("op") == "upsert":
+                row = entry.get("row") or {}
+                row_id = parse_row_id(row.get(ROW_ID_COLUMN))
+                if row_id is None:
+                    continue
+                if row_id not in seen:
+                    seen.add(row_id)
+                    order.append(row_id)
+                by_id[row_id] = row
+            elif entry.get("op") == "delete":
+                by_id.pop(parse_row_id(entry.get("row_id")), None)
+        return [by_id[i] for i in order if i in by_id] + others
+
+    def replay_into(self, list_manager) -> None:
+        """
+        Günlüğü ListManager'daki satırlara uygular (liste güncel satırlarla değişir)
+
+        ⚠️ DİKKAT: Ham Excel satırlarına değil, kimlik verilmiş satırlara uygulanmalı -
+        row_id kolonu olmayan (eski) dosyalarda satırlar row_id='' gelir; replay onları
+        tanıyamaz ve günlükteki her satırı yeni satır olarak ekler (tekrarlanan kitaplar).
+        ListManager kimlikleri dosya sırasıyla verir, günlük de aynı kimliklerle yazılmıştır
+        """
+        list_manager.kitap_listesi = self.replay(list(list_manager.anlik_goruntu()))
+
+    def mark(self) -> int:
+        """Günlüğün şu anki sonu (tam kayıt için görüntü alınırken çağrılır, bkz. clear)"""
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def clear(self, upto: Optional[int] = None) -> None:
+        """
+        Tam Excel kaydından sonra çağrılır
+
+        Args:
+            upto: mark() değeri - sadece o ana kadarki kayıtlar silinir, kayıt sürerken
+                  eklenenler korunur (arka plan kaydı). None ise günlüğün tamamı silinir.
+        """
+        self._last_checkpoint = time.monotonic()
+        try:
+            if upto is not None:
+                with open(self.path, "rb") as f:
+                    f.seek(upto)
+                    tail = f.read()
+                if tail:
+                    tmp = f"{self.path}.tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(tail)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp, self.path)
+                    return
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
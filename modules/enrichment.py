@@ -0,0 +1,86 @@
+"""
+Per-book enrichment step shared by the GUI batch and the command-line runner.
+One call fetches a row through KitapBilgisiCekici.kitap_bilgisi_cek_policy
+(turning failures into a FAIL row with a retry backoff), and a second call
+merges the result into ListManager by row_id. Neither touches Tk.
+"""
+
+import traceback
+from datetime import datetime, timezone
+from typing import Dict, Mapping
+
+from field_registry import PROVENANCE_FIELDS, ROW_ID_COLUMN, ensure_row_schema
+from provenance import set_row_status
+
+# Zenginleştirilen alanlar (form alanları - Kitap Adı / Yazar hariç)
+ZENGIN_ALANLAR = list(PROVENANCE_FIELDS)
+
+
+def yeniden_deneme_bekliyor(kitap: Mapping) -> bool:
+    """
+    Satırın next_retry_at zamanı henüz gelmediyse True
+
+    ⚠️ DİKKAT: Okunamayan zaman damgası "beklemiyor" sayılır (satır denenir)
+    """
+    next_retry_at = kitap.get('next_retry_at', '')
+    if not next_retry_at:
+        return False
+    try:
+        retry_time = datetime.fromisoformat(str(next_retry_at).replace('Z', '+00:00'))
+        if retry_time.tzinfo is not None:
+            # set_row_status naive UTC yazar; dışarıdan gelen ofsetli değerler UTC'ye çevrilir
+            retry_time = retry_time.astimezone(timezone.utc).replace(tzinfo=None)
+        return datetime.utcnow() < retry_time
+    except Exception:
+        return False
+
+
+def kitabi_zenginlestir(bilgi_cekici, kitap: Mapping) -> Dict:
+    """
+    Tek kitap için policy modunda bilgi çeker
+
+    Args:
+        bilgi_cekici: KitapBilgisiCekici (thread'ler arasında paylaşılabilir)
+        kitap: Listedeki satır
+
+    Returns:
+        Güncellenen satır (status ve provenance dahil; hata olursa FAIL + 6 saat sonra tekrar)
+    """
+    kitap_adi = kitap.get('Kitap Adı', '').strip()
+    yazar = kitap.get('Yazar', '').strip()
+    mevcut_kitap = {"Kitap Adı": kitap_adi, "Yazar": yazar}
+    mevcut_kitap.update({alan: kitap.get(alan, "") for alan in ZENGIN_ALANLAR})
+
+    try:
+        guncellenen_kitap = bilgi_cekici.kitap_bilgisi_cek_policy(kitap_adi, yazar, mevcut_kitap)
+        print(f"Policy modu sonuçları ({kitap_adi}): status={guncellenen_kitap.get('status', 'UNKNOWN')}")
+    except Exception as e:
+        print(f"Policy modu hatası ({kitap_adi}): {e}")
+        traceback.print_exc()
+        # Hata durumunda mevcut kitabı koru ve FAIL status yaz
+        guncellenen_kitap = ensure_row_schema(dict(kitap))
+        set_row_status(
+            guncellenen_kitap,
+            status="FAIL",
+            missing_fields=list(ZENGIN_ALANLAR),
+            best_source="error",
+            retry_count=1,
+            next_retry_hours=6
+        )
+    return ensure_row_schema(guncellenen_kitap)
+
+
+def sonucu_uygula(list_manager, kimlik, guncellenen_kitap: Mapping) -> bool:
+    """
+    Çekilen bilgiyi listedeki satıra row_id ile işler (diğer kolonlar korunur)
+
+    Returns:
+        Satır hâlâ listedeyse True
+    """
+    listedeki_kitap = list_manager.getir_kimlik(kimlik)
+    if listedeki_kitap is None:
+        return False
+    mevcut_kitap = ensure_row_schema(listedeki_kitap.copy())
+    mevcut_kitap.update(guncellenen_kitap)
+    mevcut_kitap[ROW_ID_COLUMN] = kimlik
+    return list_manager.guncelle_kimlik(kimlik, mevcut_kitap)
@@ -3,14 +3,52 @@ Excel Islemleri Modulu
 Excel dosyasi okuma, yazma ve format guncelleme islemleri
 """
 
-import pandas as pd
+from __future__ import annotations
+
 import os
-from typing import List, Dict, Optional
-from openpyxl import load_workbook
-from openpyxl.styles import numbers, Font, Fill, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from itertools import islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
+
+from field_registry import standard_columns, ROW_ID_COLUMN
+from lazy_import import is_available, lazy_module
+from snapshot_cache import SnapshotCache
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.styles import NamedStyle
+
+# pandas / numpy ilk okuma-yazmada yüklenir (açılışta anlık görüntü varsa hiç yüklenmez);
+# openpyxl metotların içinde içe aktarılır
+np = lazy_module("numpy")
+pd = lazy_module("pandas")
+
+# Parquet isteğe bağlı (pyarrow yoksa sadece xlsx / csv) - kurulu mu diye bakılır, yüklenmez
+PARQUET_AVAILABLE = is_available("pyarrow")
+pq = lazy_module("pyarrow.parquet")
 
-from field_registry import standard_columns
+# Dosya uzantısı -> değişim biçimi (bkz. _dosya_bicimi)
+CSV_UZANTILARI = (".csv",)
+PARQUET_UZANTILARI = (".parquet", ".pq")
+
+# Dışarıdan parça parça yüklemede varsayılan parça (satır)
+PARCA_BOYUTU = 5000
+
+# Kütüphane temalı renkler
+BASLIK_BG = "8B4513"  # Koyu kahverengi
+BASLIK_FG = "FFFFFF"  # Beyaz
+VERI_BG_1 = "F5E6D3"  # Açık bej
+VERI_BG_2 = "FFF8DC"  # Açık sarı
+SAYFA_BG = "FAF5EF"   # Çok açık krem (tüm sayfa arka planı)
+
+# Adlandırılmış stiller (Excel'de Hücre Stilleri)
+STIL_BASLIK = "Kütüphane Başlık"
+STIL_VERI = "Kütüphane Veri"
+STIL_KONUSU = "Kütüphane Konusu"
+STIL_YIL = "Kütüphane Yıl"
+# Veri satırı sayısı (özel belge özelliği) - write-only yazıcı <dimension> yazmaz,
+# salt okunur okumada toplam satır (ilerleme yüzdesi) buradan gelir
+SATIR_SAYISI_OZELLIGI = "Kütüphane Satır Sayısı"
 
 class ExcelHandler:
     """Excel dosyasi islemleri icin sinif"""
@@ -38,53 +76,65 @@ class ExcelHandler:
             self.excel_dosyasi = os.path.join(desktop_path, "Kutuphanem.xlsx")
         else:
             self.excel_dosyasi = excel_dosyasi
+        
+        # Açılışta xlsx'i yeniden ayrıştırmamak için önbellek (bkz. snapshot_cache.py)
+        # ⚠️ ListManager.anlik_goruntu() (liste görüntüsü) ile karıştırılmasın
+        self.acilis_onbellegi = SnapshotCache.for_excel(self.excel_dosyasi)
     
     def yukle(self) -> List[Dict]:
         """
         Excel dosyasindan kitap listesini yukler ve format gunceller
         
         Returns:
-            Kitap listesi (dict listesi)
+            Kitap listesi (dict listesi) - dosya yoksa boş liste
+            
+        Raises:
+            Dosya var ama okunamıyorsa (bozuk, kilitli...) okuma hatası
+            
+        ⚠️ DİKKAT: Dosya değişmemişse (yol, mtime, boyut, içerik özeti) satırlar
+        anlık görüntüden gelir, xlsx hiç açılmaz
+        
+        ⚠️ DİKKAT: Okunamayan dosya için [] dönülmez - boş liste "kütüphane boş" sanılıp
+        dosyanın üzerine yazılırdı
         """
         if not os.path.exists(self.excel_dosyasi):
             return []
         
+        kitap_listesi = self.acilis_onbellegi.load(self.excel_dosyasi)
+        if kitap_listesi is not None:
+            return kitap_listesi
+        
         try:
-            df = pd.read_excel(self.excel_dosyasi, engine='openpyxl')
+            # Salt okunur, sadece standart sütunlar, tüm değerler metin (boşlar "")
+            df = self._tablo_oku(self.excel_dosyasi, self.STANDART_SUTUN_SIRASI)
             df = self._ensure_columns(df)
             
             # Format kontrolü ve güncelleme
             format_guncellenmeli = self._format_kontrol_et(df)
             
-            # Verileri yükle
-            kitap_listesi = df.to_dict('records')
+            # Yıllar sayıya, row_id int'e (metin okunduğu için)
+            df = self._format_guncelle(df)
+            df[ROW_ID_COLUMN] = self._row_id_sayiya_cevir(df[ROW_ID_COLUMN])
             
-            # NaN değerleri boş string'e çevir
-            for kitap in kitap_listesi:
-                for key, value in kitap.items():
-                    if pd.isna(value):
-                        kitap[key] = ""
+            # Verileri yükle (NaN temizliği _tablo_oku'da yapıldı)
+            kitap_listesi = df.to_dict('records')
             
             # Format güncellenmeli ise kaydet
             if format_guncellenmeli and kitap_listesi:
                 try:
-                    df = self._format_guncelle(df)
-                    df.to_excel(self.excel_dosyasi, index=False, engine='openpyxl')
-                    # Güncellenmiş verileri tekrar yükle
-                    kitap_listesi = df.to_dict('records')
-                    for kitap in kitap_listesi:
-                        for key, value in kitap.items():
-                            if pd.isna(value):
-                                kitap[key] = ""
+                    self._stilli_yaz(df)
                 except Exception as e:
                     # Güncelleme başarısız olursa devam et
                     print(f"Format güncelleme hatası: {e}")
             
+            # Sonraki açılış için anlık görüntü (format güncellemesinden sonra: mtime değişmiş olabilir)
+            self.acilis_onbellegi.save(self.excel_dosyasi, kitap_listesi)
+            
             return kitap_listesi
             
         except Exception as e:
             print(f"Excel yükleme hatası: {e}")
-            return []
+            raise
     
     def kaydet(self, kitap_listesi: List[Dict]) -> bool:
         """
@@ -97,35 +147,60 @@ class ExcelHandler:
             Başarılı ise True
         """
         try:
-            # DataFrame oluştur
-            df = pd.DataFrame(kitap_listesi)
+            df = self._cerceve_olustur(kitap_listesi)
             
-            # Eksik sütunları ekle
-            for sutun in self.STANDART_SUTUN_SIRASI:
-                if sutun not in df.columns:
-                    df[sutun] = ""
+            # Excel'e stilleriyle birlikte tek geçişte yaz (yeniden açma yok)
+            self._stilli_yaz(df)
             
-            # Sütun sırasını düzenle
-            df = df[self.STANDART_SUTUN_SIRASI]
+            # Anlık görüntüyü tazele (yukle'nin bu dosyadan döndüreceği biçimde)
+            self.acilis_onbellegi.save(self.excel_dosyasi, self._okunan_bicim(df).to_dict('records'))
             
-            # Yıl sütunlarını sayısal formata çevir
-            df = self._yil_sutunlarini_formatla(df)
+            return True
             
-            # Excel'e kaydet
-            df.to_excel(self.excel_dosyasi, index=False, engine='openpyxl')
+        except Exception as e:
+            print(f"Excel kaydetme hatası: {e}")
+            return False
+    
+    def disari_aktar(self, kitap_listesi: List[Dict], dosya_yolu: str) -> bool:
+        """
+        Kitap listesini uzantıya göre xlsx, CSV veya Parquet olarak dışa aktarır
+        
+        Args:
+            kitap_listesi: Aktarılacak kitap listesi
+            dosya_yolu: Hedef dosya (.xlsx / .csv / .parquet)
             
-            # Excel dosyasını açıp hücre formatlarını ayarla
-            self._excel_format_ayarla()
+        Returns:
+            Başarılı ise True
+            
+        ⚠️ DİKKAT: Sütunlar her biçimde standard_columns() ile aynı (disaridan_yukle geri okur)
+        - CSV: UTF-8 (BOM'lu - Excel Türkçe karakterleri doğru açar), parça parça yazılır
+        - Parquet: sütunlu + sıkıştırılmış, tüm veri sütunları metin, row_id int
+        """
+        try:
+            df = self._cerceve_olustur(kitap_listesi)
+            bicim = self._dosya_bicimi(dosya_yolu)
+            
+            if bicim == "csv":
+                df.to_csv(dosya_yolu, index=False, encoding="utf-8-sig", chunksize=10000)
+            elif bicim == "parquet":
+                self._parquet_gerekli()
+                df = self._okunan_bicim(df)
+                df = df.astype({s: str for s in ("İlk Yayınlanma Tarihi", "Anlatı Yılı")})
+                df[ROW_ID_COLUMN] = pd.to_numeric(df[ROW_ID_COLUMN], errors="coerce").astype("Int64")
+                df.to_parquet(dosya_yolu, index=False, compression="zstd")
+            else:
+                self._stilli_yaz(df, dosya_yolu)
             
             return True
             
         except Exception as e:
-            print(f"Excel kaydetme hatası: {e}")
+            print(f"Dışa aktarma hatası: {e}")
             return False
     
     def sablon_olustur(self, dosya_yolu: str) -> bool:
         """
         Boş Excel şablonu oluşturur (sadece A1: "Kitap", B1: "Yazar")
+        .csv / .parquet uzantısında aynı iki sütunlu boş tablo o biçimde yazılır
         
         Args:
             dosya_yolu: Şablonun kaydedileceği yol
@@ -140,6 +215,17 @@ class ExcelHandler:
         - HAND_OFF_DOKUMANTASYON.md dosyasını güncelle
         """
         try:
+            bicim = self._dosya_bicimi(dosya_yolu)
+            if bicim == "csv":
+                pd.DataFrame(columns=["Kitap", "Yazar"]).to_csv(
+                    dosya_yolu, index=False, encoding="utf-8-sig")
+                return True
+            if bicim == "parquet":
+                self._parquet_gerekli()
+                pd.DataFrame({"Kitap": pd.Series(dtype=str), "Yazar": pd.Series(dtype=str)}).to_parquet(
+                    dosya_yolu, index=False)
+                return True
+            
             from openpyxl import Workbook
             
             # Yeni workbook oluştur
@@ -161,54 +247,95 @@ class ExcelHandler:
     
     def disaridan_yukle(self, dosya_yolu: str) -> Optional[List[Dict]]:
         """
-        Dışarıdan Excel dosyası yükler ve parse eder
+        Dışarıdan Excel, CSV veya Parquet dosyası yükler ve parse eder
         
         Args:
-            dosya_yolu: Yüklenecek Excel dosyası yolu
+            dosya_yolu: Yüklenecek dosya yolu (biçim uzantıdan anlaşılır)
             
         Returns:
             Kitap listesi veya None (hata durumunda)
+            
+        ⚠️ DİKKAT: Tüm satırları bellekte toplar - büyük dosyalar için
+        disaridan_parcali_yukle kullan (GUI öyle yapar)
+        """
+        try:
+            kitaplar = []
+            for parca in self.disaridan_parcali_yukle(dosya_yolu):
+                kitaplar.extend(parca)
+            return kitaplar
+            
+        except Exception as e:
+            print(f"Dışarıdan yükleme hatası: {e}")
+            return None
+    
+    def disaridan_parcali_yukle(self, dosya_yolu: str, parca_boyutu: int = PARCA_BOYUTU,
+                                ilerleme: Optional[Callable[[int, Optional[int]], None]] = None,
+                                iptal: Optional[Callable[[], bool]] = None,
+                                sayfa: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        Dışarıdan dosyayı parça parça okur; her parça doğrulanmış kitap listesidir
+        (Kitap -> Kitap Adı, boş satırlar atılmış, kırpılmış, yıllar/row_id normalize)
+        
+        Args:
+            dosya_yolu: Yüklenecek dosya (.xlsx salt okunur akış, .csv chunksize, .parquet batch)
+            parca_boyutu: Parça başına okunan satır sayısı (bellekte en fazla bir parça tutulur)
+            ilerleme: Her parçadan sonra (okunan satır, toplam satır veya None) ile çağrılır
+            iptal: True dönerse okuma sonraki parçadan önce durur
+            sayfa: xlsx sayfa adı (None: aktif sayfa; CSV/Parquet'te yok sayılır)
+            
+        Yields:
+            Kitap listesi (boş parçalar atlanır)
+            
+        Raises:
+            ValueError: Zorunlu sütunlar (Kitap Adı / Yazar) eksikse - ilk parçadan önce
         """
+        kaynak = self._parca_kaynagi(dosya_yolu, self.STANDART_SUTUN_SIRASI + ['Kitap'], parca_boyutu, sayfa)
         try:
-            df = pd.read_excel(dosya_yolu, engine='openpyxl')
+            sutunlar, toplam = next(kaynak)
             
             # "Kitap" sütununu "Kitap Adı" olarak eşleştir (şablon uyumluluğu için)
-            if 'Kitap' in df.columns and 'Kitap Adı' not in df.columns:
-                df = df.rename(columns={'Kitap': 'Kitap Adı'})
+            if 'Kitap' in sutunlar and 'Kitap Adı' not in sutunlar:
+                sutunlar = ['Kitap Adı' if s == 'Kitap' else s for s in sutunlar]
             
             # Zorunlu sütun kontrolü
             gerekli_sutunlar = ['Kitap Adı', 'Yazar']
-            eksik_sutunlar = [sutun for sutun in gerekli_sutunlar if sutun not in df.columns]
+            eksik_sutunlar = [sutun for sutun in gerekli_sutunlar if sutun not in sutunlar]
             
             if eksik_sutunlar:
                 raise ValueError(f"Eksik sütunlar: {', '.join(eksik_sutunlar)}")
-
-            # Zorunlu kolonlar dogrulandiktan sonra eksik meta kolonlarini tamamla
-            df = self._ensure_columns(df)
-            
-            # Boş satırları filtrele
-            df = df.dropna(subset=['Kitap Adı', 'Yazar'], how='all')
-            df = df[df['Kitap Adı'].notna() & df['Yazar'].notna()]
-            
-            # Sayısal değerleri güvenli şekilde string'e çevir ve filtrele
-            df['Kitap Adı'] = df['Kitap Adı'].fillna('').astype(str).str.strip()
-            df['Yazar'] = df['Yazar'].fillna('').astype(str).str.strip()
-            df = df[(df['Kitap Adı'] != '') & (df['Yazar'] != '')]
-            
-            # DataFrame'i sözlük listesine çevir
-            kitaplar = df.to_dict('records')
             
-            # NaN değerleri boş string'e çevir
-            for kitap in kitaplar:
-                for key, value in kitap.items():
-                    if pd.isna(value):
-                        kitap[key] = ""
-            
-            return kitaplar
-            
-        except Exception as e:
-            print(f"Dışarıdan yükleme hatası: {e}")
-            return None
+            okunan = 0
+            for df in kaynak:
+                if iptal is not None and iptal():
+                    return
+                okunan += len(df)
+                kitaplar = self._parcayi_dogrula(df)
+                if ilerleme is not None:
+                    ilerleme(okunan, toplam)
+                if kitaplar:
+                    yield kitaplar
+        finally:
+            kaynak.close()
+    
+    def _parcayi_dogrula(self, df: pd.DataFrame) -> List[Dict]:
+        """Okunan bir parçayı kitap listesine çevirir (bkz. disaridan_parcali_yukle)"""
+        if 'Kitap' in df.columns and 'Kitap Adı' not in df.columns:
+            df = df.rename(columns={'Kitap': 'Kitap Adı'})
+        
+        # Zorunlu kolonlar dogrulandiktan sonra eksik meta kolonlarini tamamla
+        df = self._ensure_columns(df)
+        
+        # Boş satırları filtrele (değerler zaten metin, boşlar "")
+        df['Kitap Adı'] = df['Kitap Adı'].str.strip()
+        df['Yazar'] = df['Yazar'].str.strip()
+        df = df[(df['Kitap Adı'] != '') & (df['Yazar'] != '')]
+        
+        # Metin okunduğu için yıllar sayıya, row_id int'e (yukle ile aynı biçim)
+        df = self._yil_sutunlarini_formatla(df.copy())
+        df[ROW_ID_COLUMN] = self._row_id_sayiya_cevir(df[ROW_ID_COLUMN])
+        
+        # DataFrame'i sözlük listesine çevir
+        return df.to_dict('records')
     
     def dosya_acik_mi(self) -> bool:
         """
@@ -229,6 +356,188 @@ class ExcelHandler:
         except:
             return False
     
+    def _tablo_oku(self, dosya_yolu: str, sutunlar: List[str]) -> pd.DataFrame:
+        """
+        Excel dosyasını salt okunur modda satır satır okur (pandas.read_excel yerine)
+        
+        Args:
+            dosya_yolu: Okunacak Excel dosyası
+            sutunlar: Alınacak sütunlar (usecols gibi - diğer sütunlar hiç tutulmaz)
+            
+        Returns:
+            DataFrame (sütunlar dosyadaki sırada, tüm değerler metin, boş hücreler "")
+            
+        ⚠️ DİKKAT: Tür çıkarımı yok (dtype=str gibi). Yıl sütunları için
+        _yil_sutunlarini_formatla, row_id için _row_id_sayiya_cevir kullan.
+        """
+        kaynak = self._xlsx_parcalari(dosya_yolu, sutunlar, None)
+        try:
+            secilen, _ = next(kaynak)
+            parcalar = list(kaynak)
+        finally:
+            kaynak.close()
+        df = pd.concat(parcalar, ignore_index=True) if parcalar else self._metin_cercevesi([], secilen)
+        
+        # Sondaki tamamen boş satırları at (read_excel ile aynı)
+        dolu = (df != "").any(axis=1).to_numpy().nonzero()[0]
+        return df.iloc[:dolu[-1] + 1] if len(dolu) else df.iloc[:0]
+    
+    def _parca_kaynagi(self, dosya_yolu: str, sutunlar: List[str], parca_boyutu: Optional[int],
+                       sayfa: Optional[str] = None):
+        """
+        Biçime göre parça kaynağı: önce (bulunan sütunlar, toplam satır veya None),
+        sonra her biri en fazla parca_boyutu satırlık metin DataFrame'leri üretir
+        
+        ⚠️ DİKKAT: Dosya kaynak kapanınca kapanır - tüketen taraf finally'de close() çağırmalı
+        """
+        bicim = self._dosya_bicimi(dosya_yolu)
+        if bicim == "csv":
+            return self._csv_parcalari(dosya_yolu, sutunlar, parca_boyutu)
+        if bicim == "parquet":
+            return self._parquet_parcalari(dosya_yolu, sutunlar, parca_boyutu)
+        return self._xlsx_parcalari(dosya_yolu, sutunlar, parca_boyutu, sayfa)
+    
+    def _xlsx_parcalari(self, dosya_yolu: str, sutunlar: List[str], parca_boyutu: Optional[int],
+                        sayfa: Optional[str] = None):
+        """xlsx: salt okunur satır akışı (parca_boyutu None ise tek parça)"""
+        from openpyxl import load_workbook
+        
+        wb = load_workbook(dosya_yolu, read_only=True, data_only=True)
+        try:
+            ws = wb.active if sayfa is None else wb[sayfa]
+            satirlar = ws.iter_rows(values_only=True)
+            secilen: Dict[str, int] = {}
+            for i, ad in enumerate(next(satirlar, ())):
+                ad = "" if ad is None else str(ad).strip()
+                if ad in sutunlar and ad not in secilen:
+                    secilen[ad] = i
+            # Toplam satır <dimension>'dan (Excel'in kaydettiği dosyalar) veya bizim yazdığımız
+            # satır sayısı özelliğinden gelir (yoksa None - ilerleme sadece sayı gösterir)
+            toplam = ws.max_row - 1 if ws.max_row else None
+            if toplam is None and sayfa is None:
+                toplam = next((ozellik.value for ozellik in wb.custom_doc_props
+                               if ozellik.name == SATIR_SAYISI_OZELLIGI), None)
+            yield list(secilen), toplam
+            if not secilen:
+                return
+            
+            son = max(secilen.values())
+            al = itemgetter(*secilen.values())
+            if len(secilen) == 1:
+                tek = al
+                al = lambda satir: (tek(satir),)
+            bos = (None,) * (son + 1)
+            while True:
+                # Kısa satırlar (sondaki boş hücreler yazılmamış) None ile tamamlanır
+                kayitlar = [al(satir if len(satir) > son else satir + bos[len(satir):])
+                            for satir in islice(satirlar, parca_boyutu)]
+                if not kayitlar:
+                    return
+                yield self._metin_cercevesi(kayitlar, list(secilen))
+        finally:
+            wb.close()
+    
+    def _csv_parcalari(self, dosya_yolu: str, sutunlar: List[str], parca_boyutu: Optional[int]):
+        """
+        CSV: pandas chunksize ile akış (sadece bilinen sütunlar, metin, boşlar "")
+        
+        ⚠️ DİKKAT: Ayırıcı ilk satırdan seçilir (Türkçe Excel ';' ile kaydeder)
+        """
+        with open(dosya_yolu, encoding="utf-8-sig", errors="replace") as f:
+            baslik = f.readline()
+        ayirici = ";" if baslik.count(";") > baslik.count(",") else ","
+        secenekler = dict(sep=ayirici, encoding="utf-8-sig", dtype=str, keep_default_na=False,
+                          usecols=lambda ad: ad.strip() in sutunlar)
+        
+        secilen = [ad.strip() for ad in pd.read_csv(dosya_yolu, nrows=0, **secenekler).columns]
+        yield list(dict.fromkeys(secilen)), None
+        if not secilen:
+            return
+        with pd.read_csv(dosya_yolu, chunksize=parca_boyutu or 10 ** 9, **secenekler) as okuyucu:
+            for df in okuyucu:
+                df.columns = [ad.strip() for ad in df.columns]
+                df = df.loc[:, ~df.columns.duplicated()]
+                yield df.fillna("").astype(str)
+    
+    def _parquet_parcalari(self, dosya_yolu: str, sutunlar: List[str], parca_boyutu: Optional[int]):
+        """Parquet: sadece bilinen sütunların batch'leri (diğer sütunlar diskten hiç okunmaz)"""
+        self._parquet_gerekli()
+        dosya = pq.ParquetFile(dosya_yolu)
+        try:
+            mevcut = [ad for ad in dosya.schema_arrow.names if ad in sutunlar]
+            yield mevcut, dosya.metadata.num_rows
+            if not mevcut:
+                return
+            for batch in dosya.iter_batches(batch_size=parca_boyutu or 65536, columns=mevcut):
+                yield batch.to_pandas().astype(object).fillna("").astype(str)
+        finally:
+            dosya.close()
+    
+    def _metin_cercevesi(self, kayitlar: List[tuple], sutunlar: List[str]) -> pd.DataFrame:
+        """NaN/None temizliği ve metne çevirme tek seferde (hücre hücre pd.isna yok)"""
+        return pd.DataFrame(kayitlar, columns=sutunlar, dtype=object).fillna("").astype(str)
+    
+    def sayfa_adlari(self, dosya_yolu: str) -> List[Optional[str]]:
+        """
+        Dosyadaki okunabilir sayfalar (xlsx: tüm çalışma sayfaları, CSV/Parquet: [None])
+        
+        ⚠️ DİKKAT: Grafik sayfaları atlanır - salt okunur modda satırları yoktur
+        """
+        if self._dosya_bicimi(dosya_yolu) != "xlsx":
+            return [None]
+        from openpyxl import load_workbook
+        
+        wb = load_workbook(dosya_yolu, read_only=True)
+        try:
+            return [ws.title for ws in wb.worksheets]
+        finally:
+            wb.close()
+    
+    def _parquet_gerekli(self):
+        if not PARQUET_AVAILABLE:
+            raise ValueError("Parquet için pyarrow paketi gerekli (pip install pyarrow)")
+    
+    def _dosya_bicimi(self, dosya_yolu: str) -> str:
+        """Uzantıya göre değişim biçimi: csv, parquet veya xlsx"""
+        uzanti = os.path.splitext(dosya_yolu)[1].lower()
+        if uzanti in CSV_UZANTILARI:
+            return "csv"
+        if uzanti in PARQUET_UZANTILARI:
+            return "parquet"
+        return "xlsx"
+    
+    def _cerceve_olustur(self, kitap_listesi: List[Dict]) -> pd.DataFrame:
+        """
+        Kaydedilecek/aktarılacak DataFrame (sadece standart sütunlar, eksikler boş,
+        yıl sütunları sayısal)
+        """
+        # DataFrame'i sütun sütun oluştur
+        df = pd.DataFrame(
+            {sutun: [kitap.get(sutun, "") for kitap in kitap_listesi]
+             for sutun in self.STANDART_SUTUN_SIRASI},
+            columns=self.STANDART_SUTUN_SIRASI,
+        )
+        
+        # Yıl sütunlarını sayısal formata çevir
+        return self._yil_sutunlarini_formatla(df)
+    
+    def _okunan_bicim(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Kaydedilen DataFrame'i yukle'nin aynı dosyadan okuyacağı biçime getirir
+        (metin sütunları str, boşlar "", row_id int - yıl sütunları zaten formatlı)
+        """
+        df = df.copy()
+        metin = [s for s in df.columns
+                 if s not in ("İlk Yayınlanma Tarihi", "Anlatı Yılı", ROW_ID_COLUMN)]
+        df[metin] = df[metin].fillna("").astype(str)
+        df[ROW_ID_COLUMN] = self._row_id_sayiya_cevir(df[ROW_ID_COLUMN])
+        return df
+    
+    def _row_id_sayiya_cevir(self, seri: pd.Series) -> pd.Series:
+        """row_id sütununu int'e çevirir (geçersiz/boş -> "", bkz. parse_row_id)"""
+        sayilar = pd.to_numeric(seri, errors="coerce") // 1
+        return sayilar.astype("Int64").astype(object).where(sayilar.notna(), "")
+    
     def _format_kontrol_et(self, df: pd.DataFrame) -> bool:
         """
         Excel dosyas?n?n format?n?n g?ncel olup olmad???n? kontrol eder
@@ -291,248 +600,237 @@ class ExcelHandler:
             
         Returns:
             Formatlanmış DataFrame
+            
+        ⚠️ DİKKAT: Vektörel - hücre başına Python fonksiyonu çağrılmaz:
+        - Boş / NaN -> ""
+        - "-" içeren (aralık, örn: "1865-1869") -> metin olarak bırakılır
+        - Sayıya çevrilebilen ve 1000-3000 arası -> int (1869.0 -> 1869)
+        - Diğer her şey -> kırpılmış metin
+        _stilli_yaz bu çıktıyı kullanır: int olan hücre yıl stiliyle yazılır (tekrar ayrıştırma yok)
         """
         yil_sutunlari = ["İlk Yayınlanma Tarihi", "Anlatı Yılı"]
         
         for sutun in yil_sutunlari:
             if sutun in df.columns:
-                # Her değeri kontrol et
-                def yil_formatla(deger):
-                    if pd.isna(deger) or deger == "":
-                        return ""
-                    
-                    # String'e çevir
-                    deger_str = str(deger).strip()
-                    
-                    # Boş ise boş döndür
-                    if not deger_str:
-                        return ""
-                    
-                    # Aralık formatı kontrolü (örn: "1865-1869")
-                    if "-" in deger_str:
-                        # Aralık formatı - metin olarak bırak
-                        return deger_str
-                    
-                    # Tek yıl formatı - sayısal formata çevir
-                    try:
-                        yil = int(float(deger_str))
-                        # Makul yıl aralığı kontrolü (1000-3000)
-                        if 1000 <= yil <= 3000:
-                            return yil
-                        else:
-                            # Makul aralık dışındaysa metin olarak bırak
-                            return deger_str
-                    except (ValueError, TypeError):
-                        # Sayıya çevrilemezse metin olarak bırak
-                        return deger_str
-                
-                # Sütunu formatla
-                df[sutun] = df[sutun].apply(yil_formatla)
+                df[sutun] = self._yillari_normallestir(df[sutun])
         
         return df
     
-    def _excel_format_ayarla(self):
-        """
-        Excel dosyasını açıp kütüphane temalı formatlama uygular:
-        - Otomatik sütun genişlikleri ve satır yükseklikleri
-        - Kılavuz çizgileri kapalı
-        - Tüm sayfanın arka plan rengi (boş hücreler dahil)
-        - Başlık satırı: koyu kahverengi arka plan, beyaz yazı, bold, 12pt, border
-        - Veri satırları: zebra striping (açık bej/açık sarı), normal, 11pt
-        - Hizalama: Sola yaslı ve dikey ortalanmış (konusu hariç - wrap text)
-        - Georgia font (kütüphane temalı)
-        - Sürprizler: Freeze panes, başlık border, otomatik satır yüksekliği
+    def _yillari_normallestir(self, seri: pd.Series) -> pd.Series:
         """
-        try:
-            wb = load_workbook(self.excel_dosyasi)
-            ws = wb.active
-            
-            # Kılavuz çizgilerini kaldır
-            ws.sheet_view.showGridLines = False
-            
-            # Başlık satırını dondur (scroll yaparken başlık görünür kalır)
-            ws.freeze_panes = "A2"
-            
-            # Kütüphane temalı renkler
-            BASLIK_BG = "8B4513"  # Koyu kahverengi
-            BASLIK_FG = "FFFFFF"  # Beyaz
-            VERI_BG_1 = "F5E6D3"  # Açık bej
-            VERI_BG_2 = "FFF8DC"  # Açık sarı
-            SAYFA_BG = "FAF5EF"   # Çok açık krem (tüm sayfa arka planı)
-            
-            # Border stilleri
-            thin_border = Side(style='thin', color='8B4513')
-            baslik_border = Border(
-                left=thin_border,
-                right=thin_border,
-                top=thin_border,
-                bottom=Side(style='medium', color='8B4513')  # Alt border daha kalın
-            )
-            
-            # Başlık satırı formatı
-            baslik_satiri = 1
-            baslik_font = Font(name="Georgia", size=12, bold=True, color=BASLIK_FG)
-            baslik_fill = PatternFill(start_color=BASLIK_BG, end_color=BASLIK_BG, fill_type="solid")
-            baslik_alignment = Alignment(horizontal="left", vertical="center")
-            
-            # Veri satırı fontları
-            veri_font = Font(name="Georgia", size=11, bold=False)
-            # Konusu için özel hizalama (wrap text ile)
-            konusu_alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-            # Diğer hücreler için hizalama (sola yaslı, dikey ortalanmış)
-            normal_alignment = Alignment(horizontal="left", vertical="center", wrap_text=False)
-            
-            # "Konusu" sütununu bul
-            konusu_col_idx = None
-            max_col = ws.max_column
-            max_row = ws.max_row
-            
-            # Önce sütun başlıklarını bul ve "Konusu" sütununu tespit et
-            for col_idx in range(1, max_col + 1):
-                cell = ws.cell(row=baslik_satiri, column=col_idx)
-                if cell.value == "Konusu":
-                    konusu_col_idx = col_idx
-                    break
-            
-            # Sütun başlıklarını formatla ve sütun genişliklerini ayarla
-            sutun_indeksleri = {}
-            
-            for col_idx in range(1, max_col + 1):
-                cell = ws.cell(row=baslik_satiri, column=col_idx)
-                sutun_adi = cell.value
-                
-                # Başlık formatı
-                cell.font = baslik_font
-                cell.fill = baslik_fill
-                cell.alignment = baslik_alignment
-                cell.border = baslik_border
-                
-                # Yıl sütunlarını kaydet
-                if sutun_adi in ["İlk Yayınlanma Tarihi", "Anlatı Yılı"]:
-                    sutun_indeksleri[sutun_adi] = col_idx
-                
-                # Sütun genişliğini otomatik ayarla
-                col_letter = get_column_letter(col_idx)
-                
-                # Başlık genişliğini hesapla
-                if sutun_adi:
-                    baslik_genislik = len(str(sutun_adi)) + 3
-                else:
-                    baslik_genislik = 10
-                
-                # Veri genişliğini hesapla (tüm satırları kontrol et)
+        Tek geçişte int / metin ayrımı (bkz. _yil_sutunlarini_formatla)
+        
+        Yıl sütunlarında farklı değer sayısı azdır (birkaç yüz): değerler önce
+        factorize edilir, kurallar sadece tekil değerlere uygulanır, sonuç kodlarla yayılır.
+        """
+        kodlar, tekiller = pd.factorize(seri)
+        metin = pd.Series(tekiller, dtype=object).astype(str).str.strip()
+        aralik = metin.str.contains("-", regex=False)
+        sayi = pd.to_numeric(metin.where(~aralik, ""), errors="coerce")
+        # int(float(...)) gibi ondalık kısım atılır ("-" içerenler elendiği için sayılar >= 0)
+        tam = sayi // 1
+        yil = tam.between(1000, 3000)
+        
+        normal = metin.astype(object)
+        normal[yil] = tam[yil].astype(int).tolist()
+        # Kod -1 (NaN/None) -> sondaki "" değeri
+        degerler = np.append(normal.to_numpy(dtype=object), "")
+        return pd.Series(degerler[kodlar], index=seri.index, dtype=object)
+
+    def _sutun_genislikleri(self, df: pd.DataFrame) -> List[float]:
+        """
+        Sütun genişliklerini DataFrame'den hesaplar (yazmadan önce - write-only modda
+        sütun genişlikleri ilk satırdan önce yazılmalı)
+
+        - Başlık: uzunluk + 3 (boşsa 10)
+        - Konusu: veri 80 karakterde kırpılır, genişlik 25-70
+        - Diğer: veri 50 karakterde kırpılır, genişlik 12-60
+        """
+        genislikler = []
+        for sutun in df.columns:
+            baslik_genislik = len(str(sutun)) + 3 if sutun else 10
+            sinir = 80 if sutun == "Konusu" else 50
+            # Hücre hücre döngü yok: sütunun en uzun değeri tek vektörel işlemle
+            seri = df[sutun]
+            if not len(seri):
                 veri_genislik = 0
-                for row_idx in range(baslik_satiri + 1, max_row + 1):
-                    data_cell = ws.cell(row=row_idx, column=col_idx)
-                    if data_cell.value:
-                        cell_len = len(str(data_cell.value))
-                        # Konusu için özel genişlik (daha geniş)
-                        if col_idx == konusu_col_idx:
-                            if cell_len > 80:
-                                cell_len = 80
-                        else:
-                            # Uzun metinler için maksimum genişlik sınırı
-                            if cell_len > 50:
-                                cell_len = 50
-                        veri_genislik = max(veri_genislik, cell_len)
-                
-                # Sütun genişliğini ayarla
-                if col_idx == konusu_col_idx:
-                    # Konusu sütunu daha geniş
-                    sutun_genislik = max(25, min(70, max(baslik_genislik, veri_genislik + 3)))
-                else:
-                    sutun_genislik = max(12, min(60, max(baslik_genislik, veri_genislik + 2)))
-                ws.column_dimensions[col_letter].width = sutun_genislik
-            
-            # Tüm sayfanın arka planını ayarla (boş hücreler dahil)
-            # Maksimum 1000 satır ve 50 sütun formatla (performans için)
-            max_format_row = min(max_row + 100, 1000)  # Veri + 100 boş satır veya maksimum 1000
-            max_format_col = min(max_col, 50)
-            
-            # Veri satırlarını formatla (zebra striping)
-            for row_idx in range(baslik_satiri + 1, max_format_row + 1):
-                # Zebra striping: çift satırlar açık bej, tek satırlar açık sarı
-                if row_idx % 2 == 0:
-                    row_fill = PatternFill(start_color=VERI_BG_1, end_color=VERI_BG_1, fill_type="solid")
-                else:
-                    row_fill = PatternFill(start_color=VERI_BG_2, end_color=VERI_BG_2, fill_type="solid")
-                
-                # Boş satırlar için sayfa arka plan rengi
-                if row_idx > max_row:
-                    row_fill = PatternFill(start_color=SAYFA_BG, end_color=SAYFA_BG, fill_type="solid")
-                
-                # Satır yüksekliğini hesapla (içeriğe göre)
-                max_line_count = 1
-                
-                for col_idx in range(1, max_format_col + 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    
-                    # Arka plan rengi
-                    if row_idx <= max_row:
-                        cell.fill = row_fill
-                    else:
-                        cell.fill = PatternFill(start_color=SAYFA_BG, end_color=SAYFA_BG, fill_type="solid")
-                    
-                    # Font ve hizalama
-                    if row_idx <= max_row:
-                        cell.font = veri_font
-                        
-                        # Konusu sütunu için özel hizalama
-                        if col_idx == konusu_col_idx:
-                            cell.alignment = konusu_alignment
-                            # Konusu için satır sayısını hesapla (wrap text için)
-                            if cell.value:
-                                text = str(cell.value)
-                                # Yaklaşık satır sayısı hesapla (sütun genişliğine göre)
-                                col_width = ws.column_dimensions[get_column_letter(col_idx)].width
-                                chars_per_line = int(col_width * 1.2)  # Yaklaşık karakter sayısı
-                                if chars_per_line > 0:
-                                    line_count = max(1, (len(text) // chars_per_line) + 1)
-                                    max_line_count = max(max_line_count, min(line_count, 5))  # Maksimum 5 satır
-                        else:
-                            cell.alignment = normal_alignment
-                    else:
-                        # Boş satırlar için varsayılan format
-                        cell.font = veri_font
-                        cell.alignment = normal_alignment
-                    
-                    # Yıl sütunlarını sayısal formata çevir
-                    if col_idx in sutun_indeksleri.values() and row_idx <= max_row:
-                        if cell.value is not None and cell.value != "":
-                            deger_str = str(cell.value)
-                            if "-" not in deger_str:
-                                try:
-                                    yil = int(float(deger_str))
-                                    if 1000 <= yil <= 3000:
-                                        cell.value = yil
-                                        cell.number_format = '0'  # Sayısal format (ondalık yok)
-                                except (ValueError, TypeError):
-                                    pass
-                
-                # Satır yüksekliğini otomatik ayarla
-                if row_idx == baslik_satiri:
-                    ws.row_dimensions[row_idx].height = 28  # Başlık satırı daha yüksek
-                elif row_idx <= max_row:
-                    # İçeriğe göre dinamik yükseklik (minimum 18, maksimum 75)
-                    # Her satır için yaklaşık 15pt + (satır sayısı * 12pt)
-                    row_height = max(18, min(75, 15 + (max_line_count * 12)))
-                    ws.row_dimensions[row_idx].height = row_height
+            elif pd.api.types.is_integer_dtype(seri):
+                # Sayı sütunu (row_id, tamamen sayısal yıllar): en uzun değer min veya max'tır
+                veri_genislik = min(max(len(str(seri.min())), len(str(seri.max()))), sinir)
+            else:
+                veri_genislik = int(self._metin_uzunluklari(seri).clip(upper=sinir).max())
+            if sutun == "Konusu":
+                genislikler.append(max(25, min(70, max(baslik_genislik, veri_genislik + 3))))
+            else:
+                genislikler.append(max(12, min(60, max(baslik_genislik, veri_genislik + 2))))
+        return genislikler
+
+    def _satir_yukseklikleri(self, df: pd.DataFrame, konusu_genislik: float) -> List[int]:
+        """
+        Veri satırı yüksekliklerini Konusu uzunluğuna göre hesaplar (wrap text)
+
+        Her satır için yaklaşık 15pt + (satır sayısı * 12pt), satır sayısı en fazla 5;
+        sonuç 18-75 arasında.
+        """
+        if "Konusu" not in df.columns:
+            return [27] * len(df)
+        karakter_satir = int(konusu_genislik * 1.2)
+        if karakter_satir <= 0:
+            return [27] * len(df)
+        satir_sayilari = (self._metin_uzunluklari(df["Konusu"]) // karakter_satir + 1).clip(1, 5)
+        return (15 + satir_sayilari * 12).clip(18, 75).tolist()
+
+    def _metin_uzunluklari(self, seri: pd.Series) -> pd.Series:
+        """Değerlerin metin uzunlukları (boş / None / NaN -> 0), vektörel str.len"""
+        return seri.fillna("").astype(str).str.len()
+
+    def _tema_stillerini_kaydet(self, wb: Workbook) -> Dict[str, NamedStyle]:
+        """
+        Kütüphane temasını workbook'a adlandırılmış stiller olarak kaydeder
+        (Excel'de Hücre Stilleri listesinde görünür)
+
+        Dolgu renkleri stillerde yok - zebra ve sayfa arka planı koşullu biçimlendirme ile gelir.
+        """
+        from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+        thin_border = Side(style='thin', color=BASLIK_BG)
+        veri_font = Font(name="Georgia", size=11, bold=False)
+        stiller = {
+            STIL_BASLIK: NamedStyle(
+                name=STIL_BASLIK,
+                font=Font(name="Georgia", size=12, bold=True, color=BASLIK_FG),
+                fill=PatternFill(start_color=BASLIK_BG, end_color=BASLIK_BG, fill_type="solid"),
+                alignment=Alignment(horizontal="left", vertical="center"),
+                border=Border(
+                    left=thin_border,
+                    right=thin_border,
+                    top=thin_border,
+                    bottom=Side(style='medium', color=BASLIK_BG)  # Alt border daha kalın
+                ),
+            ),
+            # Sola yaslı, dikey ortalanmış
+            STIL_VERI: NamedStyle(
+                name=STIL_VERI,
+                font=veri_font,
+                alignment=Alignment(horizontal="left", vertical="center", wrap_text=False),
+            ),
+            # Konusu: wrap text, üste yaslı
+            STIL_KONUSU: NamedStyle(
+                name=STIL_KONUSU,
+                font=veri_font,
+                alignment=Alignment(horizontal="left", vertical="top", wrap_text=True),
+            ),
+            # Tek yıllar sayı (ondalık yok)
+            STIL_YIL: NamedStyle(
+                name=STIL_YIL,
+                font=veri_font,
+                alignment=Alignment(horizontal="left", vertical="center", wrap_text=False),
+                number_format='0',
+            ),
+        }
+        for stil in stiller.values():
+            wb.add_named_style(stil)
+        return stiller
+
+    def _tema_kosullu_bicimleri_ekle(self, ws, satir_sayisi: int, sutun_sayisi: int):
+        """
+        Zebra striping ve sayfa arka planını koşullu biçimlendirme kuralları olarak ekler
+        (hücre başına dolgu yazılmaz, boş hücreler önceden biçimlendirilmez)
+
+        - Veri alanı: çift satırlar açık bej, tek satırlar açık sarı
+        - Geri kalan her yer (veri altı ve sağı): sayfa arka plan rengi
+        """
+        from openpyxl.formatting.rule import FormulaRule
+        from openpyxl.styles import PatternFill
+        from openpyxl.utils import get_column_letter
+
+        def dolgu(renk):
+            return PatternFill(start_color=renk, end_color=renk, fill_type="solid")
+
+        son_sutun = get_column_letter(sutun_sayisi)
+        son_satir = satir_sayisi + 1
+        if satir_sayisi:
+            veri_alani = f"A2:{son_sutun}{son_satir}"
+            ws.conditional_formatting.add(
+                veri_alani, FormulaRule(formula=["MOD(ROW(),2)=0"], fill=dolgu(VERI_BG_1), stopIfTrue=True))
+            ws.conditional_formatting.add(
+                veri_alani, FormulaRule(formula=["MOD(ROW(),2)=1"], fill=dolgu(VERI_BG_2), stopIfTrue=True))
+        sayfa_alani = f"A{son_satir + 1}:XFD1048576 {get_column_letter(sutun_sayisi + 1)}1:XFD{son_satir}"
+        ws.conditional_formatting.add(sayfa_alani, FormulaRule(formula=["TRUE"], fill=dolgu(SAYFA_BG)))
+
+    def _stilli_yaz(self, df: pd.DataFrame, dosya_yolu: Optional[str] = None):
+        """
+        DataFrame'i kütüphane temalı formatla tek geçişte yazar (openpyxl write-only):
+        - Otomatik sütun genişlikleri ve satır yükseklikleri (yazmadan önce hesaplanır)
+        - Kılavuz çizgileri kapalı, başlık satırı dondurulmuş (freeze panes)
+        - Başlık / veri / Konusu / yıl: adlandırılmış stiller (Georgia, bkz. _tema_stillerini_kaydet)
+        - Zebra striping ve sayfa arka planı: koşullu biçimlendirme (bkz. _tema_kosullu_bicimleri_ekle)
+
+        ⚠️ DİKKAT: Sadece openpyxl'in genel API'si (WriteOnlyCell + adlandırılmış stil adı);
+        boş hücreler yazılmaz. Dosya yeniden açılıp biçimlendirilmez.
+        Geçici dosyaya yazılıp os.replace ile yerine konur.
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.packaging.custom import IntProperty
+        from openpyxl.utils import get_column_letter
+
+        dosya_yolu = dosya_yolu or self.excel_dosyasi
+        sutunlar = list(df.columns)
+        konusu_idx = sutunlar.index("Konusu") if "Konusu" in sutunlar else None
+        yil_idx = {i for i, s in enumerate(sutunlar) if s in ["İlk Yayınlanma Tarihi", "Anlatı Yılı"]}
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Sheet1")
+        # Write-only sayfa <dimension> yazmaz - satır sayısı belge özelliği olarak (bkz. _xlsx_parcalari)
+        wb.custom_doc_props.append(IntProperty(name=SATIR_SAYISI_OZELLIGI, value=len(df)))
+        ws.sheet_view.showGridLines = False
+        ws.freeze_panes = "A2"  # Başlık satırını dondur
+
+        # Sütun genişlikleri ilk satırdan önce yazılmalı
+        genislikler = self._sutun_genislikleri(df)
+        for col_idx, genislik in enumerate(genislikler, start=1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = genislik
+        yukseklikler = self._satir_yukseklikleri(
+            df, genislikler[konusu_idx] if konusu_idx is not None else 0)
+
+        self._tema_stillerini_kaydet(wb)
+        self._tema_kosullu_bicimleri_ekle(ws, len(df), len(sutunlar))
+
+        def hucre(deger, stil):
+            cell = WriteOnlyCell(ws, value=deger)
+            cell.style = stil
+            return cell
+
+        baslik_stil, veri_stil, konusu_stil, yil_stil = STIL_BASLIK, STIL_VERI, STIL_KONUSU, STIL_YIL
+
+        # Başlık satırı
+        ws.row_dimensions[1].height = 28  # Başlık satırı daha yüksek
+        ws.append([hucre(sutun, baslik_stil) for sutun in sutunlar])
+
+        # Veri satırları (satır yüksekliği satır yazılmadan önce ayarlanmalı)
+        for row_idx, (satir, yukseklik) in enumerate(
+                zip(df.itertuples(index=False, name=None), yukseklikler), start=2):
+            ws.row_dimensions[row_idx].height = yukseklik
+            hucreler = []
+            for col_idx, deger in enumerate(satir):
+                if deger is None or deger == "" or (isinstance(deger, float) and pd.isna(deger)):
+                    hucreler.append(None)
+                elif col_idx == konusu_idx:
+                    hucreler.append(hucre(deger, konusu_stil))
+                elif col_idx in yil_idx and isinstance(deger, int):
+                    hucreler.append(hucre(deger, yil_stil))
                 else:
-                    # Boş satırlar için standart yükseklik
-                    ws.row_dimensions[row_idx].height = 18
-            
-            # Boş sütunlar için de arka plan rengi ayarla
-            for col_idx in range(max_col + 1, max_format_col + 1):
-                for row_idx in range(1, max_format_row + 1):
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    if row_idx == baslik_satiri:
-                        cell.fill = baslik_fill
-                    else:
-                        cell.fill = PatternFill(start_color=SAYFA_BG, end_color=SAYFA_BG, fill_type="solid")
-            
-            wb.save(self.excel_dosyasi)
+                    hucreler.append(hucre(deger, veri_stil))
+            ws.append(hucreler)
+
+        # Önce geçici dosyaya, sonra atomik yer değiştirme: yarım yazılmış xlsx kalmaz
+        # (Excel'de açıksa os.replace PermissionError verir, hedef dosya bozulmaz)
+        gecici = f"{dosya_yolu}.tmp"
+        try:
+            wb.save(gecici)
+            os.replace(gecici, dosya_yolu)
+        finally:
             wb.close()
-            
-        except Exception as e:
-            # Format ayarlama başarısız olursa devam et (kritik değil)
-            print(f"Excel format ayarlama hatası: {e}")
+            if os.path.exists(gecici):
+                os.remove(gecici)
@@ -3,7 +3,7 @@ Field registry for Excel schema and metadata columns.
 Centralizes column names to keep Excel format stable.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 # Base data columns (order must remain stable)
 # Sadece temel veri kolonları - meta ve provenance kolonları kaldırıldı
@@ -18,6 +18,10 @@ BASE_COLUMNS: List[str] = [
     "Konusu",
 ]
 
+# Persistent row identifier (ListManager, GUI ve Excel arasında satır eşleme)
+# En sona eklenir; mevcut dosyalarda eksikse yükleme sırasında tamamlanır
+ROW_ID_COLUMN = "row_id"
+
 # Fields that will have src_/conf_ provenance columns
 PROVENANCE_FIELDS: Dict[str, str] = {
     "Orijinal Adı": "orijinal_adi",
@@ -52,9 +56,9 @@ def build_provenance_columns() -> List[str]:
 def standard_columns() -> List[str]:
     """
     Returns the Excel schema in stable order.
-    Sadece temel veri kolonları - meta ve provenance kolonları kaldırıldı.
+    Sadece temel veri kolonları + row_id - meta ve provenance kolonları kaldırıldı.
     """
-    return BASE_COLUMNS
+    return BASE_COLUMNS + [ROW_ID_COLUMN]
 
 
 def ensure_row_schema(row: Dict[str, str]) -> Dict[str, str]:
@@ -68,3 +72,17 @@ def ensure_row_schema(row: Dict[str, str]) -> Dict[str, str]:
         if col not in out:
             out[col] = ""
     return out
+
+
+def parse_row_id(value) -> Optional[int]:
+    """
+    Excel/pandas'tan gelen row_id değerini int'e çevirir (1, 1.0, "1" -> 1).
+    Boş veya geçersiz ise None.
+    """
+    if value is None or value == "":
+        return None
+    try:
+        row_id = int(float(str(value).strip()))
+    except (ValueError, TypeError):
+        return None
+    return row_id if row_id > 0 else None
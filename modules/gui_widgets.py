@@ -7,6 +7,15 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Dict, Callable, Optional
 
+from virtual_list import VirtualRows
+
+# Hızlı toplu doldurma sonuç tablosunda tutulan en fazla satır
+SONUC_TABLOSU_SINIRI = 1000
+
+# Kütüphane açılışta yüklenirken kapalı tutulan butonlar (callback adları, bkz. islemleri_kilitle)
+YUKLEME_KILITLI = ('bilgileri_otomatik_doldur', 'listeye_ekle', 'toplu_sil', 'excel_olustur',
+                   'excel_yukle', 'toplu_ice_aktar', 'disari_aktar')
+
 
 class GUIWidgets:
     """GUI widget'lari icin sinif"""
@@ -18,11 +27,27 @@ class GUIWidgets:
         """
         self.root = root
         self.widgets: Dict[str, tk.Widget] = {}
+        self.butonlar: Dict[str, tk.Button] = {}  # callback adı -> buton
         self.progress_frame: Optional[ttk.Frame] = None
         self.progress_bar: Optional[ttk.Progressbar] = None
         self.progress_label: Optional[ttk.Label] = None
+        self.progress_iptal_btn: Optional[tk.Button] = None
+        self.progress_duraklat_btn: Optional[tk.Button] = None
         self.tree: Optional[ttk.Treeview] = None
-        self.checkbox_vars: dict = {}  # Her satır için checkbox değişkenleri
+        # Checkbox seçimi: row_id kümesi (satır başına değişken yok - tümünü seç tek işlem)
+        self.secili_kimlikler: set = set()
+        self._item_kimlikleri: Dict[str, int] = {}  # Treeview item id -> row_id (ekrandaki satırlar)
+        # Sanal liste: Treeview'de sadece ekrandaki satırlar bulunur (bkz. virtual_list.py)
+        self.liste_modeli = VirtualRows()
+        self.liste_scrollbar: Optional[tk.Scrollbar] = None
+        self._ilk_satir = 0  # Ekrandaki ilk satırın modeldeki sırası
+        self._gorunur_satir = 12  # Treeview height ile başlar, <Configure>'da ölçülür
+        self._cizilen: list = []  # Treeview'de şu an bulunan kimlikler
+        self._satir_olculdu = False
+        # Hızlı toplu doldurma sonuç penceresi (bkz. sonuc_tablosu_ac)
+        self.sonuc_penceresi: Optional[tk.Toplevel] = None
+        self.sonuc_tree: Optional[ttk.Treeview] = None
+        self.sonuc_ozet_label: Optional[tk.Label] = None
     
     def olustur(self, callbacks: Dict[str, Callable]):
         """
@@ -179,6 +204,7 @@ class GUIWidgets:
                                 activeforeground='#FFFFFF', command=callbacks['bilgileri_otomatik_doldur'],
                                 **button_style)
             auto_btn.pack(side=tk.LEFT, padx=5)
+            self.butonlar['bilgileri_otomatik_doldur'] = auto_btn
         
         if 'listeye_ekle' in callbacks:
             ekle_btn = tk.Button(button_frame, text="➕ Listeye Ekle", 
@@ -186,6 +212,7 @@ class GUIWidgets:
                                 activeforeground='#FFFFFF', command=callbacks['listeye_ekle'],
                                 **button_style)
             ekle_btn.pack(side=tk.LEFT, padx=5)
+            self.butonlar['listeye_ekle'] = ekle_btn
         
         if 'formu_temizle' in callbacks:
             temizle_btn = tk.Button(button_frame, text="🗑️ Formu Temizle", 
@@ -206,6 +233,15 @@ class GUIWidgets:
         self.progress_bar = ttk.Progressbar(self.progress_frame, mode='indeterminate', length=300)
         self.progress_bar.pack(side=tk.LEFT, padx=5)
         
+        # İptal butonu sadece iptal edilebilir işlerde gösterilir (progress_goster(iptal=...))
+        self.progress_iptal_btn = tk.Button(self.progress_frame, text="✖ İptal",
+                                            font=('Georgia', 9), bg='#F5DEB3', fg='#8B4513',
+                                            relief=tk.RAISED, bd=1, cursor='hand2')
+        # Duraklat / Devam - sadece toplu doldurma işlerinde (progress_goster(duraklat=...))
+        self.progress_duraklat_btn = tk.Button(self.progress_frame, text="⏸ Duraklat",
+                                               font=('Georgia', 9), bg='#F5DEB3', fg='#8B4513',
+                                               relief=tk.RAISED, bd=1, cursor='hand2')
+        
         form_frame.columnconfigure(1, weight=1)
         
         return form_frame
@@ -269,15 +305,27 @@ class GUIWidgets:
             self.tree.column(col, width=180)
         
         # Scrollbar
+        # ⚠️ DİKKAT: Scrollbar Treeview'e değil sanal listeye bağlı (tree.yview kullanılmaz)
+        # Treeview'de sadece görünen satırlar var; kaydırınca pencere yeniden çizilir
         scrollbar = tk.Scrollbar(liste_frame, orient=tk.VERTICAL, 
-                                command=self.tree.yview,
+                                command=self._kaydir,
                                 bg='#D2B48C', troughcolor='#F5E6D3',
                                 activebackground='#8B4513')
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.liste_scrollbar = scrollbar
         
         self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
+        # Tekerlek/klavye kaydırması da sanal listeyi kaydırır ("break" ile Treeview'inki engellenir)
+        self.tree.bind('<Configure>', self._boyut_degisti)
+        self.tree.bind('<MouseWheel>', self._tekerlek)
+        self.tree.bind('<Button-4>', self._tekerlek)
+        self.tree.bind('<Button-5>', self._tekerlek)
+        self.tree.bind('<Up>', lambda e: self._klavye_kaydir(-1))
+        self.tree.bind('<Down>', lambda e: self._klavye_kaydir(1))
+        self.tree.bind('<Prior>', lambda e: self._kaydir("scroll", -1, "pages"))
+        self.tree.bind('<Next>', lambda e: self._kaydir("scroll", 1, "pages"))
+        
         # Çift tıklama event'i - kitabı forma yüklemek için (sadece "Seç" sütunu dışında)
         if 'kitap_sec' in callbacks:
             def on_double_click(event):
@@ -318,6 +366,7 @@ class GUIWidgets:
                                      activeforeground='#FFFFFF', command=callbacks['toplu_sil'],
                                      **button_style)
             toplu_sil_btn.pack(side=tk.LEFT, padx=5)
+            self.butonlar['toplu_sil'] = toplu_sil_btn
         
         if 'excel_olustur' in callbacks:
             excel_btn = tk.Button(liste_button_frame, text="📊 Excel Dosyası Oluştur", 
@@ -325,6 +374,7 @@ class GUIWidgets:
                                  activeforeground='#FFFFFF', command=callbacks['excel_olustur'],
                                  **button_style)
             excel_btn.pack(side=tk.LEFT, padx=5)
+            self.butonlar['excel_olustur'] = excel_btn
         
         # Excel işlemleri için ayrı bir frame
         excel_button_frame = tk.Frame(liste_button_frame, bg='#FFF8DC')
@@ -343,6 +393,23 @@ class GUIWidgets:
                                  activeforeground='#FFFFFF', command=callbacks['excel_yukle'],
                                  **button_style)
             yukle_btn.pack(side=tk.LEFT, padx=2)
+            self.butonlar['excel_yukle'] = yukle_btn
+        
+        if 'toplu_ice_aktar' in callbacks:
+            toplu_btn = tk.Button(excel_button_frame, text="📚 Toplu İçe Aktar", 
+                                  bg='#4169E1', fg='#FFFFFF', activebackground='#6495ED',
+                                  activeforeground='#FFFFFF', command=callbacks['toplu_ice_aktar'],
+                                  **button_style)
+            toplu_btn.pack(side=tk.LEFT, padx=2)
+            self.butonlar['toplu_ice_aktar'] = toplu_btn
+        
+        if 'disari_aktar' in callbacks:
+            aktar_btn = tk.Button(excel_button_frame, text="📤 Dışa Aktar (CSV/Parquet)", 
+                                  bg='#4169E1', fg='#FFFFFF', activebackground='#6495ED',
+                                  activeforeground='#FFFFFF', command=callbacks['disari_aktar'],
+                                  **button_style)
+            aktar_btn.pack(side=tk.LEFT, padx=2)
+            self.butonlar['disari_aktar'] = aktar_btn
         
         # Groq API Key ayarları butonu
         if 'groq_api_key_ayarla' in callbacks:
@@ -355,47 +422,164 @@ class GUIWidgets:
         return liste_frame
     
     def listeyi_guncelle(self, kitap_listesi: list):
-        """Treeview'i günceller"""
+        """
+        Treeview'i listenin son haline eşitler
+        
+        ⚠️ DİKKAT: Tüm liste yeniden eklenmez - sanal model farkı bulur (satır nesnesi
+        değişmediyse satır değişmemiştir) ve sadece ekrandaki satırlar çizilir
+        """
+        if not self.tree:
+            return
+        self._degisiklikleri_uygula(self.liste_modeli.sync(kitap_listesi))
+    
+    def satirlari_ekle(self, kitaplar: list):
+        """Yeni satırları listenin sonuna ekler (row_id ile)"""
+        self._degisiklikleri_uygula(self.liste_modeli.insert(kitaplar))
+    
+    def satirlari_guncelle(self, kitaplar: list):
+        """Var olan satırları row_id ile günceller"""
+        self._degisiklikleri_uygula(self.liste_modeli.update(kitaplar))
+    
+    def satirlari_sil(self, kimlikler: list):
+        """Satırları row_id ile listeden çıkarır"""
+        self._degisiklikleri_uygula(self.liste_modeli.delete(kimlikler))
+    
+    def _degisiklikleri_uygula(self, degisenler: set):
+        """Silinen satırları seçimden düşer, değişiklik ekrandaysa pencereyi yeniden çizer"""
         if not self.tree:
             return
         
-        # Mevcut öğeleri temizle
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # ⚠️ KRİTİK: Silinen satırlar seçimden çıkarılmalı, aksi halde eski seçimler kalır
+        # (başlıktaki ☑ sayım ile bulunur: seçim her zaman listedeki kimliklerin alt kümesi)
+        for kimlik in degisenler:
+            if kimlik not in self.liste_modeli:
+                self.secili_kimlikler.discard(kimlik)
+        
+        # Pencere kaydıysa (ekleme/silme) veya görünen satır değiştiyse çiz
+        self._ilk_satir = self._ilk_satir_sinirla(self._ilk_satir)
+        pencere = self.liste_modeli.window(self._ilk_satir, self._gorunur_satir)
+        if pencere != self._cizilen or not degisenler.isdisjoint(pencere):
+            self._pencereyi_ciz()
+        else:
+            self._scrollbar_guncelle()
         
-        # ⚠️ KRİTİK: Checkbox değişkenlerini temizle
-        # Her satır için BooleanVar tutulur (checkbox_vars dict'i)
-        # Listeyi güncellerken mutlaka temizle, aksi halde eski checkbox'lar kalır
-        self.checkbox_vars = {}
+        # Başlığı güncelle
+        liste_frame = self.tree.master
+        liste_frame.config(text=f"📚 Kitap Listesi ({len(self.liste_modeli)} kitap)")
         
-        # Kitapları ekle
-        for idx, kitap in enumerate(kitap_listesi):
-            # Her satır için checkbox değişkeni oluştur
-            var = tk.BooleanVar(value=False)
-            self.checkbox_vars[idx] = var
-            
-            # Checkbox durumunu göster (☑ veya ☐)
-            checkbox_text = "☐"
-            
-            self.tree.insert("", tk.END, values=(
-                checkbox_text,
+        self._baslik_guncelle()
+    
+    def _tumu_secili_mi(self) -> bool:
+        return bool(self.secili_kimlikler) and len(self.secili_kimlikler) == len(self.liste_modeli)
+    
+    def _baslik_guncelle(self):
+        """Başlık sütunundaki ☑ işaretini günceller (O(1) - sayım karşılaştırması)"""
+        baslik_text = "☑" if self._tumu_secili_mi() else "☐"
+        self.tree.heading("Seç", text=baslik_text, command=self._baslik_checkbox_toggle)
+    
+    def _pencereyi_ciz(self):
+        """Ekrandaki satırları modelden yeniden oluşturur (en fazla _gorunur_satir satır)"""
+        # Tıklanarak seçilmiş satırlar pencerede kalıyorsa seçili kalır
+        onceki_secim = set(self.tree.selection())
+        odak = self.tree.focus()
+        if self._cizilen:
+            self.tree.delete(*self.tree.get_children())
+        
+        # ⚠️ Treeview item id'si = row_id (pozisyon değil) - satir_kimligi() ile geri çevrilir
+        pencere = self.liste_modeli.window(self._ilk_satir, self._gorunur_satir)
+        secim = []
+        self._item_kimlikleri = {}
+        for kimlik in pencere:
+            kitap = self.liste_modeli.row(kimlik)
+            secili = kimlik in self.secili_kimlikler
+            item = str(kimlik)
+            self._item_kimlikleri[item] = kimlik
+            self.tree.insert("", tk.END, iid=item, values=(
+                "☑" if secili else "☐",
                 kitap.get("Kitap Adı", ""),
                 kitap.get("Yazar", ""),
                 kitap.get("Tür", ""),
                 kitap.get("İlk Yayınlanma Tarihi", "")
-            ), tags=(f"item_{idx}",))
-        
-        # Başlığı güncelle
-        liste_frame = self.tree.master
-        liste_frame.config(text=f"📚 Kitap Listesi ({len(kitap_listesi)} kitap)")
-        
-        # Başlık sütunundaki ☑ işaretini güncelle
-        if self.checkbox_vars:
-            tumu_secili = all(var.get() for var in self.checkbox_vars.values())
-            baslik_text = "☑" if tumu_secili else "☐"
-            self.tree.heading("Seç", text=baslik_text, command=self._baslik_checkbox_toggle)
+            ))
+            if secili or item in onceki_secim:
+                secim.append(item)
+        
+        self.tree.selection_set(secim)
+        if odak and self.tree.exists(odak):
+            self.tree.focus(odak)
+        self._cizilen = pencere
+        self._scrollbar_guncelle()
+        
+        # İlk çizimde satır yüksekliği henüz bilinmiyor - çizim bitince ölç
+        if pencere and not self._satir_olculdu:
+            self.tree.after_idle(self._boyut_degisti)
+    
+    def _scrollbar_guncelle(self):
+        if self.liste_scrollbar:
+            toplam = len(self.liste_modeli)
+            if toplam:
+                self.liste_scrollbar.set(self._ilk_satir / toplam,
+                                         min(1.0, (self._ilk_satir + self._gorunur_satir) / toplam))
+            else:
+                self.liste_scrollbar.set(0.0, 1.0)
+    
+    def _ilk_satir_sinirla(self, ilk: int) -> int:
+        return max(0, min(ilk, len(self.liste_modeli) - self._gorunur_satir))
+    
+    def _kaydir(self, islem, miktar=None, birim=None):
+        """Scrollbar komutu (yview ile aynı imza: moveto / scroll units|pages)"""
+        if islem == "moveto":
+            ilk = int(float(miktar) * len(self.liste_modeli))
         else:
-            self.tree.heading("Seç", text="☐", command=self._baslik_checkbox_toggle)
+            adim = int(miktar)
+            if birim == "pages":
+                adim *= max(1, self._gorunur_satir - 1)
+            ilk = self._ilk_satir + adim
+        ilk = self._ilk_satir_sinirla(ilk)
+        if ilk != self._ilk_satir:
+            self._ilk_satir = ilk
+            self._pencereyi_ciz()
+        return "break"
+    
+    def _tekerlek(self, event):
+        """Fare tekerleği (Windows/macOS: delta, Linux: Button-4/5)"""
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            return self._kaydir("scroll", -3, "units")
+        return self._kaydir("scroll", 3, "units")
+    
+    def _klavye_kaydir(self, adim: int):
+        """Ok tuşları pencerenin kenarındaysa listeyi bir satır kaydırır"""
+        odak = self.tree.focus()
+        cocuklar = self.tree.get_children()
+        if not cocuklar or odak not in (cocuklar[0], cocuklar[-1]):
+            return  # Treeview kendi odak hareketini yapar
+        if (adim < 0) != (odak == cocuklar[0]):
+            return
+        
+        onceki = self._ilk_satir
+        self._kaydir("scroll", adim, "units")
+        if self._ilk_satir == onceki:
+            return
+        cocuklar = self.tree.get_children()
+        yeni = cocuklar[0] if adim < 0 else cocuklar[-1]
+        self.tree.focus(yeni)
+        self.tree.selection_set(yeni)
+        return "break"
+    
+    def _boyut_degisti(self, event=None):
+        """Treeview yüksekliği değişince sığan satır sayısını satır kutusundan ölçer"""
+        cocuklar = self.tree.get_children()
+        kutu = self.tree.bbox(cocuklar[0]) if cocuklar else None
+        if not kutu:
+            return
+        self._satir_olculdu = True
+        _, ust, _, yukseklik = kutu
+        alan = event.height if event is not None else self.tree.winfo_height()
+        gorunur = max(1, (alan - ust) // max(1, yukseklik))
+        if gorunur != self._gorunur_satir:
+            self._gorunur_satir = gorunur
+            self._ilk_satir = self._ilk_satir_sinirla(self._ilk_satir)
+            self._pencereyi_ciz()
     
     def _on_tree_click(self, event):
         """Treeview tıklama event'i - checkbox kontrolü yapar"""
@@ -427,116 +611,195 @@ class GUIWidgets:
                 return
             
             if item:
-                # Satır indeksini bul
-                children = list(self.tree.get_children())
-                if item in children:
-                    idx = children.index(item)
+                # Item id'si row_id'dir (bkz. _pencereyi_ciz) - harita ile O(1)
+                kimlik = self.satir_kimligi(item)
+                if kimlik is not None and kimlik in self.liste_modeli:
                     # Checkbox durumunu toggle et
-                    if idx in self.checkbox_vars:
-                            var = self.checkbox_vars[idx]
-                            var.set(not var.get())
-                            # Treeview'de güncelle
-                            checkbox_text = "☑" if var.get() else "☐"
-                            try:
-                                values = list(self.tree.item(item, "values"))
-                                if values:
-                                    values[0] = checkbox_text
-                                    self.tree.item(item, values=values)
-                                # Satırı seçili göster veya kaldır
-                                if var.get():
-                                    self.tree.selection_add(item)
-                                else:
-                                    self.tree.selection_remove(item)
-                            except:
-                                pass
-                            # Event'i durdur (normal selection'ı engelle)
-                            return "break"
+                    secili = kimlik not in self.secili_kimlikler
+                    if secili:
+                        self.secili_kimlikler.add(kimlik)
+                    else:
+                        self.secili_kimlikler.discard(kimlik)
+                    try:
+                        self._satiri_isaretle(item, secili)
+                    except tk.TclError:
+                        pass
+                    self._baslik_guncelle()
+                    # Event'i durdur (normal selection'ı engelle)
+                    return "break"
         
         # "Seç" sütunu değilse normal davranışa izin ver
         return
     
+    def _satiri_isaretle(self, item: str, secili: bool):
+        """Ekrandaki tek satırın ☑/☐ işaretini ve Treeview seçimini günceller"""
+        self.tree.set(item, "Seç", "☑" if secili else "☐")
+        # Satırı seçili göster veya kaldır
+        if secili:
+            self.tree.selection_add(item)
+        else:
+            self.tree.selection_remove(item)
+    
     def _baslik_checkbox_toggle(self):
         """Başlık sütunundaki ☑ işaretine tıklanınca tümünü seç/kaldır"""
-        if not self.tree or not self.checkbox_vars:
+        if not self.tree or not len(self.liste_modeli):
             return
         
-        # Tüm checkbox'ların durumunu kontrol et
-        tumu_secili = all(var.get() for var in self.checkbox_vars.values())
-        
         # Eğer hepsi seçiliyse kaldır, değilse seç
-        if tumu_secili:
+        if self._tumu_secili_mi():
             self.tumunu_kaldir()
-            # Başlığı güncelle
-            self.tree.heading("Seç", text="☐")
         else:
             self.tumunu_sec()
-            # Başlığı güncelle
-            self.tree.heading("Seç", text="☑")
+    
+    def satir_kimligi(self, item: str) -> Optional[int]:
+        """Treeview item id'sini row_id'ye çevirir"""
+        kimlik = self._item_kimlikleri.get(item)
+        if kimlik is not None:
+            return kimlik
+        try:
+            return int(item)
+        except (TypeError, ValueError):
+            return None
     
     def secili_kitaplari_getir(self) -> list:
-        """Seçili kitapların indekslerini döndürür"""
-        secili_indeksler = []
-        for idx, var in self.checkbox_vars.items():
-            if var.get():
-                secili_indeksler.append(idx)
-        return secili_indeksler
+        """Seçili kitapların row_id'lerini döndürür (liste sırasıyla)"""
+        return sorted(self.secili_kimlikler, key=self.liste_modeli.index_of)
     
     def tumunu_sec(self):
-        """Tüm kitapları seç"""
+        """Tüm kitapları seç (tek küme ataması + ekrandaki satırları yeniden çiz)"""
         if not self.tree:
             return
         
-        children = list(self.tree.get_children())
-        for idx, var in self.checkbox_vars.items():
-            var.set(True)
-            # Treeview'de güncelle
-            if idx < len(children):
-                item = children[idx]
-                try:
-                    values = list(self.tree.item(item, "values"))
-                    if values:
-                        values[0] = "☑"
-                        self.tree.item(item, values=values)
-                        # Satırı seçili göster
-                        self.tree.selection_add(item)
-                except:
-                    pass
+        self.secili_kimlikler = set(self.liste_modeli.ids())
+        self._pencereyi_ciz()
+        self._baslik_guncelle()
     
     def tumunu_kaldir(self):
         """Tüm seçimleri kaldır"""
         if not self.tree:
             return
         
-        children = list(self.tree.get_children())
-        for idx, var in self.checkbox_vars.items():
-            var.set(False)
-            # Treeview'de güncelle
-            if idx < len(children):
-                item = children[idx]
-                try:
-                    values = list(self.tree.item(item, "values"))
-                    if values:
-                        values[0] = "☐"
-                        self.tree.item(item, values=values)
-                        # Satır seçimini kaldır
-                        self.tree.selection_remove(item)
-                except:
-                    pass
-    
-    def progress_goster(self, mesaj: str = "Bilgiler çekiliyor..."):
-        """Progress bar'ı gösterir"""
+        self.secili_kimlikler = set()
+        # Ekrandaki Treeview seçimi de kalkar (_pencereyi_ciz önceki seçimi korur)
+        self.tree.selection_set(())
+        self._pencereyi_ciz()
+        self._baslik_guncelle()
+    
+    def sonuc_tablosu_ac(self, toplam: int):
+        """
+        Hızlı toplu doldurma için canlı sonuç penceresini açar (form animasyonu yerine)
+        
+        ⚠️ DİKKAT: Tabloda en fazla SONUC_TABLOSU_SINIRI satır tutulur (en eskiler atılır)
+        """
+        if self.sonuc_penceresi is not None and self.sonuc_penceresi.winfo_exists():
+            self.sonuc_penceresi.destroy()
+        
+        pencere = tk.Toplevel(self.root)
+        pencere.title("⚡ Toplu Doldurma Sonuçları")
+        pencere.geometry("720x420")
+        pencere.configure(bg='#F5E6D3')
+        pencere.transient(self.root)
+        
+        self.sonuc_ozet_label = tk.Label(pencere, text=f"0/{toplam} kitap işlendi",
+                                         font=("Georgia", 11, "bold"),
+                                         bg='#F5E6D3', fg='#654321', pady=8)
+        self.sonuc_ozet_label.pack(fill=tk.X)
+        
+        tablo_frame = tk.Frame(pencere, bg='#F5E6D3')
+        tablo_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        
+        columns = ("Kitap Adı", "Yazar", "Durum", "Kaynak")
+        self.sonuc_tree = ttk.Treeview(tablo_frame, columns=columns, show="headings")
+        for col, genislik in zip(columns, (240, 180, 90, 150)):
+            self.sonuc_tree.heading(col, text=col)
+            self.sonuc_tree.column(col, width=genislik)
+        self.sonuc_tree.tag_configure("FAIL", foreground='#B22222')
+        self.sonuc_tree.tag_configure("PARTIAL", foreground='#B8860B')
+        
+        scrollbar = tk.Scrollbar(tablo_frame, orient=tk.VERTICAL, command=self.sonuc_tree.yview,
+                                 bg='#D2B48C', troughcolor='#F5E6D3', activebackground='#8B4513')
+        self.sonuc_tree.configure(yscrollcommand=scrollbar.set)
+        self.sonuc_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.sonuc_penceresi = pencere
+    
+    def sonuc_tablosu_ekle(self, satirlar: list):
+        """
+        Sonuç satırlarını (kitap adı, yazar, durum, kaynak) tabloya toplu ekler
+        
+        ⚠️ DİKKAT: Kullanıcı pencereyi kapattıysa sessizce atlanır - iş arka planda sürer
+        """
+        if self.sonuc_penceresi is None or not self.sonuc_penceresi.winfo_exists():
+            return
+        
+        # Sınırdan fazlası zaten atılacağı için sadece son satırlar eklenir
+        for satir in satirlar[-SONUC_TABLOSU_SINIRI:]:
+            self.sonuc_tree.insert("", tk.END, values=satir, tags=(satir[2],))
+        
+        # Sınır aşılırsa en eski satırları tek çağrıda at
+        cocuklar = self.sonuc_tree.get_children()
+        if len(cocuklar) > SONUC_TABLOSU_SINIRI:
+            self.sonuc_tree.delete(*cocuklar[:len(cocuklar) - SONUC_TABLOSU_SINIRI])
+            cocuklar = cocuklar[len(cocuklar) - SONUC_TABLOSU_SINIRI:]
+        if satirlar and cocuklar:
+            self.sonuc_tree.see(cocuklar[-1])
+    
+    def sonuc_ozeti_guncelle(self, islenen: int, toplam: int, basarili: int, basarisiz: int):
+        """Sonuç penceresindeki sayaçları günceller"""
+        if self.sonuc_penceresi is None or not self.sonuc_penceresi.winfo_exists():
+            return
+        self.sonuc_ozet_label.config(
+            text=f"{islenen}/{toplam} kitap işlendi   ✅ {basarili}   ❌ {basarisiz}")
+    
+    def islemleri_kilitle(self, kilitli: bool):
+        """Listeyi değiştiren / okuyan butonları kapatır veya açar (kütüphane yüklenirken)"""
+        durum = tk.DISABLED if kilitli else tk.NORMAL
+        for ad in YUKLEME_KILITLI:
+            if ad in self.butonlar:
+                self.butonlar[ad].config(state=durum)
+    
+    def progress_goster(self, mesaj: str = "Bilgiler çekiliyor...", iptal: Optional[Callable] = None,
+                        duraklat: Optional[Callable] = None):
+        """Progress bar'ı gösterir (iptal / duraklat verilirse yanında İptal / Duraklat butonu çıkar)"""
         if self.progress_frame and self.progress_bar and self.progress_label:
             self.progress_frame.grid()
             self.progress_bar.start()
             self.progress_label.config(text=mesaj)
+        if self.progress_duraklat_btn:
+            if duraklat is not None:
+                self.progress_duraklat_btn.config(command=duraklat, text="⏸ Duraklat", state=tk.NORMAL)
+                self.progress_duraklat_btn.pack(side=tk.LEFT, padx=5)
+            else:
+                self.progress_duraklat_btn.pack_forget()
+        if self.progress_iptal_btn:
+            if iptal is not None:
+                self.progress_iptal_btn.config(command=iptal, state=tk.NORMAL)
+                self.progress_iptal_btn.pack(side=tk.LEFT, padx=5)
+            else:
+                self.progress_iptal_btn.pack_forget()
     
     def progress_gizle(self):
         """Progress bar'ı gizler"""
         if self.progress_bar:
             self.progress_bar.stop()
+        if self.progress_iptal_btn:
+            self.progress_iptal_btn.pack_forget()
+        if self.progress_duraklat_btn:
+            self.progress_duraklat_btn.pack_forget()
         if self.progress_frame:
             self.progress_frame.grid_remove()
     
+    def progress_duraklat_guncelle(self, duraklatildi: bool):
+        """Duraklat butonunu duruma göre çevirir (duraklatılınca bar durur)"""
+        if self.progress_duraklat_btn:
+            self.progress_duraklat_btn.config(text="▶ Devam" if duraklatildi else "⏸ Duraklat")
+        if self.progress_bar:
+            if duraklatildi:
+                self.progress_bar.stop()
+            else:
+                self.progress_bar.start()
+    
     def progress_mesaj_guncelle(self, mesaj: str):
         """Progress bar mesajını günceller"""
         if self.progress_label:
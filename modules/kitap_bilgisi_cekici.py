@@ -3,13 +3,12 @@ Kitap Bilgisi Cekici Modulu
 Wikipedia, Google Books, Open Library ve Groq AI API'lerini kullanarak kitap bilgilerini ceker
 """
 
-import requests
 import re
+import threading
 from typing import Dict, Optional, List
 import time
 import json
 import os
-from bs4 import BeautifulSoup
 from urllib.parse import quote, unquote
 
 from field_policy import build_rules
@@ -17,19 +16,19 @@ from provenance import set_field, set_row_status
 from router import QuotaRouter
 from wikidata_client import qid_from_wikipedia, qid_from_sparql_search, fetch_entity, extract_fields
 from field_registry import ensure_row_schema
+from lazy_import import is_available, lazy_module
 
-# DuckDuckGo search için
-try:
-    # Yeni paket adı: ddgs (duckduckgo_search yerine)
-    try:
-        from ddgs import DDGS
-        DDG_AVAILABLE = True
-    except ImportError:
-        # Eski paket adı (backward compatibility)
-        from duckduckgo_search import DDGS
-        DDG_AVAILABLE = True
-except ImportError:
-    DDG_AVAILABLE = False
+# HTTP ve HTML ayrıştırma ilk bilgi çekmede yüklenir (program açılışında değil)
+requests = lazy_module("requests")
+bs4 = lazy_module("bs4")
+
+# DuckDuckGo search için - yeni paket adı ddgs, eski adı duckduckgo_search (backward compatibility)
+# ⚠️ Sadece kurulu mu diye bakılır; paket ilk web aramasında içe aktarılır
+DDG_MODULU = next((ad for ad in ("ddgs", "duckduckgo_search") if is_available(ad)), None)
+DDG_AVAILABLE = DDG_MODULU is not None
+if DDG_AVAILABLE:
+    ddg = lazy_module(DDG_MODULU)
+else:
     print("[WARNING] ddgs veya duckduckgo-search paketi yüklü değil. Web search kullanılamayacak.")
 
 
@@ -51,7 +50,28 @@ class KitapBilgisiCekici:
         self.huggingface_api_key = self._huggingface_key_yukle()
         # Router state for AI providers
         self.router = QuotaRouter()
-        self._last_status_code: Optional[int] = None
+        # ⚠️ Son HTTP durum kodu thread'e özel - toplu çalıştırmada worker'lar aynı nesneyi
+        # paylaşır, biri diğerinin 429/401'ini okursa sonuç atılır veya sağlayıcı ölü sayılır
+        self._yerel = threading.local()
+    
+    @property
+    def _last_status_code(self) -> Optional[int]:
+        """Bu thread'in son sağlayıcı çağrısının HTTP durum kodu"""
+        return getattr(self._yerel, "status_code", None)
+    
+    @_last_status_code.setter
+    def _last_status_code(self, value: Optional[int]):
+        self._yerel.status_code = value
+    
+    def _durum_kodlu(self, cagri, *args):
+        """
+        Sağlayıcı çağrısını yapar ve (sonuç, durum kodu) döndürür (QuotaRouter.call için)
+        
+        Kod çağrıdan önce sıfırlanır - HTTP isteğine varmadan dönen çağrı önceki kodu taşımaz
+        """
+        self._last_status_code = None
+        result = cagri(*args)
+        return result, self._last_status_code
     
     def _huggingface_key_yukle(self) -> str:
         """Hugging Face API key'i yukler (once dosyadan, sonra environment variable'dan)"""
@@ -122,16 +142,13 @@ class KitapBilgisiCekici:
         eksik_alanlar = [k for k, v in sonuc.items() if not v or v == ""]
         if eksik_alanlar:
             def _call_groq():
-                result = self._groq_ai_cek(kitap_adi, yazar, eksik_alanlar, sonuc)
-                return result, self._last_status_code
+                return self._durum_kodlu(self._groq_ai_cek, kitap_adi, yazar, eksik_alanlar, sonuc)
 
             def _call_hf():
-                result = self._huggingface_ai_cek(kitap_adi, yazar, eksik_alanlar, sonuc)
-                return result, self._last_status_code
+                return self._durum_kodlu(self._huggingface_ai_cek, kitap_adi, yazar, eksik_alanlar, sonuc)
 
             def _call_together():
-                result = self._together_ai_cek(kitap_adi, yazar, eksik_alanlar, sonuc)
-                return result, self._last_status_code
+                return self._durum_kodlu(self._together_ai_cek, kitap_adi, yazar, eksik_alanlar, sonuc)
 
             for name, fn in [("groq", _call_groq), ("hf", _call_hf), ("together", _call_together)]:
                 ai_data = self.router.call(name, fn)
@@ -552,7 +569,7 @@ class KitapBilgisiCekici:
             response = requests.get(search_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = bs4.BeautifulSoup(response.text, 'html.parser')
                 
                 # İlk sonucu bul
                 product = soup.find('div', class_='product-cr') or soup.find('div', class_='product-list')
@@ -604,7 +621,7 @@ class KitapBilgisiCekici:
             response = requests.get(search_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = bs4.BeautifulSoup(response.text, 'html.parser')
                 
                 # İlk sonucu bul
                 product = soup.find('div', {'data-component-type': 's-search-result'})
@@ -646,7 +663,7 @@ class KitapBilgisiCekici:
             response = requests.get(search_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = bs4.BeautifulSoup(response.text, 'html.parser')
                 
                 # İlk sonucu bul
                 product = soup.find('div', class_='product-item') or soup.find('div', class_='book-item')
@@ -692,7 +709,7 @@ class KitapBilgisiCekici:
         # Önce DuckDuckGo'yu dene (daha fazla sonuç ile)
         if DDG_AVAILABLE:
             try:
-                with DDGS() as ddgs:
+                with ddg.DDGS() as ddgs:
                     # Birden fazla arama varyasyonu dene
                     search_queries = []
                     if kitap_adi and yazar:
@@ -758,7 +775,7 @@ class KitapBilgisiCekici:
                             page_response = requests.get(wiki_page_url, timeout=10)
                             if page_response.status_code == 200:
                                 # HTML'den infobox bilgilerini çıkar
-                                soup = BeautifulSoup(page_response.text, 'html.parser')
+                                soup = bs4.BeautifulSoup(page_response.text, 'html.parser')
                                 infobox = soup.find('table', class_='infobox')
                                 infobox_text = ""
                                 if infobox:
@@ -871,7 +888,7 @@ class KitapBilgisiCekici:
         """Bir web sayfasının içeriğini çeker (token tasarrufu için kısaltılmış)"""
         try:
             response = requests.get(url, timeout=10, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = bs4.BeautifulSoup(response.text, 'html.parser')
             text = soup.get_text(separator=' ', strip=True)
             return text[:5000]  # Kısalt, token için
         except Exception as e:
@@ -1550,8 +1567,7 @@ Sadece JSON döndür."""
             print(f"[DEBUG] GPT-OSS-20B ile eksik alanlar dolduruluyor: {missing}")
             # Sadece Groq AI kullan (diğer AI'lar devre dışı)
             def _call_groq():
-                result = self._groq_ai_cek(kitap_adi, yazar, missing, row)
-                return result, self._last_status_code
+                return self._durum_kodlu(self._groq_ai_cek, kitap_adi, yazar, missing, row)
             
             ai_data = self.router.call("groq", _call_groq)
             if ai_data:
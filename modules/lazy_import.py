@@ -0,0 +1,47 @@
+"""
+Deferred imports for heavy dependencies (pandas, numpy, openpyxl, requests, bs4).
+`pd = lazy_module("pandas")` costs nothing at import time; the real module is
+imported on the first attribute access and cached. importlib.import_module
+holds the per-module import lock, so first use from several threads is safe.
+"""
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import Optional
+
+
+class LazyModule:
+    """
+    Modül vekili - ilk öznitelik erişiminde gerçek modülü içe aktarır
+
+    ⚠️ DİKKAT: Tip ipuçlarında (pd.DataFrame) kullanılan modüllerde
+    `from __future__ import annotations` gerekir, yoksa def satırı modülü yükler
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        durum = "yüklü" if self._module is not None else "yüklenmedi"
+        return f"<LazyModule {self._name} ({durum})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """İlk kullanımda yüklenecek modül vekili döndürür"""
+    return LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """Paket kurulu mu (içe aktarmadan - isteğe bağlı bağımlılık bayrakları için)"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
@@ -3,156 +3,518 @@ Liste Yonetimi Modulu
 Kitap listesi CRUD islemleri
 """
 
-from typing import List, Dict, Optional
-from tkinter import messagebox
+import threading
+import weakref
+from collections.abc import Sequence
+from typing import Iterable, List, Dict, Optional
 
-from field_registry import ensure_row_schema
+from field_registry import ensure_row_schema, ROW_ID_COLUMN, parse_row_id
+from search_index import SearchIndex
+from near_duplicates import find_near_duplicates
+from book_record import BookRecord
+
+
+class ListeGoruntusu(Sequence):
+    """
+    Kitap listesinin değişmez anlık görüntüsü (copy-on-write)
+
+    Görüntü canlı listeyi paylaşır: sona eklenen satırlar uzunluk sabit olduğu için
+    görünmez, yerinde güncellenen satırların eski hali ise _eski'ye yazılır (satır
+    düzeyinde copy-on-write). Liste sadece silme gibi kaydıran yazmalarda kopyalanır.
+
+    ⚠️ DİKKAT: Görüntüdeki satır dict'leri salt okunur kabul edilir.
+    Değiştirmek için kopyalayıp ListManager.guncelle_kimlik() kullan.
+    """
+
+    __slots__ = ("_satirlar", "_uzunluk", "_eski", "surum", "__weakref__")
+
+    def __init__(self, satirlar: List[Dict], surum: int):
+        self._satirlar = satirlar
+        self._uzunluk = len(satirlar)
+        # indeks -> görüntü alındığındaki satır (sonradan yerinde güncellenenler)
+        self._eski: Dict[int, Dict] = {}
+        self.surum = surum
+
+    def _satir(self, index: int) -> Dict:
+        # ⚠️ Önce liste, sonra _eski okunur - yazan taraf önce _eski'ye yazar (kilitsiz okuma)
+        satir = self._satirlar[index]
+        return self._eski.get(index, satir)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._satir(i) for i in range(*index.indices(self._uzunluk))]
+        if index < 0:
+            index += self._uzunluk
+        if not 0 <= index < self._uzunluk:
+            raise IndexError("ListeGoruntusu index out of range")
+        return self._satir(index)
+
+    def __len__(self) -> int:
+        return self._uzunluk
+
+    def __iter__(self):
+        return (self._satir(i) for i in range(self._uzunluk))
+
+    def __repr__(self) -> str:
+        return f"ListeGoruntusu(surum={self.surum}, {self._uzunluk} kitap)"
 
 
 class ListManager:
-    """Kitap listesi yonetimi icin sinif"""
-    
+    """
+    Kitap listesi yonetimi icin sinif
+
+    ⚠️ KRİTİK: Thread güvenliği
+    - Tüm yazma işlemleri tek bir kilit altında yapılır (Tk thread'i ve arka plan işçileri)
+    - Okuyucular anlik_goruntu() ile O(1) değişmez görüntü alır
+    - Güncelleme ve sona ekleme listeyi kopyalamaz (satır düzeyinde copy-on-write);
+      görüntü alınmışsa sadece silme listeyi bir kez kopyalar
+    """
+
     def __init__(self, kitap_listesi: List[Dict] = None):
         """
         Args:
             kitap_listesi: Baslangic kitap listesi
         """
+        self._kilit = threading.RLock()
+        self._surum = 0
+        self.arama_indeksi = SearchIndex()
         self.kitap_listesi = kitap_listesi or []
-    
+
+    @property
+    def kitap_listesi(self) -> ListeGoruntusu:
+        """Güncel listenin salt okunur görüntüsü (bkz. anlik_goruntu)"""
+        return self.anlik_goruntu()
+
+    @kitap_listesi.setter
+    def kitap_listesi(self, kitap_listesi: List[Dict]):
+        # ⚠️ Liste komple değişince satır kimlikleri ve arama indeksi yeniden kurulur
+        # - Geçerli row_id'ler korunur (Excel'den gelenler)
+        # - Eksik veya tekrarlanan row_id'lere yeni kimlik verilir
+        # - Satırlar BookRecord'a dönüştürülür (dict'e göre çok daha az bellek)
+        with self._kilit:
+            self._kitap_listesi = [BookRecord.from_row(k) for k in kitap_listesi]
+            # Listeyi paylaşan (hâlâ kullanılan) görüntüler
+            self._paylasanlar = weakref.WeakSet()
+            self._goruntu: Optional[ListeGoruntusu] = None
+            self._satirlar: Dict[int, Dict] = {}
+            self._son_kimlik = 0
+            for kitap in self._kitap_listesi:
+                kimlik = parse_row_id(kitap.get(ROW_ID_COLUMN))
+                if kimlik is not None and kimlik not in self._satirlar:
+                    self._satirlar[kimlik] = kitap
+                    kitap[ROW_ID_COLUMN] = kimlik
+                    self._son_kimlik = max(self._son_kimlik, kimlik)
+            for kitap in self._kitap_listesi:
+                if self._satirlar.get(parse_row_id(kitap.get(ROW_ID_COLUMN))) is not kitap:
+                    kimlik = self._yeni_kimlik()
+                    kitap[ROW_ID_COLUMN] = kimlik
+                    self._satirlar[kimlik] = kitap
+            self._konumlar: Optional[Dict[int, int]] = None
+            # Son checkpoint'ten bu yana değişen / silinen row_id'ler (bkz. degisiklikleri_al)
+            self._kirli: set = set()
+            self._silinen: set = set()
+            # İndeks ilk aramada kurulur (büyük listelerde açılışı yavaşlatmasın)
+            self.arama_indeksi.clear()
+            self._indeks_hazir = False
+            self._surum += 1
+
+    @property
+    def surum(self) -> int:
+        """Her yazma işleminde artan sürüm numarası"""
+        return self._surum
+
+    def anlik_goruntu(self) -> ListeGoruntusu:
+        """
+        Listenin değişmez anlık görüntüsünü döndürür (kopyalama yok)
+
+        Aynı sürüm için aynı görüntü nesnesi döner. Görüntü alındıktan sonraki
+        yazmalar görüntüyü değiştirmez (bkz. ListeGoruntusu).
+
+        Returns:
+            ListeGoruntusu (Sequence - len, indeks, dilim, iterasyon destekler)
+        """
+        with self._kilit:
+            if self._goruntu is None or self._goruntu.surum != self._surum:
+                self._goruntu = ListeGoruntusu(self._kitap_listesi, self._surum)
+                self._paylasanlar.add(self._goruntu)
+            return self._goruntu
+
+    def _yazmaya_hazirla(self, kaydiran: bool = False):
+        """
+        Yazmadan önce çağrılır (kilit altında)
+
+        Args:
+            kaydiran: Satırları kaydıran yazma (silme) - liste bir görüntüyle
+                paylaşılıyorsa kopyalanır; güncelleme / sona ekleme kopyalamaz
+        """
+        if kaydiran and self._paylasanlar:
+            self._kitap_listesi = list(self._kitap_listesi)
+            self._paylasanlar = weakref.WeakSet()
+        self._surum += 1
+
+    def _satiri_degistir(self, index: int, kitap: Dict):
+        """Satırı yerinde değiştirir; paylaşan görüntüler eski satırı korur (kilit altında)"""
+        eski = self._kitap_listesi[index]
+        for goruntu in self._paylasanlar:
+            if index < goruntu._uzunluk:
+                goruntu._eski.setdefault(index, eski)
+        self._kitap_listesi[index] = kitap
+
+    def _yeni_kimlik(self) -> int:
+        self._son_kimlik += 1
+        return self._son_kimlik
+
+    def _konum_haritasi(self) -> Dict[int, int]:
+        """row_id -> liste indeksi (silmeden sonra tembel olarak yeniden kurulur)"""
+        if self._konumlar is None:
+            self._konumlar = {k[ROW_ID_COLUMN]: i for i, k in enumerate(self._kitap_listesi)}
+        return self._konumlar
+
+    def _indeksi_hazirla(self):
+        """Arama indeksi henüz kurulmadıysa tek seferde kurar"""
+        if not self._indeks_hazir:
+            self.arama_indeksi.rebuild(self._satirlar.items())
+            self._indeks_hazir = True
+
+    def _satir_ekle(self, kitap: Dict):
+        """Satırı listeye, kimlik tablosuna ve arama indeksine ekler (kilit altında)"""
+        kitap = BookRecord.from_row(kitap)
+        kimlik = parse_row_id(kitap.get(ROW_ID_COLUMN))
+        if kimlik is None or kimlik in self._satirlar:
+            kimlik = self._yeni_kimlik()
+        else:
+            self._son_kimlik = max(self._son_kimlik, kimlik)
+        kitap[ROW_ID_COLUMN] = kimlik
+        self._kitap_listesi.append(kitap)
+        self._satirlar[kimlik] = kitap
+        self._kirli.add(kimlik)
+        self._silinen.discard(kimlik)
+        if self._konumlar is not None:
+            self._konumlar[kimlik] = len(self._kitap_listesi) - 1
+        if self._indeks_hazir:
+            self.arama_indeksi.add(kimlik, kitap)
+
     def ekle(self, kitap: Dict, tekrar_kontrol: bool = True) -> tuple[bool, Optional[str]]:
         """
         Kitap ekler
-        
+
         Args:
             kitap: Eklenecek kitap dict'i
             tekrar_kontrol: Ayni kitap kontrolu yapilsin mi
-            
+
         Returns:
             (Basarili mi, Hata mesaji)
         """
         kitap_adi = kitap.get("Kitap Adı", "").strip()
-        
+
         if not kitap_adi:
             return False, "Kitap Adi bos olamaz!"
-        
-        # Tekrar kontrolü
-        if tekrar_kontrol:
-            mevcut_isimler = [k.get("Kitap Adı", "").lower() for k in self.kitap_listesi]
-            if kitap_adi.lower() in mevcut_isimler:
-                return False, f"'{kitap_adi}' adli kitap zaten listede var!"
-        
-        self.kitap_listesi.append(ensure_row_schema(kitap))
+
+        with self._kilit:
+            # Tekrar kontrolü
+            if tekrar_kontrol:
+                mevcut_isimler = [k.get("Kitap Adı", "").lower() for k in self._kitap_listesi]
+                if kitap_adi.lower() in mevcut_isimler:
+                    return False, f"'{kitap_adi}' adli kitap zaten listede var!"
+
+            self._yazmaya_hazirla()
+            self._satir_ekle(ensure_row_schema(kitap))
         return True, None
-    
+
     def sil(self, index: int) -> tuple[bool, Optional[Dict]]:
         """
         Kitap siler
-        
+
         Args:
             index: Silinecek kitabin indeksi
-            
+
         Returns:
             (Basarili mi, Silinen kitap)
         """
-        if 0 <= index < len(self.kitap_listesi):
-            silinen = self.kitap_listesi.pop(index)
-            return True, silinen
+        with self._kilit:
+            if 0 <= index < len(self._kitap_listesi):
+                self._yazmaya_hazirla(kaydiran=True)
+                silinen = self._kitap_listesi.pop(index)
+                kimlik = silinen.get(ROW_ID_COLUMN)
+                self._satirlar.pop(kimlik, None)
+                self._kirli.discard(kimlik)
+                self._silinen.add(kimlik)
+                self._konumlar = None
+                if self._indeks_hazir:
+                    self.arama_indeksi.remove(kimlik)
+                return True, silinen
         return False, None
-    
+
+    def sil_kimlik(self, kimlik: int) -> tuple[bool, Optional[Dict]]:
+        """
+        Kitabı row_id ile siler
+
+        Returns:
+            (Basarili mi, Silinen kitap)
+        """
+        with self._kilit:
+            index = self.konum(kimlik)
+            if index is None:
+                return False, None
+            return self.sil(index)
+
+    def toplu_sil_kimlik(self, kimlikler: List[int]) -> List[Dict]:
+        """
+        Birden fazla kitabı row_id ile tek geçişte siler
+
+        Returns:
+            Silinen kitaplar (liste sırasıyla)
+        """
+        with self._kilit:
+            silinecek = {k for k in kimlikler if k in self._satirlar}
+            if not silinecek:
+                return []
+            kalan, silinenler = [], []
+            for kitap in self._kitap_listesi:
+                (silinenler if kitap[ROW_ID_COLUMN] in silinecek else kalan).append(kitap)
+            # Yeni liste oluşturulduğu için ayrıca kopyalamaya gerek yok
+            self._kitap_listesi = kalan
+            self._paylasanlar = weakref.WeakSet()
+            self._surum += 1
+            for kitap in silinenler:
+                self._satirlar.pop(kitap[ROW_ID_COLUMN], None)
+                self._kirli.discard(kitap[ROW_ID_COLUMN])
+                self._silinen.add(kitap[ROW_ID_COLUMN])
+                if self._indeks_hazir:
+                    self.arama_indeksi.remove(kitap[ROW_ID_COLUMN])
+            self._konumlar = None
+            return silinenler
+
+    def guncelle(self, index: int, kitap: Dict) -> bool:
+        """
+        Kitabı yerinde günceller (arama indeksi de güncellenir)
+
+        Args:
+            index: Güncellenecek kitabın indeksi
+            kitap: Yeni kitap dict'i (mevcut dict yerine geçer, mevcut dict değiştirilmez)
+
+        Returns:
+            Başarılı ise True
+        """
+        with self._kilit:
+            if 0 <= index < len(self._kitap_listesi):
+                self._yazmaya_hazirla()
+                # ⚠️ row_id değişmez - yeni dict'te boş/farklı gelse bile korunur
+                kitap = BookRecord.from_row(kitap)
+                kimlik = self._kitap_listesi[index][ROW_ID_COLUMN]
+                kitap[ROW_ID_COLUMN] = kimlik
+                self._satiri_degistir(index, kitap)
+                self._satirlar[kimlik] = kitap
+                self._kirli.add(kimlik)
+                if self._indeks_hazir:
+                    self.arama_indeksi.update(kimlik, kitap)
+                return True
+        return False
+
+    def guncelle_kimlik(self, kimlik: int, kitap: Dict) -> bool:
+        """
+        Kitabı row_id ile O(1) günceller
+
+        Returns:
+            Başarılı ise True
+        """
+        with self._kilit:
+            index = self.konum(kimlik)
+            if index is None:
+                return False
+            return self.guncelle(index, kitap)
+
+    def degisiklikleri_al(self) -> tuple[List[Dict], List[int]]:
+        """
+        Son çağrıdan bu yana değişen satırları ve silinen row_id'leri döndürür ve sıfırlar
+        (checkpoint günlüğü için - maliyet değişen satır sayısı kadar)
+
+        Returns:
+            (Değişen satırlar - row_id sırasıyla, Silinen row_id'ler)
+        """
+        with self._kilit:
+            degisenler = [self._satirlar[k] for k in sorted(self._kirli)]
+            silinenler = sorted(self._silinen)
+            self._kirli = set()
+            self._silinen = set()
+            return degisenler, silinenler
+
+    def kirli_isaretle(self, kimlikler: List[int], silinenler: List[int] = ()):
+        """
+        degisiklikleri_al ile alınıp yazılamayan değişiklikleri geri işaretler
+        (sonraki checkpoint satırların o anki halini yazar)
+        """
+        with self._kilit:
+            self._kirli.update(k for k in kimlikler if k in self._satirlar)
+            self._silinen.update(k for k in silinenler if k not in self._satirlar)
+
+    def getir_kimlik(self, kimlik: int) -> Optional[Dict]:
+        """
+        Kitabı row_id ile getirir
+
+        Returns:
+            Kitap dict'i veya None
+        """
+        with self._kilit:
+            return self._satirlar.get(kimlik)
+
+    def konum(self, kimlik: int) -> Optional[int]:
+        """
+        row_id'nin listedeki indeksini döndürür
+
+        Returns:
+            İndeks veya None
+        """
+        with self._kilit:
+            return self._konum_haritasi().get(kimlik)
+
     def getir(self, index: int) -> Optional[Dict]:
         """
         Kitap getirir
-        
+
         Args:
             index: Kitabin indeksi
-            
+
         Returns:
             Kitap dict'i veya None
         """
-        if 0 <= index < len(self.kitap_listesi):
-            return self.kitap_listesi[index]
+        with self._kilit:
+            if 0 <= index < len(self._kitap_listesi):
+                return self._kitap_listesi[index]
         return None
-    
+
     def tumunu_getir(self) -> List[Dict]:
         """
-        Tum kitap listesini getirir
-        
+        Tum kitap listesini getirir (değiştirilebilir kopya)
+
+        💡 Sadece okumak için anlik_goruntu() kullan - kopyalama yapmaz
+
         Returns:
             Kitap listesi
         """
-        return self.kitap_listesi.copy()
-    
+        return list(self.anlik_goruntu())
+
     def sayi(self) -> int:
         """
         Kitap sayisini dondurur
-        
+
         Returns:
             Kitap sayisi
         """
-        return len(self.kitap_listesi)
-    
+        with self._kilit:
+            return len(self._kitap_listesi)
+
     def temizle(self):
         """Listeyi temizler"""
         self.kitap_listesi = []
-    
+
     def toplu_ekle(self, kitaplar: List[Dict], tekrar_kontrol: bool = True) -> Dict[str, List]:
         """
         Toplu kitap ekler
-        
+
         Args:
             kitaplar: Eklenecek kitap listesi
             tekrar_kontrol: Tekrar kontrolu yapilsin mi
-            
+
         Returns:
             {
                 'eklenen': [eklenen kitaplar],
                 'atlanan': [atlanan kitaplar]
             }
         """
-        mevcut_isimler = [k.get("Kitap Adı", "").lower() for k in self.kitap_listesi]
-        eklenecekler = []
-        atlananlar = []
-        
-        for kitap in kitaplar:
-            kitap_adi = kitap.get("Kitap Adı", "").strip()
-            yazar = kitap.get("Yazar", "").strip()
-            
-            # Zorunlu alan kontrolü
-            if not kitap_adi or not yazar:
-                continue
-            
-            if tekrar_kontrol and kitap_adi.lower() in mevcut_isimler:
-                atlananlar.append(kitap_adi)
-            else:
-                eklenecekler.append(ensure_row_schema(kitap))
-                mevcut_isimler.append(kitap_adi.lower())
-        
-        # Ekle
-        self.kitap_listesi.extend(eklenecekler)
-        
+        with self._kilit:
+            # Parça parça yüklemede her çağrı tüm listeyi tarar - küme ile O(1) kontrol
+            mevcut_isimler = {k.get("Kitap Adı", "").lower() for k in self._kitap_listesi}
+            eklenecekler = []
+            atlananlar = []
+
+            for kitap in kitaplar:
+                kitap_adi = kitap.get("Kitap Adı", "").strip()
+                yazar = kitap.get("Yazar", "").strip()
+
+                # Zorunlu alan kontrolü
+                if not kitap_adi or not yazar:
+                    continue
+
+                if tekrar_kontrol and kitap_adi.lower() in mevcut_isimler:
+                    atlananlar.append(kitap_adi)
+                else:
+                    eklenecekler.append(BookRecord(ensure_row_schema(kitap)))
+                    mevcut_isimler.add(kitap_adi.lower())
+
+            # Ekle
+            if eklenecekler:
+                self._yazmaya_hazirla()
+            for kitap in eklenecekler:
+                self._satir_ekle(kitap)
+
         return {
             'eklenen': eklenecekler,
             'atlanan': atlananlar
         }
-    
-    def ara(self, arama_terimi: str) -> List[Dict]:
+
+    def ara(self, arama_terimi: str, alanlar: Optional[List[str]] = None,
+            mod: str = "substring") -> List[Dict]:
         """
-        Kitap arar
-        
+        Kitap arar (Türkçe katlamalı ters indeks üzerinden)
+
         Args:
-            arama_terimi: Aranacak terim
-            
-        Returns:
-            Bulunan kitaplar listesi
-        """
-        arama_lower = arama_terimi.lower()
-        sonuclar = []
-        
-        for kitap in self.kitap_listesi:
-            kitap_adi = kitap.get("Kitap Adı", "").lower()
-            yazar = kitap.get("Yazar", "").lower()
-            
-            if arama_lower in kitap_adi or arama_lower in yazar:
-                sonuclar.append(kitap)
-        
-        return sonuclar
+            arama_terimi: Aranacak terim (her kelime eşleşmeli)
+            alanlar: Aranacak alanlar (None ise Kitap Adı, Yazar, Orijinal Adı, Tür, Ülke)
+            mod: "substring" (varsayılan), "prefix" veya "exact"
+
+        Returns:
+            Bulunan kitaplar listesi (liste sırasıyla)
+        """
+        if not arama_terimi or not arama_terimi.strip():
+            return self.tumunu_getir()
+        with self._kilit:
+            return [self._satirlar[k] for k in self.ara_kimlikler(arama_terimi, alanlar, mod)]
+
+    def ara_kimlikler(self, arama_terimi: str, alanlar: Optional[List[str]] = None,
+                      mod: str = "substring") -> List[int]:
+        """
+        Eşleşen satırların kimliklerini liste sırasıyla döndürür
+
+        Returns:
+            row_id listesi
+        """
+        with self._kilit:
+            self._indeksi_hazirla()
+            kimlikler = self.arama_indeksi.search(arama_terimi, fields=alanlar, mode=mod)
+            return sorted(kimlikler, key=self._konum_haritasi().__getitem__)
+
+    def alanlarda_ara(self, kriterler: Dict[str, str], mod: str = "substring") -> List[Dict]:
+        """
+        Çok alanlı arama
+
+        Args:
+            kriterler: {"Yazar": "tolstoy", "Tür": "roman"} gibi alan -> terim
+            mod: "substring", "prefix" veya "exact"
+
+        Returns:
+            Tüm kriterleri sağlayan kitaplar (liste sırasıyla)
+        """
+        with self._kilit:
+            self._indeksi_hazirla()
+            kimlikler = self.arama_indeksi.search_fields(kriterler, mode=mod)
+            konumlar = self._konum_haritasi()
+            return [self._satirlar[k] for k in sorted(kimlikler, key=konumlar.__getitem__)]
+
+    def yakin_tekrarlari_bul(self, kitaplar: List[Dict], esik: float = 0.6,
+                             haric: Iterable[int] = ()) -> List[Dict]:
+        """
+        İçe aktarılan kitapların yakın tekrarlarını bulur (MinHash/LSH)
+
+        Args:
+            kitaplar: İçe aktarılan kitaplar
+            esik: Tahmini Jaccard benzerlik eşiği
+            haric: Mevcut sayılmayacak row_id'ler (toplu_ekle sonrası eklenenleri
+                tekrar saymamak için - listede nerede oldukları önemli değil)
+
+        Returns:
+            Küme raporu (bkz. near_duplicates.find_near_duplicates)
+        """
+        haric = set(haric)
+        mevcut = [k for k in self.anlik_goruntu() if k.get(ROW_ID_COLUMN) not in haric]
+        return find_near_duplicates(mevcut, kitaplar, threshold=esik)
@@ -0,0 +1,216 @@
+"""
+Near-duplicate detection for book rows using MinHash + LSH banding.
+Titles and authors are normalized (Turkish folding, edition noise,
+transliteration variants) and shingled into character n-grams.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+from lazy_import import lazy_module
+from search_index import fold_tr
+
+# numpy ilk imza hesabında yüklenir (ListManager import edilirken değil)
+np = lazy_module("numpy")
+
+# Baskı/cilt gürültüsü (katlanmış halde) - sadece parantez içinde veya sondaki
+# ayrılmış ekte atılır ("- Cep Boy"); başlığın kendisindeki "Yeni Hayat" korunur
+EDITION_NOISE = {
+    "ciltli", "ciltsiz", "karton", "kapak", "sert", "ozel", "baski", "baskisi",
+    "cep", "boy", "kutulu", "set", "tam", "metin", "kisaltilmis", "yeni",
+}
+
+_PAREN_RE = re.compile(r"[\(\[\{].*?[\)\]\}]")
+_SUFFIX_SEP_RE = re.compile(r"[-–—:/|,;]")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _is_edition_suffix(segment: str) -> bool:
+    """Ek sadece baskı gürültüsü (ve "2. baskı" gibi sayılar) içeriyorsa True."""
+    words = [w for w in _NON_WORD_RE.split(segment) if w]
+    return (any(w in EDITION_NOISE for w in words)
+            and all(w in EDITION_NOISE or w.isdigit() for w in words))
+
+
+def normalize_title(title: str) -> str:
+    """Parantez içlerini, sondaki baskı eklerini ("- Karton Kapak") ve noktalamayı atar."""
+    segments = _SUFFIX_SEP_RE.split(_PAREN_RE.sub(" ", fold_tr(title)))
+    while len(segments) > 1 and _is_edition_suffix(segments[-1]):
+        segments.pop()
+    words = [w for w in _NON_WORD_RE.split(" ".join(segments)) if w]
+    return " ".join(words)
+
+
+def normalize_author(author: str) -> str:
+    """
+    Yazar adını katlar ve yaygın transliterasyon farklarını birleştirir:
+    Dostoyevski / Dostoevsky -> dostoevski, Tolstoy / Tolstoi -> tolstoi
+    """
+    text = _NON_WORD_RE.sub(" ", fold_tr(author)).strip()
+    text = re.sub(r"(?<=[aeiou])y(?=[aeiou])", "", text)
+    text = re.sub(r"y\b", "i", text)
+    text = text.replace("ph", "f").replace("w", "v").replace("ck", "k")
+    return text
+
+
+def shingles(text: str, n: int = 3) -> List[str]:
+    """Boşlukla çevrelenmiş metnin karakter n-gramları."""
+    if not text:
+        return []
+    padded = f" {text} "
+    if len(padded) <= n:
+        return [padded]
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+class NearDuplicateDetector:
+    """
+    MinHash imzaları + LSH bantlarıyla yakın tekrar kümeleri bulur.
+
+    Her satır için imza O(shingle sayısı) sürer; bant kovaları içinde her üye
+    yalnızca kovanın temsilcisiyle karşılaştırıldığından toplam iş doğrusaldır.
+    """
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = 64, bands: int = 16, ngram: int = 3,
+                 seed: int = 1):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.ngram = ngram
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MAX_HASH, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MAX_HASH, size=num_perm, dtype=np.uint64)
+        self._keys: List[Hashable] = []
+        self._features_list: List[List[int]] = []
+        self._labels: List[str] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _features(self, title: str, author: str) -> List[int]:
+        feats = ["t" + s for s in shingles(normalize_title(title), self.ngram)]
+        feats += ["a" + s for s in shingles(normalize_author(author), self.ngram)]
+        return [zlib.crc32(f.encode("utf-8")) for f in set(feats)]
+
+    def add(self, key: Hashable, title: str, author: str) -> None:
+        feats = self._features(title, author)
+        if not feats:
+            return
+        self._keys.append(key)
+        self._features_list.append(feats)
+        self._labels.append(f"{title} - {author}".strip(" -"))
+        self._matrix = None
+
+    def _signatures(self, chunk_rows: int = 2048) -> np.ndarray:
+        """
+        Tüm satırların MinHash imzalarını (n, num_perm) matris olarak hesaplar.
+        Satırlar parça parça işlenir; her parçada min, reduceat ile tek çağrıda alınır.
+        """
+        if self._matrix is not None:
+            return self._matrix
+        n = len(self._features_list)
+        out = np.empty((n, self.num_perm), dtype=np.uint64)
+        a = self._a[:, None]
+        b = self._b[:, None]
+        for start in range(0, n, chunk_rows):
+            chunk = self._features_list[start:start + chunk_rows]
+            lengths = np.fromiter((len(f) for f in chunk), dtype=np.int64, count=len(chunk))
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            h = np.fromiter((x for f in chunk for x in f), dtype=np.uint64, count=int(lengths.sum()))
+            # (a*h + b) mod p, 32 bite indirgenmiş
+            values = ((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH
+            out[start:start + len(chunk)] = np.minimum.reduceat(values, offsets, axis=1).T
+        self._matrix = out
+        return out
+
+    def similarity(self, i: int, j: int) -> float:
+        """İki imza arasındaki tahmini Jaccard benzerliği."""
+        sigs = self._signatures()
+        return float(np.mean(sigs[i] == sigs[j]))
+
+    def clusters(self) -> List[List[int]]:
+        """Yakın tekrar kümelerini (iç indeks listeleri olarak) döndürür."""
+        sigs = self._signatures()
+        n = len(sigs)
+        parent = list(range(n))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        r = self.rows_per_band
+        for band in range(self.bands):
+            band_sigs = np.ascontiguousarray(sigs[:, band * r:(band + 1) * r])
+            band_keys = band_sigs.view(np.dtype((np.void, band_sigs.dtype.itemsize * r))).ravel()
+            _, first, inverse = np.unique(band_keys, return_index=True, return_inverse=True)
+            # Her satır yalnızca kovasının ilk üyesiyle (temsilci) karşılaştırılır
+            rep = first[inverse.ravel()]
+            members = np.nonzero(rep != np.arange(n))[0]
+            if not len(members):
+                continue
+            sim = (sigs[members] == sigs[rep[members]]).mean(axis=1)
+            for idx, rep_idx in zip(members[sim >= self.threshold], rep[members][sim >= self.threshold]):
+                ri, rr = find(int(idx)), find(int(rep_idx))
+                if ri != rr:
+                    parent[ri] = rr
+
+        groups: Dict[int, List[int]] = {}
+        for idx in range(n):
+            groups.setdefault(find(idx), []).append(idx)
+        return [g for g in groups.values() if len(g) > 1]
+
+
+def find_near_duplicates(
+    existing: Sequence[Mapping[str, object]],
+    incoming: Sequence[Mapping[str, object]],
+    threshold: float = 0.6,
+) -> List[Dict[str, object]]:
+    """
+    Mevcut kütüphane + içe aktarılan kayıtlar üzerinde yakın tekrar kümelerini raporlar.
+    Yalnızca en az bir içe aktarılan kaydı içeren kümeler döndürülür.
+
+    Returns:
+        [{"existing": [mevcut indeksleri], "incoming": [yeni indeksler],
+          "labels": ["Kitap - Yazar", ...]}, ...]
+    """
+    detector = NearDuplicateDetector(threshold=threshold)
+    for i, row in enumerate(existing):
+        detector.add(("existing", i), str(row.get("Kitap Adı", "") or ""), str(row.get("Yazar", "") or ""))
+    for i, row in enumerate(incoming):
+        detector.add(("incoming", i), str(row.get("Kitap Adı", "") or ""), str(row.get("Yazar", "") or ""))
+
+    report: List[Dict[str, object]] = []
+    for group in detector.clusters():
+        keys: List[Tuple[str, int]] = [detector._keys[i] for i in group]
+        new_idx = [i for kind, i in keys if kind == "incoming"]
+        if not new_idx:
+            continue
+        report.append({
+            "existing": [i for kind, i in keys if kind == "existing"],
+            "incoming": new_idx,
+            "labels": [detector._labels[i] for i in group],
+        })
+    return report
+
+
+def redundant_incoming(report: Sequence[Mapping[str, object]]) -> List[int]:
+    """
+    Zenginleştirmeye gerek olmayan içe aktarılan kayıt indeksleri:
+    küme mevcut bir kayıt içeriyorsa tüm yeniler, aksi halde ilki hariç yeniler.
+    """
+    out: List[int] = []
+    for cluster in report:
+        incoming = sorted(cluster["incoming"])
+        out.extend(incoming if cluster["existing"] else incoming[1:])
+    return sorted(out)
@@ -0,0 +1,100 @@
+"""
+Throttled progress channel between worker threads and the Tk event loop.
+Workers post state (coalesced: only the latest value per key survives), result
+rows (appended) and one-off events; the Tk side drains everything on a fixed
+tick and applies it in one pass. However fast the workers run, the event loop
+sees at most one drain per tick instead of one root.after call per update.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Tk tarafının kanalı boşaltma aralığı (milisaniye)
+TICK_MS = 100
+
+
+class ProgressChannel:
+    """
+    Thread-safe ilerleme/sonuç kanalı
+
+    ⚠️ DİKKAT: handler ve olaylar sadece attach'e verilen zamanlayıcının thread'inde
+    (GUI: Tk thread'i) çalışır; post_* çağrıları her thread'den yapılabilir
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {}
+        self._rows: List[Any] = []
+        self._events: List[Callable[[], None]] = []
+        self._after: Optional[Callable] = None
+        self._handler: Optional[Callable[[Dict[str, Any], List[Any]], None]] = None
+        self._interval = TICK_MS
+        self._job = None
+
+    def post_state(self, key: str, value: Any) -> None:
+        """Durum bildirir - aynı anahtardaki önceki (uygulanmamış) değerin yerine geçer"""
+        with self._lock:
+            self._state[key] = value
+
+    def post_ids(self, key: str, ids: Iterable[Any]) -> None:
+        """Durum anahtarındaki kümeye kimlik ekler - tick içinde birleşir, hiçbiri atlanmaz"""
+        with self._lock:
+            self._state.setdefault(key, set()).update(ids)
+
+    def post_rows(self, rows: List[Any]) -> None:
+        """Sonuç satırları ekler (hiçbiri atlanmaz, sırası korunur)"""
+        with self._lock:
+            self._rows.extend(rows)
+
+    def post_event(self, callback: Callable[[], None]) -> None:
+        """Tek seferlik iş (bitti mesajı vb.) - aynı boşaltmadaki durum ve satırlardan sonra çalışır"""
+        with self._lock:
+            self._events.append(callback)
+
+    def drain(self) -> Tuple[Dict[str, Any], List[Any], List[Callable[[], None]]]:
+        """Biriken her şeyi alır ve kanalı boşaltır"""
+        with self._lock:
+            state, self._state = self._state, {}
+            rows, self._rows = self._rows, []
+            events, self._events = self._events, []
+        return state, rows, events
+
+    def attach(self, after: Callable, handler: Callable[[Dict[str, Any], List[Any]], None],
+               interval_ms: int = TICK_MS) -> None:
+        """
+        Kanalı düzenli boşaltmaya başlar
+
+        Args:
+            after: Zamanlayıcı (GUI: root.after) - after(ms, fn) imzası
+            handler: Boş olmayan her boşaltmada (durum, satırlar) ile çağrılır
+            interval_ms: Boşaltma aralığı
+        """
+        self._after = after
+        self._handler = handler
+        self._interval = interval_ms
+        self._job = after(interval_ms, self._tick)
+
+    def detach(self) -> None:
+        """Sonraki tick'i planlamaz (pencere kapanırken)"""
+        self._after = None
+
+    def flush(self) -> None:
+        """Bekleyenleri hemen uygular (tick'i beklemeden)"""
+        state, rows, events = self.drain()
+        if (state or rows) and self._handler is not None:
+            try:
+                self._handler(state, rows)
+            except Exception as e:
+                print(f"İlerleme uygulama hatası: {e}")
+        for event in events:
+            try:
+                event()
+            except Exception as e:
+                print(f"İlerleme olayı hatası: {e}")
+
+    def _tick(self) -> None:
+        try:
+            self.flush()
+        finally:
+            if self._after is not None:
+                self._job = self._after(self._interval, self._tick)
@@ -1,8 +1,11 @@
 """
 Quota-aware router for AI providers.
+Shared by every worker thread of a batch run, so provider state is guarded by
+a lock; the provider call itself runs outside it.
 """
 
 import random
+import threading
 import time
 from typing import Callable, Dict, Optional, Tuple
 
@@ -28,29 +31,34 @@ class ProviderState:
 class QuotaRouter:
     def __init__(self) -> None:
         self.states: Dict[str, ProviderState] = {}
+        self._lock = threading.Lock()
 
     def _state(self, name: str) -> ProviderState:
-        if name not in self.states:
-            self.states[name] = ProviderState()
-        return self.states[name]
+        with self._lock:
+            if name not in self.states:
+                self.states[name] = ProviderState()
+            return self.states[name]
 
     def call(self, name: str, fn: Callable[[], Tuple[Optional[dict], Optional[int]]]) -> Optional[dict]:
         """
         fn returns (result, status_code)
         """
         state = self._state(name)
-        if not state.available():
-            return None
+        with self._lock:
+            if not state.available():
+                return None
 
         result, status_code = fn()
         if status_code is None:
             return result
 
         if status_code in (401, 403):
-            state.mark_dead()
+            with self._lock:
+                state.mark_dead()
             return None
         if status_code in (429, 503):
-            state.cooldown(10)
+            with self._lock:
+                state.cooldown(10)
             return None
 
         return result
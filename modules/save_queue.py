@@ -0,0 +1,126 @@
+"""
+Single background writer for full Excel saves.
+Save requests from the Tk thread and the batch thread are coalesced: a burst
+of requests within the debounce window becomes one write, and every caller's
+callback receives that write's result through the notify hook (the GUI's
+ProgressChannel.post_event), so no caller blocks on Excel I/O.
+"""
+
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+# Son istekten sonra bu kadar sessizlik olunca yazılır (saniye)
+DEBOUNCE_SECONDS = 0.5
+
+
+class SaveQueue:
+    """
+    Birleştirilen (debounced) arka plan kaydetme kuyruğu
+
+    ⚠️ DİKKAT: save fonksiyonu tek bir worker thread'de çalışır - aynı anda iki yazma olmaz
+    """
+
+    def __init__(self, save: Callable[[], Any],
+                 notify: Optional[Callable[[Callable[[], None]], Any]] = None,
+                 debounce: float = DEBOUNCE_SECONDS):
+        """
+        Args:
+            save: Asıl kaydetme işi (sonucu callback'lere iletilir)
+            notify: Callback'leri çalıştıracak zamanlayıcı (GUI: ilerleme_kanali.post_event)
+                    ⚠️ Worker thread'inden çağrılır - Tk'yi doğrudan çağırmamalı
+            debounce: Birleştirme penceresi (saniye)
+        """
+        self._save = save
+        self._notify = notify or (lambda fn: fn())
+        self._debounce = debounce
+        self._cond = threading.Condition()
+        self._pending = False
+        self._busy = False
+        self._closed = False
+        self._due = 0.0
+        self._callbacks: List[Callable[[Any], None]] = []
+        self._thread = threading.Thread(target=self._run, name="SaveQueue", daemon=True)
+        self._thread.start()
+
+    def request(self, callback: Optional[Callable[[Any], None]] = None, immediate: bool = False) -> None:
+        """
+        Kaydetme ister; bekleyen istek varsa onunla birleşir
+
+        Args:
+            callback: Yazma bitince sonuçla çağrılır (notify üzerinden)
+            immediate: Birleştirme penceresini bekleme (kullanıcı "Kaydet"e bastı)
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SaveQueue kapatıldı")
+            self._pending = True
+            due = time.monotonic() + (0 if immediate else self._debounce)
+            self._due = min(self._due, due) if immediate else max(self._due, due)
+            if callback is not None:
+                self._callbacks.append(callback)
+            self._cond.notify_all()
+
+    def pending(self) -> bool:
+        """Bekleyen veya süren yazma var mı"""
+        with self._cond:
+            return self._pending or self._busy
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Bekleyen istekler yazılana kadar bekler (testler / kapanış)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Bekleyen isteği beklemeden yazar ve worker'ı durdurur (pencere kapanırken)
+
+        Kapatıldıktan sonra biten yazmaların callback'leri çağrılmaz (alıcı gitmiş olabilir).
+        Tekrar çağrılabilir: GUI timeout=0 ile olay döngüsünden yoklar.
+
+        Returns:
+            Worker zamanında bittiyse True
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # Pencere içinde yeni istek geldikçe yazma ertelenir (kapanışta beklenmez)
+                while not self._closed:
+                    remaining = self._due - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                self._pending = False
+                self._busy = True
+                callbacks, self._callbacks = self._callbacks, []
+
+            try:
+                result = self._save()
+            except Exception as e:
+                print(f"Arka plan kaydetme hatası: {e}")
+                result = None
+
+            with self._cond:
+                closed = self._closed
+            if not closed:
+                for callback in callbacks:
+                    self._notify(lambda cb=callback: cb(result))
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
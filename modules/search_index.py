@@ -0,0 +1,275 @@
+"""
+Turkish-aware inverted index for incremental book search.
+Rows are indexed by token postings; substring/prefix lookups go through
+an n-gram index over the (much smaller) token vocabulary.
+"""
+
+import bisect
+import re
+import unicodedata
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Aranabilir alanlar (sıra değişirse indeks yeniden kurulmalı)
+SEARCH_FIELDS: List[str] = [
+    "Kitap Adı",
+    "Yazar",
+    "Orijinal Adı",
+    "Tür",
+    "Ülke/Edebi Gelenek",
+]
+
+# Kelime sözlüğü için tutulan en uzun n-gram (daha uzun sorgular kesişimle çözülür)
+GRAM_SIZE = 3
+
+_TOKEN_RE = re.compile(r"\w+")
+_FOLD_EXTRA = str.maketrans({"ı": "i", "ß": "ss", "æ": "ae", "ø": "o", "œ": "oe"})
+
+
+def fold_tr(text: str) -> str:
+    """
+    Türkçe'ye duyarlı katlama: İ/I/ı/i aynı harf, aksan ve şapkalar atılır.
+    "Savaş ve Barış" -> "savas ve baris"
+    """
+    if not text:
+        return ""
+    text = str(text)
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.lower().translate(_FOLD_EXTRA)
+
+
+def tokenize(text: str) -> List[str]:
+    """Metni katlanmış kelimelere ayırır."""
+    return _TOKEN_RE.findall(fold_tr(text))
+
+
+def _grams(token: str) -> Set[str]:
+    """Kelimenin 1..GRAM_SIZE uzunluğundaki tüm alt dizgileri."""
+    out: Set[str] = set()
+    n = len(token)
+    for size in range(1, min(GRAM_SIZE, n) + 1):
+        for i in range(n - size + 1):
+            out.add(token[i:i + size])
+    return out
+
+
+class SearchIndex:
+    """
+    Satır anahtarı -> alan kelimeleri üzerine artımlı ters indeks.
+
+    Her sorgu kelimesi seçilen alanlardan birinde (önek veya alt dizgi olarak)
+    bulunmalıdır; kelimeler arası VE uygulanır.
+    """
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        self.fields: List[str] = list(fields or SEARCH_FIELDS)
+        self.clear()
+
+    def clear(self) -> None:
+        """Tüm indeksi boşaltır."""
+        # alan -> kelime -> satır anahtarları
+        self._postings: Dict[str, Dict[str, Set[Hashable]]] = {f: {} for f in self.fields}
+        # satır anahtarı -> alan başına kelimeler (silme/güncelleme için)
+        self._row_tokens: Dict[Hashable, Tuple[Tuple[str, ...], ...]] = {}
+        # kelime -> kaç (satır, alan) çiftinde geçtiği
+        self._vocab: Dict[str, int] = {}
+        # n-gram -> kelimeler
+        self._gram_tokens: Dict[str, Set[str]] = {}
+        self._sorted_vocab: List[str] = []
+        self._sorted_dirty = False
+
+    def __len__(self) -> int:
+        return len(self._row_tokens)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._row_tokens
+
+    # ------------------------------------------------------------------
+    # Bakım
+    # ------------------------------------------------------------------
+    def add(self, key: Hashable, row: Mapping[str, object]) -> None:
+        """Satırı indekse ekler (anahtar zaten varsa günceller)."""
+        if key in self._row_tokens:
+            self.remove(key)
+
+        per_field: List[Tuple[str, ...]] = []
+        for field in self.fields:
+            tokens = tuple(set(tokenize(row.get(field, "") or "")))
+            postings = self._postings[field]
+            for token in tokens:
+                bucket = postings.get(token)
+                if bucket is None:
+                    bucket = postings[token] = set()
+                bucket.add(key)
+                self._vocab_incr(token)
+            per_field.append(tokens)
+        self._row_tokens[key] = tuple(per_field)
+
+    def remove(self, key: Hashable) -> None:
+        """Satırı indeksten çıkarır (yoksa sessizce geçer)."""
+        per_field = self._row_tokens.pop(key, None)
+        if per_field is None:
+            return
+        for field, tokens in zip(self.fields, per_field):
+            postings = self._postings[field]
+            for token in tokens:
+                bucket = postings.get(token)
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del postings[token]
+                self._vocab_decr(token)
+
+    def update(self, key: Hashable, row: Mapping[str, object]) -> None:
+        self.add(key, row)
+
+    def rebuild(self, rows: Iterable[Tuple[Hashable, Mapping[str, object]]]) -> None:
+        """İndeksi verilen (anahtar, satır) çiftlerinden sıfırdan kurar."""
+        self.clear()
+        for key, row in rows:
+            self.add(key, row)
+
+    def _vocab_incr(self, token: str) -> None:
+        count = self._vocab.get(token, 0)
+        self._vocab[token] = count + 1
+        if count == 0:
+            for gram in _grams(token):
+                bucket = self._gram_tokens.get(gram)
+                if bucket is None:
+                    bucket = self._gram_tokens[gram] = set()
+                bucket.add(token)
+            self._sorted_dirty = True
+
+    def _vocab_decr(self, token: str) -> None:
+        count = self._vocab.get(token, 0) - 1
+        if count > 0:
+            self._vocab[token] = count
+            return
+        self._vocab.pop(token, None)
+        for gram in _grams(token):
+            bucket = self._gram_tokens.get(gram)
+            if bucket is not None:
+                bucket.discard(token)
+                if not bucket:
+                    del self._gram_tokens[gram]
+        self._sorted_dirty = True
+
+    # ------------------------------------------------------------------
+    # Sorgu
+    # ------------------------------------------------------------------
+    def _tokens_with_prefix(self, prefix: str) -> List[str]:
+        if self._sorted_dirty:
+            self._sorted_vocab = sorted(self._vocab)
+            self._sorted_dirty = False
+        vocab = self._sorted_vocab
+        start = bisect.bisect_left(vocab, prefix)
+        end = bisect.bisect_left(vocab, prefix + "\U0010ffff")
+        return vocab[start:end]
+
+    def _tokens_with_substring(self, part: str) -> Set[str]:
+        if len(part) <= GRAM_SIZE:
+            return set(self._gram_tokens.get(part, ()))
+        buckets = []
+        for i in range(len(part) - GRAM_SIZE + 1):
+            bucket = self._gram_tokens.get(part[i:i + GRAM_SIZE])
+            if not bucket:
+                return set()
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        candidates = set(buckets[0])
+        for bucket in buckets[1:]:
+            candidates &= bucket
+            if not candidates:
+                return candidates
+        return {t for t in candidates if part in t}
+
+    def _matching_tokens(self, term: str, mode: str) -> Set[str]:
+        if mode == "prefix":
+            return set(self._tokens_with_prefix(term))
+        if mode == "exact":
+            return {term} if term in self._vocab else set()
+        return self._tokens_with_substring(term)
+
+    def _posting_cost(self, tokens: Set[str], fields: List[str]) -> int:
+        cost = 0
+        for field in fields:
+            postings = self._postings[field]
+            for token in tokens:
+                bucket = postings.get(token)
+                if bucket:
+                    cost += len(bucket)
+        return cost
+
+    def _rows_for_tokens(self, tokens: Set[str], fields: List[str]) -> Set[Hashable]:
+        out: Set[Hashable] = set()
+        for field in fields:
+            postings = self._postings[field]
+            for token in tokens:
+                bucket = postings.get(token)
+                if bucket:
+                    out |= bucket
+        return out
+
+    def _filter_rows(self, keys: Set[Hashable], tokens: Set[str], fields: List[str]) -> Set[Hashable]:
+        field_idx = [self.fields.index(f) for f in fields]
+        out: Set[Hashable] = set()
+        for key in keys:
+            per_field = self._row_tokens[key]
+            for idx in field_idx:
+                if not tokens.isdisjoint(per_field[idx]):
+                    out.add(key)
+                    break
+        return out
+
+    def search(self, query: str, fields: Optional[List[str]] = None, mode: str = "substring") -> Set[Hashable]:
+        """
+        Sorguyla eşleşen satır anahtarlarını döndürür.
+
+        Args:
+            query: Serbest metin; her kelime eşleşmeli (VE)
+            fields: Aranacak alanlar (None ise tüm alanlar)
+            mode: "substring", "prefix" veya "exact"
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return set()
+        fields = [f for f in (fields or self.fields) if f in self._postings]
+
+        plans = []
+        for term in terms:
+            tokens = self._matching_tokens(term, mode)
+            if not tokens:
+                return set()
+            plans.append((self._posting_cost(tokens, fields), tokens))
+        # En seçici kelimeden başla; sonrakiler için büyük birleşim kurmak
+        # yerine kalan adayları satır kelimeleriyle süz
+        plans.sort(key=lambda p: p[0])
+
+        result: Optional[Set[Hashable]] = None
+        for cost, tokens in plans:
+            if result is None:
+                result = self._rows_for_tokens(tokens, fields)
+            elif len(result) * len(fields) < cost:
+                result = self._filter_rows(result, tokens, fields)
+            else:
+                result &= self._rows_for_tokens(tokens, fields)
+            if not result:
+                return set()
+        return result or set()
+
+    def search_fields(self, criteria: Mapping[str, str], mode: str = "substring") -> Set[Hashable]:
+        """
+        Çok alanlı sorgu: {"Yazar": "tolstoy", "Tür": "roman"} gibi.
+        Tüm kriterler sağlanmalıdır.
+        """
+        result: Optional[Set[Hashable]] = None
+        for field, query in criteria.items():
+            if not query or not str(query).strip():
+                continue
+            rows = self.search(str(query), fields=[field], mode=mode)
+            result = rows if result is None else (result & rows)
+            if not result:
+                return set()
+        return result or set()
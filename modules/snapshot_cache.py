@@ -0,0 +1,98 @@
+"""
+Startup snapshot of the main library file.
+A pickle sidecar next to the xlsx holds the rows ExcelHandler.yukle returned,
+keyed by the xlsx path, mtime, size and content hash. While the key matches,
+startup skips parsing the workbook; every successful save rewrites it.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Dict, List, Optional
+
+# Satır biçimi değişirse artır (eski anlık görüntüler geçersiz sayılır)
+SNAPSHOT_VERSION = 1
+
+
+def file_hash(path: str) -> str:
+    """Dosya içeriğinin özeti (xlsx sıkıştırılmış: 100k satır ~3.5 MB, birkaç ms)"""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SnapshotCache:
+    """
+    Excel dosyasının yanındaki anlık görüntü (Kutuphanem.xlsx -> Kutuphanem.snapshot.pickle)
+
+    Dosya: önce anahtar (ayrı pickle), sonra satırlar - anahtar uymazsa satırlar hiç okunmaz
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def for_excel(cls, excel_path: str) -> "SnapshotCache":
+        base, _ = os.path.splitext(excel_path)
+        return cls(f"{base}.snapshot.pickle")
+
+    @staticmethod
+    def _key(excel_path: str) -> Dict:
+        stat = os.stat(excel_path)
+        return {
+            "version": SNAPSHOT_VERSION,
+            "excel": os.path.abspath(excel_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+
+    def load(self, excel_path: str) -> Optional[List[Dict]]:
+        """
+        Anahtar (yol, mtime, boyut, içerik özeti) uyuyorsa satırları döndürür
+
+        Returns:
+            Satır listesi veya None (yok, eski ya da bozuk)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                saved = pickle.load(f)
+                key = self._key(excel_path)
+                if any(saved.get(k) != v for k, v in key.items()):
+                    return None
+                if saved.get("hash") != file_hash(excel_path):
+                    return None
+                return pickle.load(f)
+        except Exception:
+            # Yok / yarım yazılmış / eski sürüm -> Excel'den yüklenir
+            return None
+
+    def save(self, excel_path: str, rows: List[Dict]) -> bool:
+        """
+        Excel'e başarılı kayıttan (veya Excel'den yüklemeden) sonra çağrılır
+
+        ⚠️ DİKKAT: Geçici dosyaya yazılıp os.replace ile değiştirilir (yarım dosya kalmaz)
+        """
+        tmp = f"{self.path}.tmp"
+        try:
+            key = self._key(excel_path)
+            key["hash"] = file_hash(excel_path)
+            with open(tmp, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(list(rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+            return True
+        except Exception as e:
+            print(f"Anlık görüntü kaydetme hatası: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return False
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
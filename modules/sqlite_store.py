@@ -0,0 +1,188 @@
+"""
+Optional SQLite backing store for the book list.
+Rows, provenance (src_*/conf_*) and row metadata live in one WAL-mode table
+keyed by row_id, with indexes on normalized title/author and status.
+ExcelHandler stays the import/export view; startup and incremental saves
+no longer depend on the size of the spreadsheet.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+from field_registry import (
+    BASE_COLUMNS,
+    ROW_ID_COLUMN,
+    ROW_META_COLUMNS,
+    build_provenance_columns,
+    parse_row_id,
+)
+from book_record import COLUMN_SLOTS
+from search_index import fold_tr
+
+# Ortam değişkeni ile açılır (veya depo dosyası zaten varsa kullanılır)
+SQLITE_ENV = "KUTUPHANE_SQLITE"
+
+# Excel kolonu -> SQL kolonu (Türkçe/boşluklu adlar yerine slot adları)
+_SQL_COLUMNS: Dict[str, str] = {c: COLUMN_SLOTS[c] for c in BASE_COLUMNS}
+for _col in ROW_META_COLUMNS + build_provenance_columns():
+    _SQL_COLUMNS[_col] = _col
+_DATA_COLUMNS = list(_SQL_COLUMNS)
+
+
+def _normalize(text) -> str:
+    return " ".join(fold_tr(str(text or "")).split())
+
+
+def _sql_value(value):
+    # NaN (pandas) -> NULL
+    if isinstance(value, float) and value != value:
+        return None
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return str(value)
+
+
+class SQLiteStore:
+    """
+    Kitap satırlarının SQLite deposu
+
+    ⚠️ DİKKAT: Tek bağlantı, tüm thread'ler tarafından kilit altında kullanılır
+    (Tk thread'i + toplu doldurma thread'i)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    @staticmethod
+    def path_for(excel_path: str) -> str:
+        """Excel dosyasının yanındaki depo yolu (Kutuphanem.xlsx -> Kutuphanem.sqlite)"""
+        base, _ = os.path.splitext(excel_path)
+        return f"{base}.sqlite"
+
+    @classmethod
+    def for_excel(cls, excel_path: str) -> Optional["SQLiteStore"]:
+        """Depo açıksa (KUTUPHANE_SQLITE=1 veya depo dosyası zaten var) depoyu döndürür, değilse None"""
+        path = cls.path_for(excel_path)
+        if os.getenv(SQLITE_ENV, "") == "1" or os.path.exists(path):
+            return cls(path)
+        return None
+
+    def _create_schema(self) -> None:
+        # Veri kolonlarında tip yok: değerler geldiği gibi saklanır (1869 sayı, "1865-1869" metin)
+        cols = ", ".join(_SQL_COLUMNS[c] for c in _DATA_COLUMNS)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS books ("
+                f"row_id INTEGER PRIMARY KEY, position INTEGER NOT NULL, {cols}, "
+                f"extra TEXT, norm_title TEXT, norm_author TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_books_title ON books(norm_title)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_books_author ON books(norm_author)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_books_status ON books(status)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_books_position ON books(position)")
+
+    def _params(self, row: Mapping, position: int) -> tuple:
+        if not isinstance(row, dict):
+            row = dict(row.items())  # BookRecord: tek seferde düz dict
+        extra = {k: _sql_value(v) for k, v in row.items()
+                 if k not in _SQL_COLUMNS and k != ROW_ID_COLUMN}
+        return (
+            parse_row_id(row.get(ROW_ID_COLUMN)),
+            position,
+            *[_sql_value(row.get(c)) for c in _DATA_COLUMNS],
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+            _normalize(row.get("Kitap Adı")),
+            _normalize(row.get("Yazar")),
+        )
+
+    def _upsert_sql(self) -> str:
+        cols = ["row_id", "position"] + [_SQL_COLUMNS[c] for c in _DATA_COLUMNS] + \
+               ["extra", "norm_title", "norm_author"]
+        # Güncellemede position korunur (liste sırası değişmez)
+        updates = ", ".join(f"{c}=excluded.{c}" for c in cols[2:])
+        return (f"INSERT INTO books ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))}) "
+                f"ON CONFLICT(row_id) DO UPDATE SET {updates}")
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def replace_all(self, rows: Sequence[Mapping]) -> None:
+        """Tüm tabloyu verilen satırlarla değiştirir (ilk içe aktarma)"""
+        sql = self._upsert_sql()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM books")
+            self._conn.executemany(sql, (self._params(r, i) for i, r in enumerate(rows)
+                                         if parse_row_id(r.get(ROW_ID_COLUMN)) is not None))
+
+    def apply(self, changed: Sequence[Mapping], deleted: Iterable[int] = ()) -> int:
+        """
+        Değişen satırları upsert eder, silinenleri siler - tek transaction, O(değişen satır)
+
+        Returns:
+            Yazılan kayıt sayısı
+        """
+        deleted = list(deleted)
+        if not changed and not deleted:
+            return 0
+        sql = self._upsert_sql()
+        with self._lock, self._conn:
+            start = self._conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM books").fetchone()[0]
+            self._conn.executemany(sql, (self._params(r, start + i) for i, r in enumerate(changed)
+                                         if parse_row_id(r.get(ROW_ID_COLUMN)) is not None))
+            self._conn.executemany("DELETE FROM books WHERE row_id = ?", ((i,) for i in deleted))
+        return len(changed) + len(deleted)
+
+    def load_all(self) -> List[Dict]:
+        """Tüm satırları liste sırasıyla döndürür (ExcelHandler.yukle ile aynı biçim)"""
+        select = ", ".join(["row_id"] + [_SQL_COLUMNS[c] for c in _DATA_COLUMNS] + ["extra"])
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT {select} FROM books ORDER BY position")
+            records = cursor.fetchall()
+        rows = []
+        n_base = len(BASE_COLUMNS)
+        for record in records:
+            row = {c: ("" if v is None else v) for c, v in zip(BASE_COLUMNS, record[1:1 + n_base])}
+            row[ROW_ID_COLUMN] = record[0]
+            for c, v in zip(_DATA_COLUMNS[n_base:], record[1 + n_base:-1]):
+                if v is not None:
+                    row[c] = v
+            if record[-1]:
+                row.update(json.loads(record[-1]))
+            rows.append(row)
+        return rows
+
+    def find(self, title: Optional[str] = None, author: Optional[str] = None,
+             status: Optional[str] = None) -> List[int]:
+        """
+        İndeksli arama: başlık/yazar öneki (Türkçe katlamalı) ve durum
+
+        Returns:
+            Eşleşen row_id'ler (liste sırasıyla)
+        """
+        where, params = [], []
+        for column, value in (("norm_title", title), ("norm_author", author)):
+            if value:
+                prefix = _normalize(value)
+                where.append(f"{column} >= ? AND {column} < ?")
+                params += [prefix, prefix + "\uffff"]
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        sql = "SELECT row_id FROM books"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            return [r[0] for r in self._conn.execute(sql + " ORDER BY position", params)]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
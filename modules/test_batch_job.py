@@ -0,0 +1,78 @@
+"""
+Unit tests for batch_job.py
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from batch_job import BatchJob
+
+
+class TestBatchJob(unittest.TestCase):
+    """Persistence, cursor, pause / cancel and resume filtering"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.is_klasoru = BatchJob.jobs_dir_for(os.path.join(self.klasor, "Kutuphanem.xlsx"))
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_round_trip_and_cursor(self):
+        job = BatchJob.create(self.is_klasoru, [1, 2, 3, 4], source="girdi.xlsx")
+        job.record(1, "OK")
+        job.record(3, "FAIL")
+        self.assertEqual((job.cursor, job.done), (1, 2))
+
+        yuklenen = BatchJob.load(job.path)
+        self.assertEqual((yuklenen.job_id, yuklenen.source), (job.job_id, "girdi.xlsx"))
+        self.assertEqual(yuklenen.results, {1: "OK", 3: "FAIL"})
+        self.assertEqual(yuklenen.pending_ids(), [2, 4])
+        yuklenen.record(2, "OK")
+        self.assertEqual(yuklenen.cursor, 3)
+
+    def test_record_many_is_one_batch(self):
+        job = BatchJob.create(self.is_klasoru, [1, 2, 3])
+        job.record_many([(1, "OK"), (2, "FAIL")])
+        job.record_many([])
+        self.assertEqual((job.cursor, job.done), (2, 2))
+        self.assertEqual(BatchJob.load(job.path).pending_ids(), [3])
+
+    def test_pause_and_cancel_persist(self):
+        job = BatchJob.create(self.is_klasoru, [1, 2])
+        job.pause()
+        yuklenen = BatchJob.load(job.path)
+        self.assertTrue(yuklenen.paused)
+        self.assertEqual([j.job_id for j in BatchJob.unfinished(self.is_klasoru)], [job.job_id])
+
+        # Duraklatılmış worker iptalle uyanır ve durur
+        sonuc = []
+        worker = threading.Thread(target=lambda: sonuc.append(job.wait_if_paused()))
+        worker.start()
+        job.cancel()
+        worker.join(timeout=5)
+        self.assertEqual(sonuc, [False])
+        job.pause()
+        self.assertTrue(job.cancelled)
+        self.assertEqual(BatchJob.unfinished(self.is_klasoru), [])
+
+    def test_pending_skips_ok_and_deleted_rows(self):
+        job = BatchJob.create(self.is_klasoru, [1, 2, 3, 4])
+        job.record(1, "FAIL")
+        satirlar = {2: {"status": "OK"}, 3: {"status": "FAIL"}}
+        self.assertEqual(job.pending_ids(satirlar.get), [3])
+
+    def test_finish_removes_file_and_torn_line_is_skipped(self):
+        job = BatchJob.create(self.is_klasoru, [1, 2])
+        job.record(1, "OK")
+        with open(job.path, "a", encoding="utf-8") as f:
+            f.write('{"row_id": 2, "sta')
+        self.assertEqual(BatchJob.load(job.path).pending_ids(), [2])
+        job.finish()
+        self.assertFalse(os.path.exists(job.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
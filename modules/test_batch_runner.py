@@ -0,0 +1,155 @@
+"""
+Unit tests for enrichment.py, batch_runner.py and kitap_listesi_cli.py
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+from batch_job import BatchJob
+from batch_runner import toplu_zenginlestir
+from change_journal import ChangeJournal
+from enrichment import kitabi_zenginlestir, sonucu_uygula, yeniden_deneme_bekliyor
+from excel_handler import ExcelHandler
+from list_manager import ListManager
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SahteCekici:
+    """Ağa çıkmayan KitapBilgisiCekici yerine geçer ("Hata" ile başlayan başlıklarda istisna)"""
+
+    def __init__(self, kesinti_sonrasi=None):
+        self.cagrilar = []
+        self._kilit = threading.Lock()
+        # Bu kadar çağrıdan sonra Ctrl+C benzetimi (KeyboardInterrupt)
+        self.kesinti_sonrasi = kesinti_sonrasi
+
+    def kitap_bilgisi_cek_policy(self, kitap_adi, yazar, mevcut):
+        with self._kilit:
+            if self.kesinti_sonrasi is not None and len(self.cagrilar) >= self.kesinti_sonrasi:
+                raise KeyboardInterrupt
+            self.cagrilar.append(kitap_adi)
+        if kitap_adi.startswith("Hata"):
+            raise RuntimeError("servis yok")
+        return {"Kitap Adı": kitap_adi, "Yazar": yazar, "Tür": "Roman", "status": "OK"}
+
+
+class TestEnrichment(unittest.TestCase):
+    """FAIL fallback, retry wait and merge by row_id"""
+
+    def test_failure_becomes_fail_row_with_retry(self):
+        satir = kitabi_zenginlestir(SahteCekici(), {"Kitap Adı": "Hata 1", "Yazar": "x", "Dil": "Türkçe"})
+        self.assertEqual(satir["status"], "FAIL")
+        self.assertEqual(satir["Dil"], "Türkçe")
+        self.assertTrue(yeniden_deneme_bekliyor(satir))
+
+    def test_retry_wait(self):
+        self.assertFalse(yeniden_deneme_bekliyor({}))
+        self.assertFalse(yeniden_deneme_bekliyor({"next_retry_at": "bozuk"}))
+        gecmis = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+        gelecek = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        self.assertFalse(yeniden_deneme_bekliyor({"next_retry_at": gecmis}))
+        self.assertTrue(yeniden_deneme_bekliyor({"next_retry_at": gelecek}))
+
+    def test_merge_keeps_other_columns(self):
+        manager = ListManager([{"Kitap Adı": "A", "Yazar": "x", "Dil": "Türkçe"}])
+        kimlik = manager.anlik_goruntu()[0]["row_id"]
+        self.assertTrue(sonucu_uygula(manager, kimlik, {"Tür": "Roman", "status": "OK"}))
+        kitap = manager.getir_kimlik(kimlik)
+        self.assertEqual((kitap["Tür"], kitap["Dil"], kitap["row_id"]), ("Roman", "Türkçe", kimlik))
+        self.assertFalse(sonucu_uygula(manager, 999, {"Tür": "Roman"}))
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Headless run, JSON-ready events and resume from the job file"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.girdi = os.path.join(self.klasor, "girdi.csv")
+        self.cikti = os.path.join(self.klasor, "cikti.xlsx")
+        with open(self.girdi, "w", encoding="utf-8") as f:
+            f.write("Kitap Adı,Yazar\n")
+            f.write("".join(f"Kitap {i},Yazar {i}\n" for i in range(10)))
+            f.write("Hata 1,Yazar\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_full_run(self):
+        olaylar = []
+        cekici = SahteCekici()
+        sonuc = toplu_zenginlestir(self.girdi, self.cikti, cekici, is_sayisi=3, bildir=olaylar.append)
+        self.assertEqual(sonuc["event"], "done")
+        self.assertEqual((sonuc["done"], sonuc["ok"], sonuc["fail"]), (11, 10, 1))
+        self.assertEqual(olaylar[0]["event"], "start")
+        self.assertEqual(len([o for o in olaylar if o["event"] == "row"]), 11)
+        self.assertEqual(sorted(cekici.cagrilar), sorted([f"Kitap {i}" for i in range(10)] + ["Hata 1"]))
+
+        kitaplar = ExcelHandler().disaridan_yukle(self.cikti)
+        self.assertEqual([k["Tür"] for k in kitaplar].count("Roman"), 10)
+        self.assertFalse(ChangeJournal.for_excel(self.cikti).pending())
+
+    def test_resume_after_interrupt(self):
+        ilk = SahteCekici(kesinti_sonrasi=4)
+        sonuc = toplu_zenginlestir(self.girdi, self.cikti, ilk, is_sayisi=1)
+        self.assertEqual((sonuc["event"], sonuc["done"]), ("interrupted", 4))
+        self.assertEqual(len(BatchJob.unfinished(BatchJob.jobs_dir_for(self.cikti))), 1)
+
+        ikinci = SahteCekici()
+        sonuc = toplu_zenginlestir(self.girdi, self.cikti, ikinci, is_sayisi=2)
+        self.assertEqual((sonuc["event"], sonuc["total"]), ("done", 7))
+        # Ücretli çağrı tekrarlanmaz: her kitap toplamda bir kez çekildi
+        self.assertEqual(sorted(ilk.cagrilar + ikinci.cagrilar),
+                         sorted([f"Kitap {i}" for i in range(10)] + ["Hata 1"]))
+        turler = [k["Tür"] for k in ExcelHandler().disaridan_yukle(self.cikti)]
+        self.assertEqual(turler.count("Roman"), 10)
+        self.assertEqual(BatchJob.unfinished(BatchJob.jobs_dir_for(self.cikti)), [])
+
+    def test_fresh_discards_unfinished_job(self):
+        toplu_zenginlestir(self.girdi, self.cikti, SahteCekici(kesinti_sonrasi=4), is_sayisi=1)
+        cekici = SahteCekici()
+        sonuc = toplu_zenginlestir(self.girdi, self.cikti, cekici, is_sayisi=2, yeni=True)
+        self.assertEqual((sonuc["event"], sonuc["total"]), ("done", 11))
+        self.assertEqual(len(cekici.cagrilar), 11)
+
+    def test_cli_fresh_discards_journal(self):
+        # İlk satır FAIL olur ve 6 saat sonra tekrar denenmek üzere günlüğe yazılır
+        with open(self.girdi, "w", encoding="utf-8") as f:
+            f.write("Kitap Adı,Yazar\nHata 1,Yazar\n")
+            f.write("".join(f"Kitap {i},Yazar {i}\n" for i in range(10)))
+        sonuc = toplu_zenginlestir(self.girdi, self.cikti, SahteCekici(kesinti_sonrasi=4), is_sayisi=1)
+        self.assertEqual(sonuc["event"], "interrupted")
+        self.assertTrue(ChangeJournal.for_excel(self.cikti).pending())
+
+        sys.path.insert(0, KOK)
+        import kitap_listesi_cli
+        cekici = SahteCekici()
+        cikti = io.StringIO()
+        with mock.patch.object(kitap_listesi_cli, "KitapBilgisiCekici", lambda: cekici), \
+                redirect_stdout(cikti):
+            kod = kitap_listesi_cli.main(["enrich", self.girdi, "-o", self.cikti, "--fresh",
+                                          "--workers", "2", "--api-key", "test"])
+        self.assertEqual(kod, 0)
+        olaylar = [json.loads(satir) for satir in cikti.getvalue().splitlines()]
+        self.assertEqual((olaylar[0]["event"], olaylar[0]["total"], olaylar[0]["resumed"]),
+                         ("start", 11, 0))
+        self.assertEqual(olaylar[-1]["event"], "done")
+        # Eski günlük oynatılmadı: FAIL satırı bekletilmeden baştan çekildi
+        self.assertEqual(sorted(cekici.cagrilar), sorted([f"Kitap {i}" for i in range(10)] + ["Hata 1"]))
+        self.assertEqual(BatchJob.unfinished(BatchJob.jobs_dir_for(self.cikti)), [])
+
+    def test_unreadable_input(self):
+        sonuc = toplu_zenginlestir(os.path.join(self.klasor, "yok.csv"), self.cikti, SahteCekici())
+        self.assertEqual(sonuc["event"], "error")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit tests for book_record.py
+"""
+
+import pickle
+import unittest
+from book_record import BookRecord
+from field_registry import ensure_row_schema
+from provenance import set_field, set_row_status
+from list_manager import ListManager
+
+
+class TestBookRecordMapping(unittest.TestCase):
+    """BookRecord must behave like the dict rows it replaces"""
+
+    def setUp(self):
+        self.satir = ensure_row_schema({"Kitap Adı": "Suç ve Ceza", "Yazar": "Dostoyevski", "Not": "ödünç"})
+        set_field(self.satir, "Tür", "Roman", "groq", 0.8)
+        set_row_status(self.satir, "PARTIAL", ["Konusu"], best_source="groq", retry_count=1)
+        self.kayit = BookRecord(self.satir)
+
+    def test_round_trip(self):
+        self.assertEqual(self.kayit.to_dict(), self.satir)
+        self.assertEqual(dict(self.kayit), self.satir)
+        self.assertEqual(self.kayit, self.satir)
+        self.assertEqual(len(self.kayit), len(self.satir))
+
+    def test_coded_fields(self):
+        self.assertEqual(self.kayit["status"], "PARTIAL")
+        self.assertEqual(self.kayit["src_tur"], "groq")
+        self.assertEqual(self.kayit["conf_tur"], "0.80")
+        self.assertIsNone(self.kayit._ekstra.get("status"))
+
+    def test_uncodable_values_kept_verbatim(self):
+        self.kayit["status"] = "UNKNOWN"
+        self.kayit["conf_tur"] = "0.8"
+        self.assertEqual(self.kayit["status"], "UNKNOWN")
+        self.assertEqual(self.kayit["conf_tur"], "0.8")
+        self.kayit["status"] = "OK"
+        self.assertEqual(self.kayit["status"], "OK")
+        self.assertEqual(list(self.kayit).count("status"), 1)
+
+    def test_unparsable_confidence_kept_verbatim(self):
+        for deger in ("inf", "-inf", "1e400", "nan", "yüksek"):
+            self.kayit["conf_tur"] = deger
+            self.assertEqual(self.kayit["conf_tur"], deger)
+        self.assertEqual(BookRecord({"conf_tur": "1e400"}).to_dict(), {"conf_tur": "1e400"})
+
+    def test_missing_and_delete(self):
+        kayit = BookRecord({"Kitap Adı": "A"})
+        self.assertNotIn("Yazar", kayit)
+        self.assertEqual(kayit.get("Yazar", ""), "")
+        with self.assertRaises(KeyError):
+            kayit["src_tur"]
+        del self.kayit["src_tur"]
+        self.assertNotIn("src_tur", self.kayit)
+
+    def test_copy_is_independent_and_picklable(self):
+        kopya = self.kayit.copy()
+        kopya["Tür"] = "Novella"
+        self.assertEqual(self.kayit["Tür"], "Roman")
+        self.assertEqual(pickle.loads(pickle.dumps(self.kayit)), self.kayit)
+
+
+class TestListManagerRecords(unittest.TestCase):
+    """ListManager stores rows as BookRecord"""
+
+    def test_rows_converted(self):
+        manager = ListManager([{"Kitap Adı": "A", "Yazar": "x"}])
+        manager.ekle({"Kitap Adı": "B", "Yazar": "y"})
+        sonuc = manager.toplu_ekle([{"Kitap Adı": "C", "Yazar": "z"}])
+        self.assertTrue(all(isinstance(k, BookRecord) for k in manager.anlik_goruntu()))
+        self.assertIsInstance(sonuc['eklenen'][0], BookRecord)
+        self.assertEqual(sonuc['eklenen'][0]["row_id"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
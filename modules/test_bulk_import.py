@@ -0,0 +1,80 @@
+"""
+Unit tests for bulk_import.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from openpyxl import Workbook
+from bulk_import import dosyalari_topla, toplu_ice_aktar
+from list_manager import ListManager
+
+
+class TestBulkImport(unittest.TestCase):
+    """Folders, sheets, hash dedup and the consolidated report"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Roman"
+        ws.append(["Kitap", "Yazar"])
+        ws.append(["Suç ve Ceza", "Dostoyevski"])
+        ws.append(["Tutunamayanlar", "Oğuz Atay"])
+        ws = wb.create_sheet("Şiir")
+        ws.append(["Kitap Adı", "Yazar"])
+        ws.append(["Kuvayi Milliye", "Nazım Hikmet"])
+        ws = wb.create_sheet("Notlar")
+        ws.append(["Not"])
+        ws.append(["sütun yok"])
+        wb.save(os.path.join(self.klasor, "sube1.xlsx"))
+
+        alt = os.path.join(self.klasor, "alt")
+        os.mkdir(alt)
+        with open(os.path.join(alt, "sube2.csv"), "w", encoding="utf-8") as f:
+            # Yazım farkı aynı kitap: Dostoevsky / (Ciltli) - özet aynı
+            f.write("Kitap Adı,Yazar\nSuç ve Ceza (Ciltli),Dostoevsky\nİnce Memed,Yaşar Kemal\n")
+        with open(os.path.join(alt, "~$sube1.xlsx"), "w") as f:
+            f.write("kilit")
+        with open(os.path.join(alt, "oku.txt"), "w") as f:
+            f.write("x")
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_folder_expansion(self):
+        self.assertEqual([os.path.basename(d) for d in dosyalari_topla([self.klasor])],
+                         ["sube1.xlsx", "sube2.csv"])
+
+    def _aktar(self, is_sayisi):
+        manager = ListManager([{"Kitap Adı": "İnce Memed", "Yazar": "Yaşar Kemal"}])
+        ilerlemeler = []
+        sonuc = toplu_ice_aktar([self.klasor], manager, is_sayisi=is_sayisi,
+                                ilerleme=lambda biten, toplam, gorev: ilerlemeler.append((biten, toplam)))
+        self.assertEqual(sorted(ilerlemeler), [(1, 4), (2, 4), (3, 4), (4, 4)])
+        return manager, sonuc
+
+    def test_merge_and_report(self):
+        manager, sonuc = self._aktar(is_sayisi=1)
+        self.assertEqual([k["Kitap Adı"] for k in sonuc['eklenen']],
+                         ["Suç ve Ceza", "Tutunamayanlar", "Kuvayi Milliye"])
+        self.assertEqual(sorted(sonuc['atlanan']), ["Suç ve Ceza (Ciltli)", "İnce Memed"])
+        self.assertEqual(manager.sayi(), 4)
+
+        rapor = {(os.path.basename(k["dosya"]), k["sayfa"]): k for k in sonuc['kaynaklar']}
+        self.assertEqual(rapor[("sube1.xlsx", "Roman")]["eklenen"], 2)
+        self.assertEqual(rapor[("sube1.xlsx", "Şiir")]["eklenen"], 1)
+        self.assertIn("Eksik sütunlar", rapor[("sube1.xlsx", "Notlar")]["hata"])
+        self.assertEqual((rapor[("sube2.csv", None)]["okunan"], rapor[("sube2.csv", None)]["tekrar"]), (2, 2))
+
+    def test_process_pool_matches_sequential(self):
+        _, sirali = self._aktar(is_sayisi=1)
+        _, paralel = self._aktar(is_sayisi=2)
+        self.assertEqual([k["Kitap Adı"] for k in paralel['eklenen']],
+                         [k["Kitap Adı"] for k in sirali['eklenen']])
+        self.assertEqual(paralel['kaynaklar'], sirali['kaynaklar'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Unit tests for change_journal.py and ListManager dirty-row tracking.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from change_journal import ChangeJournal
+from excel_handler import ExcelHandler
+from list_manager import ListManager
+
+
+class TestChangeJournal(unittest.TestCase):
+    """Append / replay / clear"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.gunluk = ChangeJournal.for_excel(os.path.join(self.klasor, "Kutuphanem.xlsx"), interval=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_path_next_to_excel(self):
+        self.assertEqual(os.path.basename(self.gunluk.path), "Kutuphanem.journal.jsonl")
+
+    def test_replay_upsert_and_delete(self):
+        excel = [
+            {"Kitap Adı": "A", "Tür": "", "row_id": 1},
+            {"Kitap Adı": "B", "Tür": "", "row_id": 2},
+        ]
+        self.gunluk.append([{"Kitap Adı": "A", "Tür": "Roman", "row_id": 1}])
+        self.gunluk.append([{"Kitap Adı": "C", "row_id": 3}], deleted=[2])
+        self.assertTrue(self.gunluk.pending())
+        sonuc = self.gunluk.replay(excel)
+        self.assertEqual([(k["Kitap Adı"], k.get("Tür")) for k in sonuc], [("A", "Roman"), ("C", None)])
+
+    def test_replay_into_legacy_workbook_without_row_id(self):
+        # Eski dosya: row_id kolonu yok - kimlikler yüklemede dosya sırasıyla verilir
+        from openpyxl import Workbook
+        excel = os.path.join(self.klasor, "Eski.xlsx")
+        wb = Workbook()
+        wb.active.append(["Kitap Adı", "Yazar"])
+        wb.active.append(["A", "x"])
+        wb.active.append(["B", "y"])
+        wb.save(excel)
+
+        manager = ListManager(ExcelHandler(excel).yukle())
+        kimlik = manager.anlik_goruntu()[0]["row_id"]
+        manager.guncelle_kimlik(kimlik, {**manager.getir_kimlik(kimlik), "Tür": "Roman"})
+        self.gunluk.append(*manager.degisiklikleri_al())
+
+        # Çökme sonrası yeniden açılış: aynı dosya + günlük, satırlar tekrarlanmaz
+        yeniden = ListManager(ExcelHandler(excel).yukle())
+        self.gunluk.replay_into(yeniden)
+        sonuc = [(k["Kitap Adı"], k["Tür"], k["row_id"]) for k in yeniden.anlik_goruntu()]
+        self.assertEqual(sonuc, [("A", "Roman", 1), ("B", "", 2)])
+
+    def test_torn_last_line_ignored(self):
+        self.gunluk.append([{"Kitap Adı": "A", "row_id": 1}])
+        with open(self.gunluk.path, "a", encoding="utf-8") as f:
+            f.write('{"op": "upsert", "row": {"Kitap')
+        self.assertEqual(len(self.gunluk.replay([])), 1)
+
+    def test_clear_and_due(self):
+        self.assertTrue(self.gunluk.due())
+        self.assertEqual(self.gunluk.append([], []), 0)
+        self.gunluk.append([{"Kitap Adı": "A", "row_id": 1}])
+        self.gunluk.clear()
+        self.assertFalse(self.gunluk.pending())
+        self.assertEqual(self.gunluk.replay([{"row_id": 5}]), [{"row_id": 5}])
+        self.assertFalse(ChangeJournal(self.gunluk.path, interval=3600).due())
+
+    def test_clear_upto_keeps_later_entries(self):
+        self.gunluk.append([{"Kitap Adı": "A", "row_id": 1}])
+        isaret = self.gunluk.mark()
+        self.gunluk.append([{"Kitap Adı": "B", "row_id": 2}])
+        self.gunluk.clear(upto=isaret)
+        self.assertEqual([k["Kitap Adı"] for k in self.gunluk.replay([])], ["B"])
+        self.gunluk.clear(upto=self.gunluk.mark())
+        self.assertFalse(self.gunluk.pending())
+
+
+class TestDirtyRows(unittest.TestCase):
+    """ListManager.degisiklikleri_al"""
+
+    def test_only_changed_rows_returned(self):
+        manager = ListManager([{"Kitap Adı": n, "Yazar": "x"} for n in "ABCD"])
+        self.assertEqual(manager.degisiklikleri_al(), ([], []))
+        ids = [k["row_id"] for k in manager.anlik_goruntu()]
+        manager.guncelle_kimlik(ids[1], {"Kitap Adı": "B2", "Yazar": "x"})
+        manager.ekle({"Kitap Adı": "E", "Yazar": "x"})
+        manager.sil_kimlik(ids[3])
+        degisenler, silinenler = manager.degisiklikleri_al()
+        self.assertEqual([k["Kitap Adı"] for k in degisenler], ["B2", "E"])
+        self.assertEqual(silinenler, [ids[3]])
+        self.assertEqual(manager.degisiklikleri_al(), ([], []))
+
+    def test_failed_write_marks_rows_dirty_again(self):
+        manager = ListManager([{"Kitap Adı": n, "Yazar": "x"} for n in "AB"])
+        ids = [k["row_id"] for k in manager.anlik_goruntu()]
+        manager.guncelle_kimlik(ids[0], {"Kitap Adı": "A2", "Yazar": "x"})
+        degisenler, _ = manager.degisiklikleri_al()
+        manager.guncelle_kimlik(ids[0], {"Kitap Adı": "A3", "Yazar": "x"})
+        manager.sil_kimlik(ids[1])
+        manager.degisiklikleri_al()
+        manager.kirli_isaretle([k["row_id"] for k in degisenler], [ids[1]])
+        degisenler, silinenler = manager.degisiklikleri_al()
+        self.assertEqual([k["Kitap Adı"] for k in degisenler], ["A3"])
+        self.assertEqual(silinenler, [ids[1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
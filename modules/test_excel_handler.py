@@ -0,0 +1,298 @@
+"""
+Unit tests for excel_handler.py save/load.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+import excel_handler
+from excel_handler import ExcelHandler
+from list_manager import ListManager
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStyledSave(unittest.TestCase):
+    """kaydet() writes values and the library theme in one pass"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.handler = ExcelHandler(os.path.join(self.klasor, "Kutuphanem.xlsx"))
+        self.kitaplar = [
+            {"Kitap Adı": "Savaş ve Barış", "Yazar": "Lev Tolstoy", "İlk Yayınlanma Tarihi": "1869",
+             "Anlatı Yılı": "1805-1812", "Konusu": "Napolyon savaşları " * 10, "row_id": 1},
+            {"Kitap Adı": "Suç ve Ceza", "Yazar": "Dostoyevski", "row_id": 2},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_round_trip(self):
+        self.assertTrue(self.handler.kaydet(self.kitaplar))
+        yuklenen = self.handler.yukle()
+        self.assertEqual([k["Kitap Adı"] for k in yuklenen], ["Savaş ve Barış", "Suç ve Ceza"])
+        self.assertEqual(yuklenen[0]["İlk Yayınlanma Tarihi"], 1869)
+        self.assertEqual(yuklenen[0]["Anlatı Yılı"], "1805-1812")
+        self.assertEqual(yuklenen[1]["Orijinal Adı"], "")
+
+    def test_theme(self):
+        self.handler.kaydet(self.kitaplar)
+        ws = load_workbook(self.handler.excel_dosyasi).active
+        self.assertEqual(ws.freeze_panes, "A2")
+        self.assertFalse(ws.sheet_view.showGridLines)
+        self.assertEqual(ws["A1"].font.name, "Georgia")
+        self.assertTrue(ws["A1"].font.b)
+        self.assertEqual(ws["A1"].fill.fgColor.rgb, "008B4513")
+        self.assertEqual(ws["A1"].style, "Kütüphane Başlık")
+        self.assertEqual(ws["F2"].style, "Kütüphane Yıl")
+        self.assertEqual(ws["F2"].number_format, "0")
+        self.assertTrue(ws["H2"].alignment.wrap_text)
+        self.assertEqual(ws.row_dimensions[1].height, 28)
+        self.assertGreater(ws.row_dimensions[2].height, ws.row_dimensions[3].height)
+        self.assertGreaterEqual(ws.column_dimensions["H"].width, 25)
+
+    def test_zebra_and_background_are_rules(self):
+        self.handler.kaydet(self.kitaplar)
+        ws = load_workbook(self.handler.excel_dosyasi).active
+        kurallar = {str(aralik.sqref): [k.formula[0] for k in aralik.rules]
+                    for aralik in ws.conditional_formatting}
+        self.assertEqual(kurallar["A2:I3"], ["MOD(ROW(),2)=0", "MOD(ROW(),2)=1"])
+        self.assertIn(["TRUE"], kurallar.values())
+        # Hücre başına dolgu ve veri altında önceden biçimlendirilmiş boş satır yok
+        self.assertIsNone(ws["A2"].fill.fgColor.rgb if ws["A2"].fill.fill_type else None)
+        self.assertEqual(ws.max_row, 3)
+
+
+class TestStreamingLoad(unittest.TestCase):
+    """_tablo_oku: read-only, known columns only, values as text"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.handler = ExcelHandler(os.path.join(self.klasor, "Kutuphanem.xlsx"))
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_external_file(self):
+        dosya = os.path.join(self.klasor, "disaridan.xlsx")
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Kitap", "Not", "Yazar", "row_id"])
+        ws.append([1984, "okundu", "George Orwell", 7.0])
+        ws.append(["Tutunamayanlar", None, "Oğuz Atay"])
+        ws.append([None, "yazarsız", None])
+        ws.append([None, None, None])
+        wb.save(dosya)
+
+        kitaplar = self.handler.disaridan_yukle(dosya)
+        self.assertEqual([(k["Kitap Adı"], k["Yazar"]) for k in kitaplar],
+                         [("1984", "George Orwell"), ("Tutunamayanlar", "Oğuz Atay")])
+        self.assertNotIn("Not", kitaplar[0])
+        self.assertEqual(kitaplar[0]["row_id"], 7)
+        self.assertEqual(kitaplar[1]["row_id"], "")
+        self.assertEqual(kitaplar[1]["Tür"], "")
+
+    def test_missing_file_is_empty_library(self):
+        self.assertEqual(self.handler.yukle(), [])
+
+    def test_corrupt_library_raises_and_is_not_overwritten(self):
+        with open(self.handler.excel_dosyasi, "wb") as f:
+            f.write(b"bozuk dosya")
+        with self.assertRaises(Exception):
+            self.handler.yukle()
+
+        # GUI açılış yüklemesi: hata işaretlenir, tam kayıt dosyanın üzerine boş liste yazmaz
+        sys.path.insert(0, KOK)
+        import kitap_listesi_gui
+        gui = kitap_listesi_gui.KitapListesiGUI.__new__(kitap_listesi_gui.KitapListesiGUI)
+        olaylar = []
+        gui.excel_handler, gui.depo, gui.yukleme_hatasi = self.handler, None, None
+        gui.list_manager = ListManager()
+        gui.ilerleme_kanali = types.SimpleNamespace(post_event=olaylar.append)
+        gui._kutuphaneyi_arka_planda_yukle()
+        self.assertIsNotNone(gui.yukleme_hatasi)
+        self.assertEqual(len(olaylar), 1)
+        self.assertFalse(gui._excel_tam_kaydet()[0])
+        with open(self.handler.excel_dosyasi, "rb") as f:
+            self.assertEqual(f.read(), b"bozuk dosya")
+
+    def test_trailing_empty_rows_dropped(self):
+        self.handler.kaydet([{"Kitap Adı": "A", "Yazar": "B", "row_id": 1}])
+        df = self.handler._tablo_oku(self.handler.excel_dosyasi, ["Kitap Adı", "Yazar"])
+        self.assertEqual(df.values.tolist(), [["A", "B"]])
+
+
+class SahteParquet:
+    """pyarrow.parquet yerine: DataFrame pickle olarak yazılır, ParquetFile arayüzüyle okunur"""
+
+    okunan_sutunlar = None
+
+    @staticmethod
+    def yaz(df, yol, index=True, compression=None):
+        # Diskteki tabloda fazladan bir sütun: okurken hiç alınmamalı
+        df.assign(Fazla="x").to_pickle(yol)
+
+    class ParquetFile:
+        def __init__(self, yol):
+            self._df = pd.read_pickle(yol)
+            self.schema_arrow = mock.Mock(names=list(self._df.columns))
+            self.metadata = mock.Mock(num_rows=len(self._df))
+
+        def iter_batches(self, batch_size, columns):
+            SahteParquet.okunan_sutunlar = list(columns)
+            for i in range(0, len(self._df), batch_size):
+                yield mock.Mock(to_pandas=lambda i=i: self._df[columns].iloc[i:i + batch_size])
+
+        def close(self):
+            pass
+
+
+class TestExchangeFormats(unittest.TestCase):
+    """CSV / Parquet export and import share the xlsx schema"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.handler = ExcelHandler(os.path.join(self.klasor, "Kutuphanem.xlsx"))
+        self.kitaplar = [
+            {"Kitap Adı": "Savaş ve Barış", "Yazar": "Lev Tolstoy", "İlk Yayınlanma Tarihi": 1869,
+             "Anlatı Yılı": "1805-1812", "Konusu": "Napolyon, Rusya; \"savaş\"", "row_id": 1},
+            {"Kitap Adı": "1984", "Yazar": "George Orwell", "row_id": 2},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def _gidis_donus(self, uzanti):
+        dosya = os.path.join(self.klasor, f"katalog{uzanti}")
+        self.assertTrue(self.handler.disari_aktar(self.kitaplar, dosya))
+        yuklenen = self.handler.disaridan_yukle(dosya)
+        self.assertEqual([k["Kitap Adı"] for k in yuklenen], ["Savaş ve Barış", "1984"])
+        self.assertEqual(yuklenen[0]["İlk Yayınlanma Tarihi"], 1869)
+        self.assertEqual(yuklenen[0]["Anlatı Yılı"], "1805-1812")
+        self.assertEqual(yuklenen[0]["Konusu"], self.kitaplar[0]["Konusu"])
+        self.assertEqual(yuklenen[1]["row_id"], 2)
+        self.assertEqual(list(yuklenen[1]), ExcelHandler.STANDART_SUTUN_SIRASI)
+
+    def test_csv_round_trip(self):
+        self._gidis_donus(".csv")
+
+    @unittest.skipUnless(excel_handler.PARQUET_AVAILABLE, "pyarrow yüklü değil")
+    def test_parquet_round_trip(self):
+        self._gidis_donus(".parquet")
+
+    def test_parquet_paths_with_stub_writer(self):
+        # pyarrow olmadan da Parquet dışa/içe aktarma yolu çalışsın (sütun seçimi, batch -> metin)
+        with mock.patch.object(excel_handler, "PARQUET_AVAILABLE", True), \
+                mock.patch.object(excel_handler, "pq", SahteParquet), \
+                mock.patch.object(pd.DataFrame, "to_parquet", SahteParquet.yaz):
+            self._gidis_donus(".parquet")
+            dosya = os.path.join(self.klasor, "katalog.parquet")
+            parcalar = list(self.handler.disaridan_parcali_yukle(dosya, parca_boyutu=1))
+        self.assertEqual([len(p) for p in parcalar], [1, 1])
+        self.assertEqual(SahteParquet.okunan_sutunlar, ExcelHandler.STANDART_SUTUN_SIRASI)
+
+    def test_semicolon_csv_template(self):
+        dosya = os.path.join(self.klasor, "sablon.csv")
+        self.assertTrue(self.handler.sablon_olustur(dosya))
+        self.assertEqual(self.handler.disaridan_yukle(dosya), [])
+        with open(dosya, "w", encoding="utf-8") as f:
+            f.write("Kitap;Yazar;Not\nİnce Memed;Yaşar Kemal;x\n;;\n")
+        self.assertEqual([(k["Kitap Adı"], k["Yazar"], k["Tür"]) for k in self.handler.disaridan_yukle(dosya)],
+                         [("İnce Memed", "Yaşar Kemal", "")])
+
+
+class TestChunkedImport(unittest.TestCase):
+    """disaridan_parcali_yukle: bounded chunks, progress, cancellation"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.handler = ExcelHandler(os.path.join(self.klasor, "Kutuphanem.xlsx"))
+        self.kitaplar = [{"Kitap Adı": f"Kitap {i}", "Yazar": f"Yazar {i}", "row_id": i}
+                         for i in range(1, 26)]
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def _dosya(self, uzanti):
+        dosya = os.path.join(self.klasor, f"buyuk{uzanti}")
+        self.assertTrue(self.handler.disari_aktar(self.kitaplar, dosya))
+        return dosya
+
+    def test_chunks_and_progress(self):
+        for uzanti in (".xlsx", ".csv"):
+            ilerlemeler = []
+            parcalar = list(self.handler.disaridan_parcali_yukle(
+                self._dosya(uzanti), parca_boyutu=10,
+                ilerleme=lambda okunan, toplam: ilerlemeler.append(okunan)))
+            self.assertEqual([len(p) for p in parcalar], [10, 10, 5])
+            self.assertEqual(ilerlemeler, [10, 20, 25])
+            self.assertEqual(parcalar[2][-1]["row_id"], 25)
+
+    def test_xlsx_total_from_row_count_property(self):
+        # Write-only yazıcı <dimension> yazmaz; toplam satır belge özelliğinden gelir
+        dosya = self._dosya(".xlsx")
+        self.assertIsNone(load_workbook(dosya, read_only=True).active.max_row)
+        toplamlar = set()
+        list(self.handler.disaridan_parcali_yukle(dosya, parca_boyutu=10,
+                                                  ilerleme=lambda okunan, toplam: toplamlar.add(toplam)))
+        self.assertEqual(toplamlar, {25})
+
+    def test_cancel_stops_before_next_chunk(self):
+        okunan = []
+        for parca in self.handler.disaridan_parcali_yukle(self._dosya(".xlsx"), parca_boyutu=10,
+                                                         iptal=lambda: len(okunan) >= 10):
+            okunan.extend(parca)
+        self.assertEqual(len(okunan), 10)
+
+    def test_missing_columns_raise_before_first_chunk(self):
+        dosya = os.path.join(self.klasor, "eksik.csv")
+        with open(dosya, "w", encoding="utf-8") as f:
+            f.write("Kitap,Not\nA,b\n")
+        with self.assertRaises(ValueError):
+            next(self.handler.disaridan_parcali_yukle(dosya))
+        self.assertIsNone(self.handler.disaridan_yukle(dosya))
+
+
+class TestDimensions(unittest.TestCase):
+    """Vectorized column widths and Konusu row heights"""
+
+    def test_widths_and_heights(self):
+        handler = ExcelHandler(os.path.join(tempfile.gettempdir(), "Kutuphanem.xlsx"))
+        df = handler._cerceve_olustur([
+            {"Kitap Adı": "K" * 80, "Yazar": None, "Konusu": "x" * 500, "row_id": 123456},
+            {"Kitap Adı": "", "Yazar": "Y", "Konusu": float("nan"), "row_id": 7},
+            {"Kitap Adı": "Kısa", "Konusu": "x" * 90, "row_id": 8},
+        ])
+        genislikler = handler._sutun_genislikleri(df)
+        sutunlar = list(df.columns)
+        self.assertEqual(genislikler[sutunlar.index("Kitap Adı")], 52)  # 50'de kırpılır
+        self.assertEqual(genislikler[sutunlar.index("Yazar")], 12)
+        self.assertEqual(genislikler[sutunlar.index("Konusu")], 70)
+        self.assertEqual(genislikler[sutunlar.index("row_id")], 12)
+        self.assertEqual(handler._satir_yukseklikleri(df, 70), [75, 27, 39])
+
+
+class TestYearNormalization(unittest.TestCase):
+    """_yil_sutunlarini_formatla: single years -> int, everything else text"""
+
+    def test_rules(self):
+        import pandas as pd
+        degerler = [1869, 1869.0, "1869", " 1869.7 ", "1865-1869", "-500", 500, 3001,
+                    "", None, float("nan"), "MÖ 400", "1e3", "inf"]
+        beklenen = [1869, 1869, 1869, 1869, "1865-1869", "-500", "500", "3001",
+                    "", "", "", "MÖ 400", 1000, "inf"]
+        df = pd.DataFrame({"İlk Yayınlanma Tarihi": degerler, "Anlatı Yılı": list(reversed(degerler))})
+        df = ExcelHandler(os.path.join(tempfile.gettempdir(), "x.xlsx"))._yil_sutunlarini_formatla(df)
+        self.assertEqual(df["İlk Yayınlanma Tarihi"].tolist(), beklenen)
+        self.assertEqual(df["Anlatı Yılı"].tolist(), list(reversed(beklenen)))
+        self.assertTrue(all(type(v) is int for v in df["İlk Yayınlanma Tarihi"][:4]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Unit tests for lazy_import.py and the startup import footprint
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from lazy_import import is_available, lazy_module
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLazyImport(unittest.TestCase):
+    """Deferred loading and the no-heavy-imports-at-startup guarantee"""
+
+    def test_loads_on_first_attribute(self):
+        modul = lazy_module("json")
+        self.assertIn("yüklenmedi", repr(modul))
+        self.assertEqual(modul.dumps([1]), "[1]")
+        self.assertIn("yüklü", repr(modul))
+
+    def test_is_available(self):
+        self.assertTrue(is_available("json"))
+        self.assertFalse(is_available("boyle_bir_paket_yok"))
+
+    def test_gui_import_skips_heavy_packages(self):
+        kod = ("import sys; sys.path.insert(0, 'modules'); import kitap_listesi_gui, kitap_listesi_cli; "
+               "print(' '.join(m for m in ('pandas', 'numpy', 'openpyxl', 'requests', 'bs4') "
+               "if m in sys.modules))")
+        sonuc = subprocess.run([sys.executable, "-c", kod], cwd=KOK, capture_output=True, text=True)
+        self.assertEqual(sonuc.returncode, 0, sonuc.stderr)
+        self.assertEqual(sonuc.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+Unit tests for list_manager.py row identifiers.
+"""
+
+import unittest
+from list_manager import ListManager
+from field_registry import ROW_ID_COLUMN, parse_row_id
+
+
+class TestRowIds(unittest.TestCase):
+    """Test persistent row_id handling"""
+
+    def test_parse_row_id(self):
+        self.assertEqual(parse_row_id(3), 3)
+        self.assertEqual(parse_row_id(3.0), 3)
+        self.assertEqual(parse_row_id("7"), 7)
+        self.assertIsNone(parse_row_id(""))
+        self.assertIsNone(parse_row_id(float("nan")))
+        self.assertIsNone(parse_row_id("abc"))
+
+    def test_loaded_ids_kept_and_missing_assigned(self):
+        manager = ListManager([
+            {"Kitap Adı": "A", "Yazar": "x", ROW_ID_COLUMN: 5.0},
+            {"Kitap Adı": "B", "Yazar": "y", ROW_ID_COLUMN: ""},
+            {"Kitap Adı": "C", "Yazar": "z", ROW_ID_COLUMN: 5},  # tekrar eden id
+        ])
+        ids = [k[ROW_ID_COLUMN] for k in manager.tumunu_getir()]
+        self.assertEqual(ids[0], 5)
+        self.assertEqual(len(set(ids)), 3)
+        self.assertTrue(all(i > 5 for i in ids[1:]))
+
+    def test_ids_survive_deletion(self):
+        manager = ListManager()
+        manager.toplu_ekle([
+            {"Kitap Adı": "A", "Yazar": "x"},
+            {"Kitap Adı": "B", "Yazar": "y"},
+            {"Kitap Adı": "C", "Yazar": "z"},
+        ])
+        kimlik_c = manager.getir(2)[ROW_ID_COLUMN]
+        manager.sil(0)
+        self.assertEqual(manager.konum(kimlik_c), 1)
+        self.assertEqual(manager.getir_kimlik(kimlik_c)["Kitap Adı"], "C")
+
+    def test_update_by_id_keeps_id(self):
+        manager = ListManager([{"Kitap Adı": "A", "Yazar": "x"}])
+        kimlik = manager.getir(0)[ROW_ID_COLUMN]
+        self.assertTrue(manager.guncelle_kimlik(kimlik, {"Kitap Adı": "A2", "Yazar": "x", ROW_ID_COLUMN: ""}))
+        self.assertEqual(manager.getir(0)[ROW_ID_COLUMN], kimlik)
+        self.assertEqual(manager.getir_kimlik(kimlik)["Kitap Adı"], "A2")
+
+    def test_bulk_delete_by_id(self):
+        manager = ListManager([{"Kitap Adı": n, "Yazar": "x"} for n in "ABCD"])
+        ids = [k[ROW_ID_COLUMN] for k in manager.tumunu_getir()]
+        silinen = manager.toplu_sil_kimlik([ids[3], ids[1]])
+        self.assertEqual([k["Kitap Adı"] for k in silinen], ["B", "D"])
+        self.assertEqual([k["Kitap Adı"] for k in manager.tumunu_getir()], ["A", "C"])
+        self.assertEqual(manager.konum(ids[2]), 1)
+
+
+class TestSnapshots(unittest.TestCase):
+    """Test copy-on-write snapshots and locking"""
+
+    def test_snapshot_unaffected_by_writes(self):
+        manager = ListManager([{"Kitap Adı": n, "Yazar": "x"} for n in "ABC"])
+        goruntu = manager.anlik_goruntu()
+        manager.ekle({"Kitap Adı": "D", "Yazar": "x"})
+        manager.sil(0)
+        manager.guncelle(0, {"Kitap Adı": "B2", "Yazar": "x"})
+        self.assertEqual([k["Kitap Adı"] for k in goruntu], ["A", "B", "C"])
+        self.assertEqual([k["Kitap Adı"] for k in manager.anlik_goruntu()], ["B2", "C", "D"])
+
+    def test_snapshot_reused_until_write(self):
+        manager = ListManager([{"Kitap Adı": "A", "Yazar": "x"}])
+        ilk = manager.anlik_goruntu()
+        self.assertIs(manager.anlik_goruntu(), ilk)
+        manager.ekle({"Kitap Adı": "B", "Yazar": "x"})
+        self.assertGreater(manager.anlik_goruntu().surum, ilk.surum)
+        self.assertEqual(len(ilk), 1)
+
+    def test_update_after_snapshot_does_not_copy_list(self):
+        manager = ListManager([{"Kitap Adı": n, "Yazar": "x"} for n in "ABC"])
+        liste = manager._kitap_listesi
+        for harf in "BC":
+            goruntu = manager.anlik_goruntu()
+            kimlik = goruntu[1][ROW_ID_COLUMN]
+            manager.guncelle_kimlik(kimlik, {"Kitap Adı": harf + "2", "Yazar": "x"})
+            manager.ekle({"Kitap Adı": harf + "3", "Yazar": "x"})
+        self.assertIs(manager._kitap_listesi, liste)
+        # Son görüntü güncelleme ve eklemeden önceki hali görür (indeks, dilim, iterasyon)
+        self.assertEqual(goruntu[1]["Kitap Adı"], "B2")
+        self.assertEqual([k["Kitap Adı"] for k in goruntu], ["A", "B2", "C", "B3"])
+        self.assertEqual([k["Kitap Adı"] for k in goruntu[-2:]], ["C", "B3"])
+        self.assertEqual(manager.sayi(), 5)
+
+    def test_concurrent_writers(self):
+        import threading
+        manager = ListManager()
+
+        def yaz(harf):
+            for i in range(200):
+                manager.ekle({"Kitap Adı": f"{harf}{i}", "Yazar": "x"})
+                manager.anlik_goruntu()
+
+        threadler = [threading.Thread(target=yaz, args=(h,)) for h in "ABCD"]
+        for t in threadler:
+            t.start()
+        for t in threadler:
+            t.join()
+        ids = [k[ROW_ID_COLUMN] for k in manager.anlik_goruntu()]
+        self.assertEqual(len(ids), 800)
+        self.assertEqual(len(set(ids)), 800)
+
+
+
+class TestNearDuplicates(unittest.TestCase):
+    """Test near-duplicate lookup against the existing list"""
+
+    def test_imported_rows_excluded_by_id_not_position(self):
+        manager = ListManager([{"Kitap Adı": "Suç ve Ceza", "Yazar": "Dostoyevski"}])
+        eklenen = manager.toplu_ekle([{"Kitap Adı": "Suç ve Ceza (Ciltli)", "Yazar": "Dostoevsky"}])["eklenen"]
+        # İçe aktarmadan sonra başka bir satır eklenir - yeni satır artık sonda değil
+        manager.ekle({"Kitap Adı": "Anna Karenina", "Yazar": "Tolstoy"})
+
+        rapor = manager.yakin_tekrarlari_bul(eklenen, haric={k[ROW_ID_COLUMN] for k in eklenen})
+        self.assertEqual(len(rapor), 1)
+        self.assertEqual(sorted(rapor[0]["labels"]),
+                         ["Suç ve Ceza (Ciltli) - Dostoevsky", "Suç ve Ceza - Dostoyevski"])
+
+
+if __name__ == "__main__":
+    unittest.main()
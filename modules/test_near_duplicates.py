@@ -0,0 +1,78 @@
+"""
+Unit tests for near_duplicates.py
+"""
+
+import unittest
+from near_duplicates import (
+    normalize_title,
+    normalize_author,
+    NearDuplicateDetector,
+    find_near_duplicates,
+    redundant_incoming,
+)
+
+
+class TestNormalization(unittest.TestCase):
+    """Test title/author normalization"""
+
+    def test_edition_noise_removed(self):
+        self.assertEqual(normalize_title("Suç ve Ceza (Ciltli)"), normalize_title("Suç ve Ceza"))
+        self.assertEqual(normalize_title("Suç ve Ceza - Karton Kapak"), "suc ve ceza")
+        self.assertEqual(normalize_title("Suç ve Ceza: Cep Boy, 2. Baskı"), "suc ve ceza")
+
+    def test_edition_words_inside_title_kept(self):
+        self.assertEqual(normalize_title("Yeni Hayat"), "yeni hayat")
+        self.assertEqual(normalize_title("Tam Metin - Ciltli"), "tam metin")
+        self.assertEqual(normalize_title("Kara Kitap - 2"), "kara kitap 2")
+
+    def test_transliteration_variants(self):
+        self.assertEqual(normalize_author("Dostoyevski"), normalize_author("Dostoevsky"))
+        self.assertEqual(normalize_author("Tolstoy"), normalize_author("Tolstoi"))
+
+
+class TestDetector(unittest.TestCase):
+    """Test MinHash/LSH clustering"""
+
+    def test_near_duplicates_clustered(self):
+        detector = NearDuplicateDetector()
+        detector.add("a", "Suç ve Ceza", "Dostoyevski")
+        detector.add("b", "Suç ve Ceza (Ciltli)", "Fyodor Dostoevsky")
+        detector.add("c", "Anna Karenina", "Tolstoy")
+        clusters = detector.clusters()
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(sorted(detector._keys[i] for i in clusters[0]), ["a", "b"])
+
+    def test_same_author_different_book_not_clustered(self):
+        detector = NearDuplicateDetector()
+        detector.add(1, "Savaş ve Barış", "Lev Tolstoy")
+        detector.add(2, "Anna Karenina", "Lev Tolstoy")
+        self.assertEqual(detector.clusters(), [])
+
+    def test_titles_differing_by_edition_word_not_clustered(self):
+        detector = NearDuplicateDetector()
+        detector.add(1, "Yeni Hayat", "Sait Faik")
+        detector.add(2, "Özel Hayat", "Sait Faik")
+        self.assertEqual(detector.clusters(), [])
+
+
+class TestReport(unittest.TestCase):
+    """Test import report helpers"""
+
+    def test_report_only_includes_incoming(self):
+        existing = [
+            {"Kitap Adı": "Suç ve Ceza", "Yazar": "Dostoyevski"},
+            {"Kitap Adı": "Suç ve Ceza", "Yazar": "Dostoyevski"},
+        ]
+        incoming = [
+            {"Kitap Adı": "Suç ve Ceza (Ciltli)", "Yazar": "Dostoevsky"},
+            {"Kitap Adı": "Kürk Mantolu Madonna", "Yazar": "Sabahattin Ali"},
+            {"Kitap Adı": "Kürk Mantolu Madonna (Cep Boy)", "Yazar": "Sabahattin Ali"},
+        ]
+        report = find_near_duplicates(existing, incoming)
+        self.assertEqual(len(report), 2)
+        # Mevcut kümedeki yeni kayıt tümüyle, yeni-yeni kümesinde ilki hariç elenir
+        self.assertEqual(redundant_incoming(report), [0, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for progress_channel.py
+"""
+
+import threading
+import unittest
+from progress_channel import ProgressChannel
+
+
+class TestProgressChannel(unittest.TestCase):
+    """Coalesced state, bulk rows and tick scheduling"""
+
+    def setUp(self):
+        self.zamanlananlar = []
+        self.uygulananlar = []
+        self.kanal = ProgressChannel()
+        self.kanal.attach(lambda ms, fn: self.zamanlananlar.append((ms, fn)),
+                          lambda durum, satirlar: self.uygulananlar.append((durum, satirlar)),
+                          interval_ms=50)
+
+    def _tick(self):
+        _, fn = self.zamanlananlar.pop(0)
+        fn()
+
+    def test_state_coalesced_rows_kept(self):
+        for i in range(1000):
+            self.kanal.post_state("mesaj", i)
+            self.kanal.post_rows([i])
+        self._tick()
+        self.assertEqual(self.uygulananlar, [({"mesaj": 999}, list(range(1000)))])
+        # Bir sonraki tick planlandı; boş kanal handler'ı çağırmaz
+        self.assertEqual(self.zamanlananlar[0][0], 50)
+        self._tick()
+        self.assertEqual(len(self.uygulananlar), 1)
+
+    def test_ids_merged_per_tick(self):
+        for i in range(100):
+            self.kanal.post_ids("guncellenen", [i % 10])
+        self._tick()
+        self.assertEqual(self.uygulananlar, [({"guncellenen": set(range(10))}, [])])
+        self.kanal.post_ids("guncellenen", [42])
+        self._tick()
+        self.assertEqual(self.uygulananlar[1][0], {"guncellenen": {42}})
+
+    def test_events_run_after_pending_progress(self):
+        sira = []
+        self.kanal.post_state("mesaj", "son")
+        self.kanal.post_event(lambda: sira.append(len(self.uygulananlar)))
+        self._tick()
+        self.assertEqual(sira, [1])
+
+    def test_concurrent_posts(self):
+        def isci(n):
+            for i in range(500):
+                self.kanal.post_rows([(n, i)])
+        threadler = [threading.Thread(target=isci, args=(n,)) for n in range(4)]
+        for t in threadler:
+            t.start()
+        for t in threadler:
+            t.join()
+        self._tick()
+        self.assertEqual(len(self.uygulananlar[0][1]), 2000)
+
+    def test_detach_stops_ticking(self):
+        self.kanal.detach()
+        self._tick()
+        self.assertEqual(self.zamanlananlar, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -225,6 +225,57 @@ class TestRouterIntegration(unittest.TestCase):
         state = router._state("test")
         self.assertFalse(state.available())
 
+    def test_status_code_is_per_thread(self):
+        """Concurrent provider calls on a shared cekici each see their own HTTP status"""
+        import threading
+        kodlar = [200, 429, 401, 200, 503, 200, 403, 200]
+        engel = threading.Barrier(len(kodlar))
+
+        def sahte_groq(kod):
+            self.cekici._last_status_code = kod
+            engel.wait(timeout=5)  # Hepsi kodunu yazdıktan sonra okunur
+            return {"kod": kod}
+
+        sonuclar = {}
+
+        def calistir(kod):
+            sonuclar[kod, threading.get_ident()] = self.cekici._durum_kodlu(sahte_groq, kod)
+
+        threadler = [threading.Thread(target=calistir, args=(kod,)) for kod in kodlar]
+        for t in threadler:
+            t.start()
+        for t in threadler:
+            t.join(timeout=5)
+        self.assertEqual(len(sonuclar), len(kodlar))
+        for (kod, _), (sonuc, durum) in sonuclar.items():
+            self.assertEqual((sonuc["kod"], durum), (kod, kod))
+
+    def test_concurrent_router_calls(self):
+        """Router keeps per-provider state consistent under concurrent calls"""
+        import threading
+        from router import QuotaRouter
+
+        router = QuotaRouter()
+        engel = threading.Barrier(6)
+        sonuclar = []
+
+        def cagri(ad, kod):
+            def fn():
+                engel.wait(timeout=5)
+                return {"ad": ad}, kod
+            sonuclar.append(router.call(ad, fn))
+
+        isler = [("ok", 200), ("ok", 200), ("yavas", 429), ("ok", 200), ("yetkisiz", 401), ("ok", 200)]
+        threadler = [threading.Thread(target=cagri, args=is_) for is_ in isler]
+        for t in threadler:
+            t.start()
+        for t in threadler:
+            t.join(timeout=5)
+        self.assertEqual(sorted(s["ad"] for s in sonuclar if s), ["ok"] * 4)
+        self.assertTrue(router._state("ok").available())
+        self.assertFalse(router._state("yavas").available())
+        self.assertTrue(router._state("yetkisiz").dead)
+
 
 class TestFieldPolicyIntegration(unittest.TestCase):
     """Test field policy integration"""
@@ -0,0 +1,83 @@
+"""
+Unit tests for save_queue.py
+"""
+
+import threading
+import time
+import unittest
+from save_queue import SaveQueue
+
+
+class TestSaveQueue(unittest.TestCase):
+    """Coalescing, callbacks and shutdown"""
+
+    def setUp(self):
+        self.yazmalar = []
+        self.sonuclar = []
+        self.kilit = threading.Lock()
+
+    def _kaydet(self):
+        with self.kilit:
+            self.yazmalar.append(time.monotonic())
+            return len(self.yazmalar)
+
+    def test_burst_coalesced_into_one_write(self):
+        kuyruk = SaveQueue(self._kaydet, debounce=0.05)
+        for _ in range(20):
+            kuyruk.request(self.sonuclar.append)
+        self.assertTrue(kuyruk.wait_idle(timeout=5))
+        self.assertEqual(len(self.yazmalar), 1)
+        self.assertEqual(self.sonuclar, [1] * 20)
+        kuyruk.close()
+
+    def test_immediate_skips_debounce(self):
+        kuyruk = SaveQueue(self._kaydet, debounce=10)
+        baslangic = time.monotonic()
+        kuyruk.request(self.sonuclar.append, immediate=True)
+        self.assertTrue(kuyruk.wait_idle(timeout=5))
+        self.assertLess(self.yazmalar[0] - baslangic, 5)
+        kuyruk.close()
+
+    def test_failure_reported_as_none(self):
+        def bozuk():
+            raise PermissionError("açık")
+        kuyruk = SaveQueue(bozuk, debounce=0)
+        kuyruk.request(self.sonuclar.append)
+        kuyruk.wait_idle(timeout=5)
+        self.assertEqual(self.sonuclar, [None])
+        kuyruk.close()
+
+    def test_close_flushes_pending_request(self):
+        bildirimler = []
+        kuyruk = SaveQueue(self._kaydet, notify=bildirimler.append, debounce=60)
+        kuyruk.request(self.sonuclar.append)
+        self.assertTrue(kuyruk.close(timeout=5))
+        self.assertEqual(len(self.yazmalar), 1)
+        # Kapanıştan sonra biten yazmanın callback'i zamanlanmaz (pencere gitmiş olabilir)
+        self.assertEqual((bildirimler, self.sonuclar), ([], []))
+        with self.assertRaises(RuntimeError):
+            kuyruk.request()
+
+    def test_notify_from_worker(self):
+        # Callback notify ile zamanlanır (GUI'de ilerleme kanalı), worker'da çalıştırılmaz
+        bildirimler = []
+        kuyruk = SaveQueue(self._kaydet, notify=bildirimler.append, debounce=0)
+        kuyruk.request(self.sonuclar.append)
+        self.assertTrue(kuyruk.wait_idle(timeout=5))
+        self.assertEqual(self.sonuclar, [])
+        bildirimler[0]()
+        self.assertEqual(self.sonuclar, [1])
+        kuyruk.close()
+
+    def test_close_can_be_polled(self):
+        serbest = threading.Event()
+        kuyruk = SaveQueue(lambda: serbest.wait(5), debounce=0)
+        kuyruk.request(immediate=True)
+        time.sleep(0.05)
+        self.assertFalse(kuyruk.close(timeout=0))
+        serbest.set()
+        self.assertTrue(kuyruk.close(timeout=5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for search_index.py and ListManager search.
+"""
+
+import unittest
+from search_index import SearchIndex, fold_tr, tokenize
+from list_manager import ListManager
+
+
+class TestTurkishFolding(unittest.TestCase):
+    """Test fold_tr and tokenize"""
+
+    def test_dotted_and_dotless_i(self):
+        self.assertEqual(fold_tr("İstanbul"), "istanbul")
+        self.assertEqual(fold_tr("ISPARTA"), "isparta")
+        self.assertEqual(fold_tr("ılık"), "ilik")
+
+    def test_diacritics(self):
+        self.assertEqual(fold_tr("Savaş ve Barış"), "savas ve baris")
+        self.assertEqual(fold_tr("Çağ Üzgün Öykü"), "cag uzgun oyku")
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Suç ve Ceza (Ciltli)"), ["suc", "ve", "ceza", "ciltli"])
+        self.assertEqual(tokenize(""), [])
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test SearchIndex maintenance and queries"""
+
+    def setUp(self):
+        self.index = SearchIndex()
+        self.index.add(1, {"Kitap Adı": "Savaş ve Barış", "Yazar": "Lev Tolstoy", "Tür": "Roman"})
+        self.index.add(2, {"Kitap Adı": "Suç ve Ceza", "Yazar": "Fyodor Dostoyevski", "Tür": "Roman"})
+        self.index.add(3, {"Kitap Adı": "Kürk Mantolu Madonna", "Yazar": "Sabahattin Ali",
+                           "Ülke/Edebi Gelenek": "Türk"})
+
+    def test_substring(self):
+        self.assertEqual(self.index.search("barış"), {1})
+        self.assertEqual(self.index.search("STOY"), {1, 2})
+        self.assertEqual(self.index.search("kurk"), {3})
+
+    def test_prefix(self):
+        self.assertEqual(self.index.search("tol", mode="prefix"), {1})
+        self.assertEqual(self.index.search("ostoy", mode="prefix"), set())
+
+    def test_exact(self):
+        self.assertEqual(self.index.search("ceza", mode="exact"), {2})
+        self.assertEqual(self.index.search("cez", mode="exact"), set())
+
+    def test_multi_term_and(self):
+        self.assertEqual(self.index.search("roman tolstoy"), {1})
+        self.assertEqual(self.index.search("roman sabahattin"), set())
+
+    def test_field_restricted(self):
+        self.assertEqual(self.index.search("roman", fields=["Kitap Adı"]), set())
+        self.assertEqual(self.index.search_fields({"Tür": "roman", "Yazar": "dosto"}), {2})
+
+    def test_update_and_remove(self):
+        self.index.update(2, {"Kitap Adı": "Karamazov Kardeşler", "Yazar": "Fyodor Dostoyevski"})
+        self.assertEqual(self.index.search("ceza"), set())
+        self.assertEqual(self.index.search("karamazov"), {2})
+        self.index.remove(2)
+        self.assertEqual(self.index.search("dostoyevski"), set())
+        self.assertEqual(len(self.index), 2)
+
+
+class TestListManagerSearch(unittest.TestCase):
+    """Test ListManager.ara on top of the index"""
+
+    def setUp(self):
+        self.manager = ListManager([
+            {"Kitap Adı": "Savaş ve Barış", "Yazar": "Lev Tolstoy"},
+            {"Kitap Adı": "Anna Karenina", "Yazar": "Lev Tolstoy"},
+        ])
+
+    def test_results_in_list_order(self):
+        sonuc = self.manager.ara("tolstoy")
+        self.assertEqual([k["Kitap Adı"] for k in sonuc], ["Savaş ve Barış", "Anna Karenina"])
+
+    def test_empty_query_returns_all(self):
+        self.assertEqual(len(self.manager.ara("")), 2)
+
+    def test_index_follows_mutations(self):
+        self.manager.ara("x")  # indeksi kur
+        self.manager.ekle({"Kitap Adı": "İnce Memed", "Yazar": "Yaşar Kemal"})
+        self.assertEqual(len(self.manager.ara("ince")), 1)
+        self.manager.sil(0)
+        self.assertEqual(len(self.manager.ara("barış")), 0)
+        self.manager.guncelle(0, {"Kitap Adı": "Diriliş", "Yazar": "Lev Tolstoy"})
+        self.assertEqual(len(self.manager.ara("karenina")), 0)
+        self.assertEqual(len(self.manager.ara("diriliş")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
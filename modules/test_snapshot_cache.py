@@ -0,0 +1,77 @@
+"""
+Unit tests for snapshot_cache.py and the ExcelHandler startup snapshot.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from snapshot_cache import SnapshotCache
+from excel_handler import ExcelHandler
+
+
+class TestSnapshotCache(unittest.TestCase):
+    """Key = path, mtime, size and content hash"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.excel = os.path.join(self.klasor, "Kutuphanem.xlsx")
+        with open(self.excel, "wb") as f:
+            f.write(b"xlsx")
+        self.onbellek = SnapshotCache.for_excel(self.excel)
+        self.onbellek.save(self.excel, [{"Kitap Adı": "A", "row_id": 1}])
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_path_next_to_excel(self):
+        self.assertEqual(os.path.basename(self.onbellek.path), "Kutuphanem.snapshot.pickle")
+
+    def test_hit(self):
+        self.assertEqual(self.onbellek.load(self.excel), [{"Kitap Adı": "A", "row_id": 1}])
+
+    def test_changed_excel_invalidates(self):
+        stat = os.stat(self.excel)
+        with open(self.excel, "wb") as f:
+            f.write(b"XLSX")
+        # Aynı boyut ve mtime: içerik özeti yakalar
+        os.utime(self.excel, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertIsNone(self.onbellek.load(self.excel))
+
+    def test_corrupt_or_missing(self):
+        with open(self.onbellek.path, "wb") as f:
+            f.write(b"\x80bozuk")
+        self.assertIsNone(self.onbellek.load(self.excel))
+        self.onbellek.clear()
+        self.assertIsNone(self.onbellek.load(self.excel))
+
+
+class TestStartupSnapshot(unittest.TestCase):
+    """ExcelHandler.yukle reads the snapshot while the xlsx is unchanged"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.handler = ExcelHandler(os.path.join(self.klasor, "Kutuphanem.xlsx"))
+        self.handler.kaydet([
+            {"Kitap Adı": 1984, "Yazar": "George Orwell", "İlk Yayınlanma Tarihi": "1949", "row_id": 1},
+            {"Kitap Adı": "Suç ve Ceza", "Yazar": "Dostoyevski", "Tür": None, "row_id": 2},
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.klasor)
+
+    def test_snapshot_matches_excel(self):
+        onbellekten = ExcelHandler(self.handler.excel_dosyasi).yukle()
+        self.handler.acilis_onbellegi.clear()
+        excelden = ExcelHandler(self.handler.excel_dosyasi).yukle()
+        self.assertEqual(onbellekten, excelden)
+        self.assertTrue(os.path.exists(self.handler.acilis_onbellegi.path))
+
+    def test_workbook_not_parsed_on_hit(self):
+        handler = ExcelHandler(self.handler.excel_dosyasi)
+        handler._tablo_oku = None  # Çağrılırsa TypeError -> yukle [] döner
+        self.assertEqual(len(handler.yukle()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Unit tests for sqlite_store.py
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from sqlite_store import SQLiteStore
+from provenance import set_field, set_row_status
+from list_manager import ListManager
+from field_registry import ensure_row_schema
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """Round trip, incremental apply and indexed lookups"""
+
+    def setUp(self):
+        self.klasor = tempfile.mkdtemp()
+        self.depo = SQLiteStore(os.path.join(self.klasor, "Kutuphanem.sqlite"))
+        manager = ListManager([
+            {"Kitap Adı": "Savaş ve Barış", "Yazar": "Lev Tolstoy", "İlk Yayınlanma Tarihi": 1869,
+             "Anlatı Yılı": "1805-1812", "Not": "imzalı"},
+            {"Kitap Adı": "Suç ve Ceza", "Yazar": "Dostoyevski"},
+            {"Kitap Adı": "İnce Memed", "Yazar": "Yaşar Kemal"},
+        ])
+        self.satirlar = [ensure_row_schema(k) for k in manager.anlik_goruntu()]
+        set_field(self.satirlar[1], "Tür", "Roman", "groq", 0.8)
+        set_row_status(self.satirlar[1], "OK", [], best_source="groq")
+        self.depo.replace_all(self.satirlar)
+
+    def tearDown(self):
+        self.depo.close()
+        shutil.rmtree(self.klasor)
+
+    def test_wal_mode(self):
+        self.assertEqual(self.depo._conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_round_trip(self):
+        self.assertEqual(self.depo.load_all(), self.satirlar)
+
+    def test_apply_keeps_order(self):
+        guncel = dict(self.satirlar[0], Tür="Roman")
+        yeni = {"Kitap Adı": "Kürk Mantolu Madonna", "Yazar": "Sabahattin Ali", "row_id": 10}
+        self.assertEqual(self.depo.apply([guncel, yeni], [self.satirlar[1]["row_id"]]), 3)
+        yuklenen = self.depo.load_all()
+        self.assertEqual([k["Kitap Adı"] for k in yuklenen],
+                         ["Savaş ve Barış", "İnce Memed", "Kürk Mantolu Madonna"])
+        self.assertEqual(yuklenen[0]["Tür"], "Roman")
+
+    def test_find(self):
+        ids = [k["row_id"] for k in self.satirlar]
+        self.assertEqual(self.depo.find(title="ince"), [ids[2]])
+        self.assertEqual(self.depo.find(author="LEV"), [ids[0]])
+        self.assertEqual(self.depo.find(status="OK"), [ids[1]])
+        self.assertEqual(self.depo.find(title="suc", status="FAIL"), [])
+
+    def test_reopen(self):
+        self.depo.close()
+        self.depo = SQLiteStore.for_excel(os.path.join(self.klasor, "Kutuphanem.xlsx"))
+        self.assertIsNotNone(self.depo)
+        self.assertEqual(self.depo.count(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Unit tests for virtual_list.py
+"""
+
+import unittest
+from list_manager import ListManager
+from virtual_list import VirtualRows
+
+
+class TestVirtualRows(unittest.TestCase):
+    """Identity-based sync and row-id diff operations"""
+
+    def setUp(self):
+        self.manager = ListManager([{"Kitap Adı": n, "Yazar": "x"} for n in "ABCDE"])
+        self.model = VirtualRows()
+        self.ilk = self.model.sync(self.manager.anlik_goruntu())
+
+    def _kimlik(self, ad):
+        return next(k["row_id"] for k in self.manager.anlik_goruntu() if k["Kitap Adı"] == ad)
+
+    def test_sync_reports_only_changes(self):
+        self.assertEqual(len(self.ilk), 5)
+        self.assertEqual(self.model.sync(self.manager.anlik_goruntu()), set())
+
+        a, c = self._kimlik("A"), self._kimlik("C")
+        self.manager.guncelle_kimlik(c, {"Kitap Adı": "C2", "Yazar": "x"})
+        self.manager.sil_kimlik(a)
+        self.manager.ekle({"Kitap Adı": "F", "Yazar": "x"})
+        degisen = self.model.sync(self.manager.anlik_goruntu())
+        self.assertEqual(degisen, {a, c, self._kimlik("F")})
+        self.assertEqual([self.model.row(k)["Kitap Adı"] for k in self.model.window(0, 10)],
+                         ["B", "C2", "D", "E", "F"])
+
+    def test_insert_update_delete(self):
+        eklenen = self.manager.toplu_ekle([{"Kitap Adı": "F", "Yazar": "x"}])['eklenen']
+        self.assertEqual(self.model.insert(eklenen), {eklenen[0]["row_id"]})
+        self.assertEqual(self.model.index_of(eklenen[0]["row_id"]), 5)
+
+        b = self._kimlik("B")
+        self.assertEqual(self.model.update([{"Kitap Adı": "B2", "Yazar": "x", "row_id": b},
+                                            {"Kitap Adı": "?", "Yazar": "x", "row_id": 999}]), {b})
+        self.assertEqual(self.model.row(b)["Kitap Adı"], "B2")
+
+        self.assertEqual(self.model.delete([b, 999]), {b})
+        self.assertEqual(len(self.model), 5)
+        self.assertIsNone(self.model.index_of(b))
+        self.assertEqual(self.model.index_of(eklenen[0]["row_id"]), 4)
+        self.assertEqual(self.model.window(3, 10), [self._kimlik("E"), eklenen[0]["row_id"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
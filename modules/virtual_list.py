@@ -0,0 +1,96 @@
+"""
+View model behind the virtualized book list.
+The Treeview only holds the rows currently on screen; this model keeps the full
+row order and the row objects by row_id. ListManager replaces a row object on
+every update (copy-on-write), so syncing against a new snapshot is an identity
+comparison and only the ids that actually changed are reported back.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Set
+
+from field_registry import ROW_ID_COLUMN
+
+
+class VirtualRows:
+    """
+    Sıralı satır kimlikleri + kimlik -> satır (satırın kendisi, kopya değil)
+
+    ⚠️ DİKKAT: Görünen değerler satırdan çizim anında okunur - model değer tuple'ı tutmaz
+    """
+
+    def __init__(self):
+        self._ids: List[Hashable] = []
+        self._rows: Dict[Hashable, Mapping] = {}
+        self._positions: Optional[Dict[Hashable, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, row_id) -> bool:
+        return row_id in self._rows
+
+    def ids(self) -> List[Hashable]:
+        """Tüm kimlikler (görünüm sırasıyla)"""
+        return self._ids
+
+    def row(self, row_id) -> Optional[Mapping]:
+        return self._rows.get(row_id)
+
+    def index_of(self, row_id) -> Optional[int]:
+        """Kimliğin görünümdeki sırası (ilk çağrıda harita kurulur, silmede düşer)"""
+        if self._positions is None:
+            self._positions = {k: i for i, k in enumerate(self._ids)}
+        return self._positions.get(row_id)
+
+    def window(self, first: int, count: int) -> List[Hashable]:
+        """Ekranda görünecek kimlikler"""
+        return self._ids[first:first + count]
+
+    def sync(self, rows: Sequence[Mapping]) -> Set[Hashable]:
+        """
+        Modeli listenin yeni anlık görüntüsüne eşitler
+
+        Returns:
+            Eklenen, değişen (farklı nesne) veya silinen kimlikler
+        """
+        old = self._rows
+        new = {row[ROW_ID_COLUMN]: row for row in rows}
+        changed = {k for k, row in new.items() if old.get(k) is not row}
+        changed.update(k for k in old if k not in new)
+        ids = list(new)
+        if changed or ids != self._ids:
+            self._ids = ids
+            self._positions = None
+        self._rows = new
+        return changed
+
+    def insert(self, rows: Iterable[Mapping]) -> Set[Hashable]:
+        """Satırları sona ekler (kimliği zaten olanlar güncellenir)"""
+        changed = set()
+        for row in rows:
+            row_id = row[ROW_ID_COLUMN]
+            if row_id not in self._rows:
+                if self._positions is not None:
+                    self._positions[row_id] = len(self._ids)
+                self._ids.append(row_id)
+            self._rows[row_id] = row
+            changed.add(row_id)
+        return changed
+
+    def update(self, rows: Iterable[Mapping]) -> Set[Hashable]:
+        """Var olan satırları yerinde değiştirir (bilinmeyen kimlikler atlanır)"""
+        changed = set()
+        for row in rows:
+            row_id = row[ROW_ID_COLUMN]
+            if row_id in self._rows:
+                self._rows[row_id] = row
+                changed.add(row_id)
+        return changed
+
+    def delete(self, row_ids: Iterable[Hashable]) -> Set[Hashable]:
+        """Kimlikleri görünümden çıkarır (sıra korunur)"""
+        gone = {k for k in row_ids if self._rows.pop(k, None) is not None}
+        if gone:
+            self._ids = [k for k in self._ids if k not in gone]
+            self._positions = None
+        return gone
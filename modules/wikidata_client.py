@@ -5,9 +5,11 @@ Robust Wikidata client for QID resolution and field extraction.
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 
-import requests
-
 from field_registry import BASE_COLUMNS
+from lazy_import import lazy_module
+
+# Loaded on the first HTTP call, not at import
+requests = lazy_module("requests")
 
 
 FIELD_ORIGINAL_TITLE = BASE_COLUMNS[2]
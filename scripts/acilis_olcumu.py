@@ -0,0 +1,120 @@
+"""
+Açılış Ölçümü
+Programın açılış süresini ölçer ve eşikleri aşınca hata koduyla çıkar (CI / elle kontrol)
+
+- İçe aktarma: `python -X importtime` çıktısından kitap_listesi_gui'nin toplam süresi
+  (birkaç çalıştırmanın medyanı) ve en pahalı modüller
+- Ağır bağımlılıklar: açılışta pandas / numpy / openpyxl / requests / bs4 ... yüklenmemeli
+- İlk pencere: süreç başlangıcından ilk çizilen pencereye kadar geçen süre
+  (ekran yoksa atlanır)
+
+Kullanım:
+    python scripts/acilis_olcumu.py [--tekrar 5] [--import-esik-ms 150] [--pencere-esik-ms 1000]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# İlk kullanımda yüklenmesi gereken paketler (bkz. modules/lazy_import.py)
+AGIR_MODULLER = ("pandas", "numpy", "openpyxl", "pyarrow", "requests", "bs4", "ddgs", "duckduckgo_search")
+
+GUI_IMPORT = "import sys; sys.path.insert(0, 'modules'); import kitap_listesi_gui"
+
+ILK_PENCERE = """
+import sys, tkinter as tk
+sys.path.insert(0, 'modules')
+import kitap_listesi_gui
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print('EKRAN_YOK', flush=True)
+    raise SystemExit
+app = kitap_listesi_gui.KitapListesiGUI(root)
+root.update()
+print('HAZIR', flush=True)
+root.destroy()
+"""
+
+
+def calistir(kod, *secenekler):
+    return subprocess.run([sys.executable, *secenekler, "-c", kod], cwd=KOK,
+                          capture_output=True, text=True, encoding="utf-8", errors="replace")
+
+
+def importtime_oku(stderr):
+    """-X importtime satırları -> [(modül, kendi µs, toplam µs, derinlik)]"""
+    satirlar = []
+    for satir in stderr.splitlines():
+        if not satir.startswith("import time:") or "self [us]" in satir:
+            continue
+        kendi, toplam, ad = satir[len("import time:"):].split("|")
+        derinlik = (len(ad) - len(ad.lstrip())) // 2
+        satirlar.append((ad.strip(), int(kendi), int(toplam), derinlik))
+    return satirlar
+
+
+def import_olc(tekrar):
+    """kitap_listesi_gui içe aktarma süresi (ms, medyan) ve son çalıştırmanın satırları"""
+    sureler, satirlar = [], []
+    for _ in range(tekrar):
+        satirlar = importtime_oku(calistir(GUI_IMPORT, "-X", "importtime").stderr)
+        toplam = next(t for ad, _, t, _ in satirlar if ad == "kitap_listesi_gui")
+        sureler.append(toplam / 1000)
+    return statistics.median(sureler), satirlar
+
+
+def agir_moduller():
+    """Açılışta yüklenen ağır paketler (boş olmalı)"""
+    kod = GUI_IMPORT + f"; print(' '.join(m for m in {AGIR_MODULLER!r} if m in sys.modules))"
+    return calistir(kod).stdout.split()
+
+
+def ilk_pencere_olc():
+    """Süreç başlangıcından ilk pencerenin çizilmesine kadar (ms); ekran yoksa None"""
+    baslangic = time.perf_counter()
+    surec = subprocess.Popen([sys.executable, "-c", ILK_PENCERE], cwd=KOK, stdout=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL, text=True)
+    satir = surec.stdout.readline().strip()
+    sure = (time.perf_counter() - baslangic) * 1000
+    surec.wait()
+    return sure if satir == "HAZIR" else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Açılış süresi ölçümü")
+    parser.add_argument("--tekrar", type=int, default=5)
+    parser.add_argument("--import-esik-ms", type=float, default=150)
+    parser.add_argument("--pencere-esik-ms", type=float, default=1000)
+    args = parser.parse_args()
+    hatalar = []
+
+    import_ms, satirlar = import_olc(args.tekrar)
+    print(f"kitap_listesi_gui içe aktarma: {import_ms:7.1f} ms (medyan, {args.tekrar} çalıştırma)")
+    print("En pahalı modüller (kendi süresi):")
+    for ad, kendi, toplam, _ in sorted(satirlar, key=lambda s: -s[1])[:10]:
+        print(f"  {ad:<40} {kendi / 1000:7.1f} ms  (toplam {toplam / 1000:7.1f} ms)")
+    if import_ms > args.import_esik_ms:
+        hatalar.append(f"içe aktarma {import_ms:.1f} ms > {args.import_esik_ms:.0f} ms")
+
+    yuklenen = agir_moduller()
+    print(f"Açılışta yüklenen ağır paketler: {', '.join(yuklenen) or 'yok'}")
+    if yuklenen:
+        hatalar.append(f"açılışta yüklendi: {', '.join(yuklenen)}")
+
+    pencere_ms = ilk_pencere_olc()
+    if pencere_ms is None:
+        print("İlk pencere: atlandı (ekran yok)")
+    else:
+        print(f"İlk pencere: {pencere_ms:7.1f} ms")
+        if pencere_ms > args.pencere_esik_ms:
+            hatalar.append(f"ilk pencere {pencere_ms:.1f} ms > {args.pencere_esik_ms:.0f} ms")
+
+    for hata in hatalar:
+        print(f"GERİLEME: {hata}")
+    sys.exit(1 if hatalar else 0)
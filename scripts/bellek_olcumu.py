@@ -0,0 +1,59 @@
+"""
+Bellek Ölçümü
+dict satırları ile BookRecord satırlarının bellek kullanımını karşılaştırır
+
+Kullanım:
+    python scripts/bellek_olcumu.py [satir_sayisi]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "modules"))
+
+from book_record import BookRecord
+from field_registry import ensure_row_schema
+from provenance import set_field, set_row_status
+
+
+def ornek_satirlar(sayi):
+    """Zenginleştirilmiş (status + provenance) örnek satırlar üretir"""
+    satirlar = []
+    for i in range(sayi):
+        satir = ensure_row_schema({
+            "Kitap Adı": f"Kitap {i}",
+            "Yazar": f"Yazar {i % 5000}",
+            "row_id": i + 1,
+        })
+        set_field(satir, "Tür", "Roman", "groq", 0.8)
+        set_field(satir, "Ülke/Edebi Gelenek", "Rus", "groq", 0.8)
+        set_field(satir, "İlk Yayınlanma Tarihi", str(1800 + i % 200), "groq", 0.8)
+        set_field(satir, "Konusu", f"Konu özeti {i}", "groq", 0.8)
+        set_row_status(satir, "OK", [], best_source="groq", retry_count=0)
+        satirlar.append(satir)
+    return satirlar
+
+
+def olc(ad, uret):
+    """uret() çağrısının ayırdığı belleği ve süresini ölçer"""
+    tracemalloc.start()
+    baslangic = time.perf_counter()
+    sonuc = uret()
+    sure = time.perf_counter() - baslangic
+    bellek, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{ad:<12} {bellek / 1024 / 1024:8.1f} MB  {sure:6.2f} s")
+    return sonuc, bellek
+
+
+if __name__ == "__main__":
+    sayi = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    satirlar = ornek_satirlar(sayi)
+    print(f"{sayi} zenginleştirilmiş satır")
+
+    # Değerler (string'ler) her iki durumda da paylaşılır; yalnızca kap yükü ölçülür
+    _, dict_bellek = olc("dict", lambda: [dict(s) for s in satirlar])
+    _, kayit_bellek = olc("BookRecord", lambda: [BookRecord(s) for s in satirlar])
+    print(f"Kazanç: %{100 * (1 - kayit_bellek / dict_bellek):.0f}")